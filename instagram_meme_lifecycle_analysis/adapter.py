@@ -0,0 +1,114 @@
+"""
+Instagram 플랫폼 어댑터
+main.py가 하나의 프로세스 안에서 Instagram 파이프라인 단계를 직접 호출하기 위한 진입점
+전처리/분석/시각화는 각 모듈의 함수 API를 직접 호출하고,
+수집 스크립트에는 PlatformAdapter.run()이 설정하는 MEME_NAME 환경 변수로 밈 이름 전달
+"""
+
+import runpy
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BASE_DIR))
+from config.settings import SRC_DIR, set_global_font
+from src.utils.cached_stages import run_cached
+from src.utils.raw_posts import raw_path_for, load_posts
+
+# 수집은 로그인이 필요하므로 기본 단계에서 제외 (pipeline.py와 동일)
+# (Enter 입력 없이 수집하려면 MEME_INSTAGRAM_UNATTENDED=1, 목표 개수는 MEME_INSTAGRAM_TARGET,
+#  링크를 모은 뒤 브라우저 여러 개로 동시에 수집하려면 MEME_INSTAGRAM_MODE=permalinks)
+DEFAULT_STAGES = ["preprocess", "analyze", "visualize"]
+
+ANALYSIS_SCRIPTS = [
+    "analysis/engagement.py",
+    "analysis/keywords.py",
+    "analysis/lifecycle.py",
+]
+DASHBOARD_SCRIPTS = [
+    "visualization/engagement_dashboard.py",
+    "visualization/keywords_dashboard.py",
+    "visualization/lifecycle_dashboard.py",
+]
+
+
+def _run_path(relative_path):
+    """스크립트를 현재 프로세스에서 실행 (함수 API가 없는 수집 스크립트용)"""
+    return runpy.run_path(str(SRC_DIR / relative_path), run_name="__main__")
+
+
+def _stage_functions():
+    """스크립트 경로 → 함수 API (최초 호출 시 import, 이후 재사용)"""
+    from src.preprocessing.instagram import run_preprocessing
+    from src.analysis.engagement import run_engagement_analysis
+    from src.analysis.keywords import run_keyword_analysis
+    from src.analysis.lifecycle import update_lifecycle
+    from src.visualization.engagement_dashboard import render_engagement_dashboard
+    from src.visualization.keywords_dashboard import render_keywords_dashboard
+    from src.visualization.lifecycle_dashboard import render_lifecycle_dashboard
+    return {
+        "preprocessing/instagram.py": run_preprocessing,
+        "analysis/engagement.py": run_engagement_analysis,
+        "analysis/keywords.py": run_keyword_analysis,
+        # 생명주기는 증분 갱신 (재실행 시 새 게시물만 반영, 상태가 없거나 전처리 결과가 새로 만들어지면 전체 분석)
+        "analysis/lifecycle.py": update_lifecycle,
+        "visualization/engagement_dashboard.py": render_engagement_dashboard,
+        "visualization/keywords_dashboard.py": render_keywords_dashboard,
+        "visualization/lifecycle_dashboard.py": render_lifecycle_dashboard,
+    }
+
+
+def _run_script(relative_path, meme_name):
+    """단계 실행 (입력 파일과 코드가 바뀌지 않았으면 캐시된 결과 복원)"""
+    run = _stage_functions()[relative_path]
+    return run_cached(relative_path, meme_name, lambda _: run(meme_name))
+
+
+def warm_up():
+    """상주 분석 서비스용: 시각화 라이브러리와 폰트 미리 로딩"""
+    import matplotlib.pyplot
+    import seaborn
+    import networkx
+    import wordcloud
+    set_global_font()
+    _stage_functions()
+
+
+def collect(meme_name):
+    """Instagram 데이터 수집 (로그인 필요)"""
+    _run_path("data_collection/instagram.py")
+
+
+def preprocess(meme_name):
+    """수집 원본 전처리"""
+    _run_script("preprocessing/instagram.py", meme_name)
+
+
+def analyze(meme_name):
+    """참여도/키워드/생명주기 분석"""
+    for script in ANALYSIS_SCRIPTS:
+        _run_script(script, meme_name)
+
+
+def visualize(meme_name):
+    """분석별 대시보드 생성"""
+    for script in DASHBOARD_SCRIPTS:
+        _run_script(script, meme_name)
+
+
+def posts(meme_name):
+    """통합 결과 저장소용 게시물 (전처리 결과에는 원문 캡션이 없으므로 수집 원본 사용)"""
+    raw_path = raw_path_for(meme_name)
+    if not raw_path.exists():
+        return None
+
+    df = load_posts(raw_path)
+    if df.empty:
+        return None
+
+    df = df.rename(columns={"username": "author", "upload_time": "created_at", "caption": "text"})
+    # Instagram은 좋아요만 수집 (공유/조회수 없음)
+    df["engagement"] = pd.to_numeric(df["likes"], errors="coerce")
+    return df[["created_at", "author", "text", "likes", "engagement"]]
@@ -0,0 +1,99 @@
+"""
+여러 밈의 Instagram 분석 체인을 하나의 프로세스에서 실행
+밈마다 전처리 → 분석(engagement / keywords / lifecycle) → 대시보드를 함수 API로 호출하고
+분석 결과는 CSV를 다시 읽지 않고 메모리의 DataFrame을 그대로 대시보드에 전달
+(전처리 결과는 배치 단위로 기록만 하므로 분석 단계가 전처리 CSV / 토큰 저장소를 읽음)
+
+사용법: python batch.py 밈1 밈2 ... [--skip-visualization]
+"""
+from pathlib import Path
+import argparse, json, sys, time
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BASE_DIR))
+from config.settings import ROOT_DIR
+from src.utils.input_utils import run_state_dir
+from src.preprocessing.instagram import run_preprocessing
+from src.analysis.engagement import run_engagement_analysis
+from src.analysis.keywords import run_keyword_analysis
+from src.analysis.lifecycle import update_lifecycle, load_lifecycle
+from src.visualization.engagement_dashboard import render_engagement_dashboard
+from src.visualization.keywords_dashboard import render_keywords_dashboard
+from src.visualization.lifecycle_dashboard import render_lifecycle_dashboard
+
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+
+
+def run_chain(meme_name, visualize=True):
+    # 밈 하나의 전체 체인 실행 후 단계별 결과 반환
+    run_preprocessing(meme_name)
+
+    likes, weekly, weekday = run_engagement_analysis(meme_name)
+    # 키워드는 전처리가 기록한 토큰 저장소를 memmap으로 읽음
+    keywords = run_keyword_analysis(meme_name)
+    # 생명주기는 이전 실행 이후의 게시물만 반영 (처음이면 전체 분석) → 대시보드에는 저장된 전체 표 전달
+    update_lifecycle(meme_name)
+    daily = load_lifecycle(meme_name)
+
+    figures = []
+    if visualize:
+        figures += render_engagement_dashboard(meme_name, likes, weekly, weekday)
+        figures += render_keywords_dashboard(meme_name, keywords)
+        figures += render_lifecycle_dashboard(meme_name, daily)
+
+    return {
+        "likes": likes,
+        "weekly_likes": weekly,
+        "weekday_likes": weekday,
+        "keywords": keywords,
+        "lifecycle": daily,
+        "figures": figures,
+    }
+
+
+def run_batch(meme_names, visualize=True):
+    # 여러 밈을 차례로 실행 (한 밈이 실패해도 나머지는 계속) 후 밈별 상태/단계 시간 반환
+    report = {}
+    for meme_name in meme_names:
+        print(f"\n▶ #{meme_name}")
+        start_time = time.time()
+        try:
+            run_chain(meme_name, visualize)
+            status, error = "done", None
+        except Exception as e:
+            status, error = "failed", f"{type(e).__name__}: {e}"
+            print(f"오류 발생 (#{meme_name}): {error}")
+
+        report[meme_name] = {
+            "status": status,
+            "wall_time": round(time.time() - start_time, 2),
+            "stages": trace.summarize(trace.drain()).get("instagram", {}),
+        }
+        if error:
+            report[meme_name]["error"] = error
+        print(f"{'완료' if status == 'done' else '실패'}: #{meme_name} ({report[meme_name]['wall_time']:.2f}초)")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="여러 밈의 Instagram 분석을 한 프로세스에서 실행")
+    parser.add_argument("memes", nargs="+", help="분석할 밈 목록")
+    parser.add_argument("--skip-visualization", action="store_true", help="대시보드 생성 생략")
+    args = parser.parse_args()
+
+    meme_names = [meme.lstrip("#") for meme in args.memes]
+    print("=" * 50)
+    print(f"\n일괄 분석 시작: {len(meme_names)}개 밈\n")
+
+    report = run_batch(meme_names, visualize=not args.skip_visualization)
+
+    state_dir = run_state_dir(",".join(meme_names))
+    with open(state_dir / "batch.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    failed = [meme for meme, result in report.items() if result["status"] != "done"]
+    print("=" * 50)
+    print(f"\n일괄 분석 완료: {len(meme_names) - len(failed)}/{len(meme_names)} 성공 (기록: {state_dir / 'batch.json'})\n")
+    print("=" * 50)
+    sys.exit(1 if failed else 0)
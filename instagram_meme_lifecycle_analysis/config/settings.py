@@ -1,9 +1,12 @@
 from pathlib import Path
+from functools import lru_cache
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import platform
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+# 통합 프로젝트 루트 (orchestration 공용 모듈 위치)
+ROOT_DIR = BASE_DIR.parent
 
 # 주요 폴더 경로 설정
 CACHE_DIR = BASE_DIR / "cache"
@@ -11,8 +14,9 @@ DATA_DIR = BASE_DIR / "data"
 RESULTS_DIR = BASE_DIR / "results"
 SRC_DIR = BASE_DIR / "src"
 
-# 공통 한글 폰트 설정
-def set_global_font():
+# 공통 한글 폰트 경로 및 이름 (프로세스당 한 번만 탐색)
+@lru_cache(maxsize=None)
+def resolve_global_font():
     system = platform.system()
     if system == "Darwin":  # macOS
         font_path = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
@@ -22,8 +26,13 @@ def set_global_font():
         font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"  # 예시
 
     font_prop = fm.FontProperties(fname=font_path)
-    plt.rcParams['font.family'] = font_prop.get_name()
-    return font_prop.get_name()
+    return font_path, font_prop.get_name()
+
+# 공통 한글 폰트 설정
+def set_global_font():
+    _, font_name = resolve_global_font()
+    plt.rcParams['font.family'] = font_name
+    return font_name
 
 # 실제로 한 번 설정 적용
 DEFAULT_FONT = set_global_font()
\ No newline at end of file
@@ -1,56 +1,89 @@
 from pathlib import Path
-from src.utils.input_utils import meme_name_from_user
-import subprocess, sys, shutil
+from src.utils.input_utils import meme_name_from_user, run_state_dir
+import argparse, subprocess, sys, os, shutil, json
+from functools import partial
 
 # 설정된 상수 불러오기
 BASE_DIR = Path(__file__).resolve().parent
 sys.path.append(str(BASE_DIR))
-from config.settings import SRC_DIR
+from config.settings import SRC_DIR, ROOT_DIR
+from src.utils.cached_stages import run_cached
 
-def run_script(relative_path):
+sys.path.append(str(ROOT_DIR))
+from orchestration.runs import MEME_ENV, RUN_ID_ENV, run_env, current_run_id
+from orchestration.dag import DagRunner, print_report
+from orchestration.governor import ResourceGovernor, WORKER_THREADS_ENV
+
+# 전처리 결과를 공유하는 분석/대시보드 가지
+BRANCHES = ["engagement", "keywords", "lifecycle"]
+
+# 각 스크립트에 전달할 환경 변수 (밈 이름, 실행 ID)
+_env = None
+
+def _run_script(relative_path):
     script_path = SRC_DIR / relative_path
-    result = subprocess.run([sys.executable, str(script_path)], capture_output=True, text=True)
+    result = subprocess.run([sys.executable, str(script_path)], capture_output=True, text=True, env=_env)
     if result.returncode != 0:
-        print(f"오류 발생: {script_path}")
-        print(result.stderr)
-    else:
-        print(f"완료: {script_path}")
-        print(result.stdout)
+        print(f"오류 발생: {script_path}\n{result.stderr}")
+        return False
+    # 여러 스크립트가 동시에 끝나도 출력이 섞이지 않도록 한 번에 출력
+    print(f"완료: {script_path}\n{result.stdout}")
+    return True
+
+def run_script(relative_path):
+    # 입력 파일과 코드가 바뀌지 않았으면 캐시된 결과 복원
+    return run_cached(relative_path, _env[MEME_ENV], _run_script)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Instagram 밈 생명주기 분석 파이프라인")
+    parser.add_argument("--meme", help="분석할 밈 (없으면 MEME_NAME 환경 변수 또는 이전 설정)")
+    parser.add_argument("--run-id", help="실행 ID (없으면 MEME_RUN_ID 환경 변수 또는 새로 발급)")
+    parser.add_argument("--jobs", type=int, default=len(BRANCHES), help="동시에 실행할 스크립트 수 (기본값: 3)")
+    args, _ = parser.parse_known_args()
+    return args
 
 
 if __name__ == "__main__":
     width = shutil.get_terminal_size().columns
     print("=" * 50)
     print("\n\"밈 생명주기 분석\" 파이프라인 시작")
-    meme_name = meme_name_from_user()
-    print(f"대상 밈: #{meme_name}\n")
+    args = parse_args()
+    meme_name = args.meme.lstrip("#") if args.meme else meme_name_from_user()
+    # 동시에 실행되는 스크립트들이 코어를 나눠 쓰도록 스레드 수 제한
+    # (main.py 워커로 실행된 경우 워커에 배정된 스레드 수가 예산)
+    governor = ResourceGovernor(os.environ.get(WORKER_THREADS_ENV))
+    governor.plan(args.jobs)
+    _env = governor.worker_env(run_env(meme_name, args.run_id or current_run_id()))
+    state_dir = run_state_dir(meme_name, _env[RUN_ID_ENV])
+    print(f"대상 밈: #{meme_name}")
+    print(f"실행 ID: {_env[RUN_ID_ENV]} ({state_dir})\n")
 
     # 1. Instagram 수집 및 전처리
     print("=" * 50)
     print("\n[1] Instagram 수집 (수동 로그인 필요)\n")
     # run_script("data_collection/instagram.py")  # 필요 시 주석 해제
 
-    # 2. Engagement 분석 및 대시보드
+    # 2. 전처리 1회 → 분석 3개 동시 실행 → 각 분석이 끝나는 대로 대시보드 실행
     print("=" * 50)
-    print("\n[2] Engagement 분석 및 대시보드")
-    run_script("preprocessing/instagram.py")
-    run_script("analysis/engagement.py")
-    run_script("visualization/engagement_dashboard.py")
+    print(f"\n[2] 전처리 → 분석(engagement / keywords / lifecycle) → 대시보드 (동시 실행 {args.jobs}개)\n")
+    dag = DagRunner(max_workers=args.jobs)
+    dag.add("preprocessing", lambda: run_script("preprocessing/instagram.py"))
+    for branch in BRANCHES:
+        dag.add(f"analysis:{branch}", partial(run_script, f"analysis/{branch}.py"), deps=["preprocessing"])
+        dag.add(f"visualization:{branch}", partial(run_script, f"visualization/{branch}_dashboard.py"),
+                deps=[f"analysis:{branch}"])
+    report = dag.run()
 
-    # 3. Keyword 분석 및 대시보드
     print("=" * 50)
-    print("\n[3] Keyword 분석 및 대시보드")
-    run_script("preprocessing/instagram.py")
-    run_script("analysis/keywords.py")
-    run_script("visualization/keywords_dashboard.py")
+    print_report(report)
+    with open(state_dir / "dag.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
 
-    # 4. Lifecycle 분석 및 대시보드
+    failed = [name for name, node in report["nodes"].items() if node["status"] != "done"]
     print("=" * 50)
-    print("\n[4] Lifecycle 분석 및 대시보드")
-    run_script("preprocessing/instagram.py")
-    run_script("analysis/lifecycle.py")
-    run_script("visualization/lifecycle_dashboard.py")
-
-    print("=" * 50)
-    print("\n모든 분석 및 시각화 완료\n")
+    if failed:
+        print(f"\n일부 단계 실패: {', '.join(failed)}\n")
+    else:
+        print("\n모든 분석 및 시각화 완료\n")
     print("=" * 50)
+    sys.exit(1 if failed else 0)
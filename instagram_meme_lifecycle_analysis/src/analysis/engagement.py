@@ -5,16 +5,25 @@ from datetime import datetime
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import DATA_DIR, DATA_DIR, SRC_DIR
+from config.settings import DATA_DIR, DATA_DIR, SRC_DIR, ROOT_DIR
 
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
 
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+from orchestration.runs import atomic_path
+
 # 파일 경로
-meme_name = meme_name_from_user()
-input_path = DATA_DIR / "preprocessed" / f"{meme_name}_instagram.csv"
-output_path = DATA_DIR / "analysis" / f"{meme_name}" /  "engagement"
-output_path.mkdir(parents=True, exist_ok=True)
+def input_path_for(meme_name):
+    return DATA_DIR / "preprocessed" / f"{meme_name}_instagram.csv"
+
+def output_path_for(meme_name):
+    return DATA_DIR / "analysis" / f"{meme_name}" /  "engagement"
+
+def output_files(meme_name):
+    output_path = output_path_for(meme_name)
+    return [output_path / f"{meme_name}_{name}.csv" for name in ["likes_cleaned", "weekly_likes", "weekday_likes"]]
 
 # 숫자 변환 함수
 def convert_count(val):
@@ -28,9 +37,10 @@ def convert_count(val):
     else:
         return int(val)
 
-# 분석 실행
-def run_engagement_analysis():
-    df = pd.read_csv(input_path)
+# 분석 함수 (입력 DataFrame은 변경하지 않음)
+# 반환값: (정리된 게시물, 주간 합계, 요일별 평균) - 저장되는 CSV와 같은 형태
+def analyze_engagement(df):
+    df = df.copy()
     df["upload_time"] = pd.to_datetime(df["upload_time"])
     df["likes"] = df["likes"].apply(convert_count)
 
@@ -44,14 +54,34 @@ def run_engagement_analysis():
     # 주간 합산
     df["week"] = df["upload_time"].dt.to_period("W").dt.start_time
     weekly_likes = df.groupby("week")["likes"].sum().reset_index()
+    # CSV로 저장 후 다시 읽은 값과 같도록 날짜 문자열로 저장 (대시보드 x축)
+    weekly_likes["week"] = weekly_likes["week"].dt.strftime("%Y-%m-%d")
     weekday_likes = df.groupby("weekday_kr")["likes"].mean().reindex(
         ["월", "화", "수", "목", "금", "토", "일"]
-    )
+    ).to_frame(name="avg_likes")
+    return df, weekly_likes, weekday_likes
+
+# 분석 실행 (df가 없으면 전처리 CSV에서 로드)
+def run_engagement_analysis(meme_name, df=None):
+    output_path = output_path_for(meme_name)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    with trace.stage("analysis:engagement", platform="instagram", meme=meme_name) as t:
+        if df is None:
+            df = pd.read_csv(input_path_for(meme_name))
+        df, weekly_likes, weekday_likes = analyze_engagement(df)
 
-    # 저장
-    df.to_csv(output_path / f"{meme_name}_likes_cleaned.csv", index=False, encoding="utf-8-sig")
-    weekly_likes.to_csv(output_path / f"{meme_name}_weekly_likes.csv", index=False, encoding="utf-8-sig")
-    weekday_likes.to_frame(name="avg_likes").to_csv(output_path / f"{meme_name}_weekday_likes.csv", encoding="utf-8-sig")
+        # 저장
+        likes_path, weekly_path, weekday_path = output_files(meme_name)
+        with atomic_path(likes_path) as tmp_path:
+            df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        with atomic_path(weekly_path) as tmp_path:
+            weekly_likes.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        with atomic_path(weekday_path) as tmp_path:
+            weekday_likes.to_csv(tmp_path, encoding="utf-8-sig")
+        t.set(rows_in=len(df), rows_out=len(df))
+        t.output(likes_path, weekly_path, weekday_path)
+    return df, weekly_likes, weekday_likes
 
 if __name__ == "__main__":
-    run_engagement_analysis()
+    run_engagement_analysis(meme_name_from_user())
@@ -1,28 +1,56 @@
 from pathlib import Path
-from collections import Counter
-from difflib import SequenceMatcher
+from collections import Counter, deque
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+import argparse, ast, os
+import numpy as np
 import pandas as pd
 import sys
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import DATA_DIR, SRC_DIR
+from config.settings import DATA_DIR, SRC_DIR, ROOT_DIR
 
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
+from utils.token_store import TokenStore, exists as token_store_exists
+from utils.hangul import count_words
+from utils.topk import SpaceSaving
+from utils.variants import group_variants
+
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+from orchestration.runs import atomic_path
+from orchestration.governor import available_cores, WORKER_THREADS_ENV
+
+# 구간(chunk) 단위 키워드 집계
+# 전처리가 토큰 저장소에 단어 번호를 저장했으면 번호만 셈 (단어 조합/문자열 변환 없음, 작업 프로세스 불필요)
+# 단어 번호가 없는 예전 저장소는 게시물 수가 구간 크기보다 크면 구간별로 작업 프로세스에서 세고 마지막에 합침
+# (작업 프로세스 수 기본값: 워커에 배정된 스레드 수 MEME_WORKER_THREADS, 없으면 코어 수)
+CHUNK_POSTS_ENV = "MEME_KEYWORD_CHUNK_POSTS"
+WORKERS_ENV = "MEME_KEYWORD_WORKERS"
+DEFAULT_CHUNK_POSTS = 200_000
+
+# 집계 방식: exact(전체 단어 빈도, 기본) / topk(Space-Saving 근사 상위 K개, 메모리 = K개 + 구간 하나)
+# topk 결과에는 error 컬럼 추가 (실제 빈도는 count - error 이상 count 이하)
+# topk 모드의 기본 구간 크기는 게시물 K개 (구간 하나의 고유 단어 수도 K에 비례하도록)
+KEYWORD_MODE_ENV = "MEME_KEYWORD_MODE"
+TOPK_ENV = "MEME_KEYWORD_TOPK"
+DEFAULT_TOPK = 1000
 
 # 데이터 파일 경로
-meme_name = meme_name_from_user()
-filename_before = f"{meme_name}_instagram.csv"
-filename_after = f"{meme_name}_keywords.csv"
+def input_path_for(meme_name):
+    return DATA_DIR / "preprocessed" / f"{meme_name}_instagram.csv"
 
-input_path = DATA_DIR / "preprocessed" / filename_before
-output_path = DATA_DIR / "analysis" / f"{meme_name}" /  "keywords"
-output_path.mkdir(parents=True, exist_ok=True)
+def tokens_path_for(meme_name):
+    return DATA_DIR / "preprocessed" / f"{meme_name}_instagram_tokens"
 
+def output_path_for(meme_name):
+    return DATA_DIR / "analysis" / f"{meme_name}" /  "keywords" / f"{meme_name}_keywords.csv"
 
-df = pd.read_csv(input_path, converters={"caption_tokens": eval})
-print(type(df["caption_tokens"].iloc[0]))
+def groups_path_for(meme_name):
+    return DATA_DIR / "analysis" / f"{meme_name}" /  "keywords" / f"{meme_name}_keyword_groups.csv"
 
 
 CHO = ["ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
@@ -54,20 +82,183 @@ def combine_units(units):
             i += 1
     return result
 
-def extract_keywords(df):
+def token_to_word(token):
+    if len(token) == 1 and "ENG" in token[0]:
+        return token[0]["ENG"]
+    return combine_units(token)
+
+def chunk_posts_default(top_k=None):
+    if os.environ.get(CHUNK_POSTS_ENV):
+        return int(os.environ[CHUNK_POSTS_ENV])
+    return top_k or DEFAULT_CHUNK_POSTS
+
+def workers_default():
+    return int(os.environ.get(WORKERS_ENV) or os.environ.get(WORKER_THREADS_ENV) or available_cores())
+
+def top_k_default():
+    # 근사 집계 단어 수 (exact 모드면 None)
+    if os.environ.get(KEYWORD_MODE_ENV, "exact") != "topk":
+        return None
+    return int(os.environ.get(TOPK_ENV, DEFAULT_TOPK))
+
+def _count_store_chunk(chunk):
+    # 작업 프로세스: 토큰 저장소의 게시물 구간 [start, end) → 단어 빈도
+    path, start, end = chunk
+    return count_words(TokenStore(path).arrays(start, end))
+
+def _count_csv_chunk(token_strings):
+    # 작업 프로세스: 예전 형식 caption_tokens 문자열 묶음 → 단어 빈도
+    counter = Counter()
+    for value in token_strings:
+        for token in ast.literal_eval(value):
+            counter[token_to_word(token)] += 1
+    return counter
+
+def count_word_ids(store, chunk_posts, total=None):
+    # 단어 번호가 있는 토큰 저장소 → [(단어, 빈도)] / 근사 집계면 [(단어, 추정 빈도, 최대 오차)]
+    # 번호 순서 = 전처리에서 단어가 처음 나온 순서 → 같은 빈도의 순서도 단어로 셀 때와 같음
+    if total is None:
+        counts = np.bincount(store.word_ids, minlength=store.meta["words"])
+        return Counter(dict(zip(store.words(), counts.tolist()))).most_common()
+
+    # 근사 집계: 구간마다 번호별 빈도(구간 안에서 처음 나온 순서)를 요약에 합치고, 마지막에 남은 번호만 단어로 변환
+    for start in range(0, len(store), chunk_posts):
+        ids, first, counts = np.unique(store.post_word_ids(start, start + chunk_posts),
+                                       return_index=True, return_counts=True)
+        order = np.argsort(first, kind="stable")
+        total.update(dict(zip(ids[order].tolist(), counts[order].tolist())))
+    top = total.most_common()
+    words = store.words([word_id for word_id, _, _ in top])
+    return [(words[word_id], count, error) for word_id, count, error in top]
+
+def count_chunks(chunks, count_chunk, workers=None, total=None):
+    # 구간별 빈도를 작업 프로세스에서 세고 구간 순서대로 합치기
+    # (합치는 순서가 고정이라 단어가 처음 나온 순서 = 한 번에 셀 때와 같음)
+    # 동시에 처리 중인 구간은 작업 프로세스 수의 2배까지만 유지 → 메모리는 구간 크기에 비례
+    # total: 합칠 대상 (기본 Counter, 근사 집계면 SpaceSaving)
+    # 구간이 하나뿐이거나 작업 프로세스가 1개면 프로세스를 만들지 않고 현재 프로세스에서 셈
+    workers = workers or workers_default()
+    total = Counter() if total is None else total
+
+    def merge(words):
+        total.update(words)
+
+    chunks = iter(chunks)
+    head = list(islice(chunks, 2))
+    if workers <= 1 or len(head) <= 1:
+        for chunk in chain(head, chunks):
+            merge(count_chunk(chunk))
+        return total
+    chunks = chain(head, chunks)
+
+    # spawn: 스레드에서 실행 중인 프로세스를 fork하지 않도록
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(count_chunk, chunk))
+            if len(pending) >= workers * 2:
+                merge(pending.popleft().result())
+        while pending:
+            merge(pending.popleft().result())
+    return total
+
+def extract_keywords(tokens, chunk_posts=None, workers=None, top_k=None):
+    # tokens: 토큰 저장소(TokenStore), 예전 형식 전처리 CSV 경로, 또는 caption_tokens 컬럼이 있는 DataFrame
+    # top_k가 있으면 근사 상위 K개 [(단어, 추정 빈도, 최대 오차)], 없으면 전체 [(단어, 빈도)]
+    # (근사 집계도 chunk_posts개 게시물 구간마다 정확하게 센 뒤 요약에 합치므로 오차와 메모리는 구간 크기에 따라 달라짐)
+    chunk_posts = chunk_posts or chunk_posts_default(top_k)
+    total = SpaceSaving(top_k) if top_k else None
+
+    if isinstance(tokens, TokenStore):
+        if tokens.word_ids is not None:
+            return count_word_ids(tokens, chunk_posts, total)
+        if len(tokens) <= chunk_posts and total is None:
+            # 전체 토큰을 정수 연산으로 한 번에 음절 조합 (utils/hangul.py), 같은 단어는 한 번만 변환
+            return count_words(tokens.arrays()).most_common()
+        chunks = [(str(tokens.path), start, start + chunk_posts) for start in range(0, len(tokens), chunk_posts)]
+        return count_chunks(chunks, _count_store_chunk, workers, total).most_common()
+
+    if isinstance(tokens, Path):
+        # 예전 형식 CSV는 행 묶음 단위로 읽으면서 집계
+        chunks = (chunk["caption_tokens"].tolist() for chunk in
+                  pd.read_csv(tokens, usecols=["caption_tokens"], chunksize=chunk_posts))
+        return count_chunks(chunks, _count_csv_chunk, workers, total).most_common()
+
     counter = Counter()
-    for token_list in df["caption_tokens"]:
+    for i, token_list in enumerate(tokens["caption_tokens"]):
         for token in token_list:
-            if len(token) == 1 and "ENG" in token[0]:
-                word = token[0]["ENG"]
-            else:
-                word = combine_units(token)
-            counter[word] += 1
+            counter[token_to_word(token)] += 1
+        if total is not None and (i + 1) % chunk_posts == 0:
+            total.update(counter)
+            counter = Counter()
+    if total is not None:
+        return total.update(counter).most_common()
     return counter.most_common()
 
-keywords = extract_keywords(df)
+def keyword_groups_frame(top_df):
+    # 키워드 빈도표 → 변형 묶음표 (keyword, count, variants) (utils/variants.py)
+    groups = group_variants(zip(top_df["word"], top_df["count"]))
+    return pd.DataFrame(
+        [(keyword, count, "|".join(word for word, _ in members)) for keyword, count, members in groups],
+        columns=["keyword", "count", "variants"],
+    )
 
-# 저장
-import pandas as pd
-top_df = pd.DataFrame(keywords, columns=["word", "count"])
-top_df.to_csv(output_path / f"{meme_name}_keywords.csv", index=False, encoding="utf-8-sig")
\ No newline at end of file
+def load_tokens(meme_name):
+    # 토큰 저장소를 memmap으로 열기 (없으면 예전 형식 전처리 CSV 경로 → extract_keywords()가 나눠 읽음)
+    tokens_path = tokens_path_for(meme_name)
+    if token_store_exists(tokens_path):
+        return TokenStore(tokens_path)
+    return input_path_for(meme_name)
+
+def keywords_frame(tokens, chunk_posts=None, workers=None, top_k=None):
+    # 토큰 → 키워드 빈도표 (word, count), 근사 집계면 (word, count, error)
+    columns = ["word", "count", "error"] if top_k else ["word", "count"]
+    return pd.DataFrame(extract_keywords(tokens, chunk_posts, workers, top_k), columns=columns)
+
+def run_keyword_analysis(meme_name, tokens=None, chunk_posts=None, workers=None, top_k=None):
+    # 키워드 빈도표 저장 후 반환 (tokens가 없으면 전처리 결과에서 로드)
+    # 게시물이 chunk_posts보다 많으면 구간별로 workers개 프로세스에서 집계
+    # top_k가 있으면 (또는 MEME_KEYWORD_MODE=topk) 상위 top_k개만 근사 집계
+    top_k = top_k or top_k_default()
+    output_path = output_path_for(meme_name)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with trace.stage("analysis:keywords", platform="instagram", meme=meme_name) as t:
+        if tokens is None:
+            tokens = load_tokens(meme_name)
+        if not isinstance(tokens, Path):
+            t.set(rows_in=len(tokens))
+        if isinstance(tokens, TokenStore):
+            t.set(word_ids=tokens.word_ids is not None)
+
+        top_df = keywords_frame(tokens, chunk_posts, workers, top_k)
+
+        if top_k:
+            # 목록에 없는 단어의 빈도 상한 (요약이 가득 찼을 때만 0보다 큼)
+            bound = int(top_df["count"].min()) if len(top_df) >= top_k else 0
+            exact_rows = int((top_df["error"] == 0).sum())
+            t.set(keyword_mode="topk", top_k=top_k, chunk_posts=chunk_posts or chunk_posts_default(top_k),
+                  unlisted_max_count=bound, exact_rows=exact_rows)
+            print(f"⚙️  근사 상위 {top_k}개 집계: 목록 밖 단어 빈도 ≤ {bound}, 정확한 값 {exact_rows}/{len(top_df)}개")
+        else:
+            t.set(keyword_mode="exact")
+
+        # 표기 변형(오타, 늘여 쓰기)을 대표 키워드로 묶은 표
+        groups_df = keyword_groups_frame(top_df)
+        t.set(keyword_groups=len(groups_df))
+
+        # 저장
+        groups_path = groups_path_for(meme_name)
+        with atomic_path(output_path) as tmp_path:
+            top_df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        with atomic_path(groups_path) as tmp_path:
+            groups_df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        t.set(rows_out=len(top_df))
+        t.output(output_path, groups_path)
+    return top_df
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--top-k", type=int)
+    args, _ = parser.parse_known_args()
+    run_keyword_analysis(meme_name_from_user(), top_k=args.top_k)
@@ -1,22 +1,76 @@
 from pathlib import Path
+from collections import deque
 import pandas as pd
-import sys
+import argparse, hashlib, io, json, math, sys
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import DATA_DIR, SRC_DIR
+from config.settings import DATA_DIR, SRC_DIR, ROOT_DIR
 
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
 
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+from orchestration.runs import atomic_path
+
 # 입력/출력 경로 설정
-meme_name = meme_name_from_user()
-input_path = DATA_DIR / "preprocessed" / f"{meme_name}_instagram.csv"
-output_path = DATA_DIR / "analysis" / f"{meme_name}" /  "lifecycle"
-output_path.mkdir(parents=True, exist_ok=True)
+def input_path_for(meme_name):
+    return DATA_DIR / "preprocessed" / f"{meme_name}_instagram.csv"
+
+def output_path_for(meme_name):
+    return DATA_DIR / "analysis" / f"{meme_name}" /  "lifecycle" / f"{meme_name}_lifecycle.csv"
+
+def state_path_for(meme_name):
+    # 증분 갱신용 감지기 상태 (마지막 날짜, 이동 평균 창, 누적, 현재 구간)
+    return DATA_DIR / "analysis" / f"{meme_name}" /  "lifecycle" / f"{meme_name}_lifecycle_state.json"
+
+# 이동 평균 / 변화량 창 크기
+MOVING_AVG_WINDOW = 7
+DELTA_WINDOW = 3
+
+# 구간 경계 (히스테리시스)
+# 변화량이 DECLINE_ENTER 미만이면 쇠퇴기로, GROWTH_ENTER 초과면 성장기로 바뀌고
+# 그 사이 구간에서는 직전 구간 유지 (경계 근처에서 구간이 매일 바뀌지 않도록)
+DECLINE_ENTER = -10.5
+GROWTH_ENTER = -10.3
+
+PHASE_GROWTH = "성장기"
+PHASE_STAGNANT = "정체기"
+PHASE_DECLINE = "쇠퇴기"
+
+WEEKDAY_KOR = {
+    0: "월요일",
+    1: "화요일",
+    2: "수요일",
+    3: "목요일",
+    4: "금요일",
+    5: "토요일",
+    6: "일요일"
+}
+
+def next_phase(previous, delta):
+    # 직전 구간 + 오늘 변화량 → 오늘 구간 (변화량이 없으면 정체기)
+    if delta is None or math.isnan(delta):
+        return PHASE_STAGNANT
+    if delta < DECLINE_ENTER:
+        return PHASE_DECLINE
+    if delta > GROWTH_ENTER:
+        return PHASE_GROWTH
+    return previous
 
-def run_lifecycle_analysis():
-    df = pd.read_csv(input_path, parse_dates=["upload_time"])
+def classify_phases(deltas):
+    phases = []
+    phase = PHASE_STAGNANT
+    for delta in deltas:
+        phase = next_phase(phase, delta)
+        phases.append(phase)
+    return phases
+
+# 게시물 → 일별 생명주기 표 (입력 DataFrame은 변경하지 않음)
+def analyze_lifecycle(df):
+    df = df.copy()
+    df["upload_time"] = pd.to_datetime(df["upload_time"])
 
     # 날짜 기준 집계
     df["date"] = df["upload_time"].dt.date
@@ -25,37 +79,256 @@ def run_lifecycle_analysis():
     daily_df["date"] = pd.to_datetime(daily_df["date"])
 
     # ✅ 요일(한글) 컬럼 추가
-    weekday_kor = {
-        0: "월요일",
-        1: "화요일",
-        2: "수요일",
-        3: "목요일",
-        4: "금요일",
-        5: "토요일",
-        6: "일요일"
-    }
-    daily_df["weekday"] = daily_df["date"].dt.weekday.map(weekday_kor)
+    daily_df["weekday"] = daily_df["date"].dt.weekday.map(WEEKDAY_KOR)
 
     # 이동 평균 & 누적
-    daily_df["moving_avg"] = daily_df["count"].rolling(window=7, min_periods=1).mean()
+    daily_df["moving_avg"] = daily_df["count"].rolling(window=MOVING_AVG_WINDOW, min_periods=1).mean()
     daily_df["cumulative"] = daily_df["count"].cumsum()
 
     # 구간 감지
-    daily_df["delta"] = daily_df["moving_avg"].diff().rolling(window=3, min_periods=1).mean()
+    daily_df["delta"] = daily_df["moving_avg"].diff().rolling(window=DELTA_WINDOW, min_periods=1).mean()
+    daily_df["phase"] = classify_phases(daily_df["delta"])
+    return daily_df
+
+COLUMNS = ["date", "count", "weekday", "moving_avg", "cumulative", "delta", "phase"]
+
+class LifecycleDetector:
+    """
+    일별 게시물 수를 하루씩 받아 생명주기 컬럼을 계산하는 온라인 감지기
+    최근 MOVING_AVG_WINDOW일 게시물 수와 최근 DELTA_WINDOW개 이동 평균 변화량만 유지 (하루 갱신 O(1))
+    analyze_lifecycle()과 같은 규칙 (게시물이 있는 날짜 기준 창)
+
+    마지막 날짜는 열린 상태로 유지: 같은 날짜 게시물이 나중에 더 들어오면
+    마지막 날짜 이전 상태(previous)로 되돌려 합친 게시물 수로 다시 계산
+    """
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.last_date = state.get("last_date")
+        self.last_count = state.get("last_count", 0)
+        self.counts = deque(state.get("counts", []), maxlen=MOVING_AVG_WINDOW)
+        self.diffs = deque(state.get("diffs", []), maxlen=DELTA_WINDOW)
+        self.cumulative = state.get("cumulative", 0)
+        self.moving_avg = state.get("moving_avg")
+        self.phase = state.get("phase", PHASE_STAGNANT)
+        self.days = state.get("days", 0)
+        self.previous = state.get("previous")
+
+    def update(self, date, count):
+        """하루 반영 후 그날의 행(dict) 반환 (마지막 날짜와 같으면 그 날짜를 다시 계산)"""
+        date = pd.Timestamp(date).normalize()
+        if self.last_date is not None:
+            last_date = pd.Timestamp(self.last_date)
+            if date < last_date:
+                raise ValueError(f"이미 반영된 날짜입니다: {date.date()} (마지막 날짜 {self.last_date})")
+            if date == last_date:
+                count += self.last_count
+                self.__init__(self.previous)
+
+        self.previous = self.state(include_previous=False)
+        self.counts.append(int(count))
+        moving_avg = sum(self.counts) / len(self.counts)
+        # 변화량 창에는 첫날의 빈 값(None)도 들어감 (pandas rolling과 같이 개수에서 제외)
+        self.diffs.append(moving_avg - self.moving_avg if self.moving_avg is not None else None)
+        valid = [diff for diff in self.diffs if diff is not None]
+        delta = sum(valid) / len(valid) if valid else float("nan")
+
+        self.cumulative += int(count)
+        self.moving_avg = moving_avg
+        self.phase = next_phase(self.phase, delta)
+        self.last_date = date.strftime("%Y-%m-%d")
+        self.last_count = int(count)
+        self.days += 1
+        return {
+            "date": date,
+            "count": int(count),
+            "weekday": WEEKDAY_KOR[date.weekday()],
+            "moving_avg": moving_avg,
+            "cumulative": self.cumulative,
+            "delta": delta,
+            "phase": self.phase,
+        }
+
+    def state(self, include_previous=True):
+        state = {
+            "last_date": self.last_date,
+            "last_count": self.last_count,
+            "counts": list(self.counts),
+            "diffs": list(self.diffs),
+            "cumulative": self.cumulative,
+            "moving_avg": self.moving_avg,
+            "phase": self.phase,
+            "days": self.days,
+        }
+        if include_previous:
+            state["previous"] = self.previous
+        return state
+
+    @classmethod
+    def from_daily(cls, daily_df, include_previous=True):
+        # analyze_lifecycle() 결과의 마지막 행들로 상태 구성
+        if daily_df.empty:
+            return cls()
+        diffs = daily_df["moving_avg"].diff().tail(DELTA_WINDOW)
+        last = daily_df.iloc[-1]
+        previous = cls.from_daily(daily_df.iloc[:-1], False).state(False) if include_previous else None
+        return cls({
+            "last_date": pd.Timestamp(last["date"]).strftime("%Y-%m-%d"),
+            "last_count": int(last["count"]),
+            "counts": [int(c) for c in daily_df["count"].tail(MOVING_AVG_WINDOW)],
+            "diffs": [None if pd.isna(d) else float(d) for d in diffs],
+            "cumulative": int(last["cumulative"]),
+            "moving_avg": float(last["moving_avg"]),
+            "phase": last["phase"],
+            "days": len(daily_df),
+            "previous": previous,
+        })
+
+def load_state(meme_name):
+    state_path = state_path_for(meme_name)
+    if not state_path.exists():
+        return None
+    with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_state(meme_name, detector, last_row_offset, input_mark=None):
+    # 감지기 상태 + 결과 CSV에서 마지막 행이 시작하는 바이트 위치 (마지막 날짜 재계산 시 그 행부터 다시 씀)
+    # input_mark: 전처리 CSV에서 반영한 위치 (없으면 다음 기본 증분 갱신은 전체 분석)
+    input_mark = input_mark or {}
+    with atomic_path(state_path_for(meme_name)) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({**detector.state(), "last_row_offset": last_row_offset,
+                       "input_offset": input_mark.get("offset"), "input_check": input_mark.get("check")},
+                      f, ensure_ascii=False, indent=2)
+
+# 전처리 CSV 반영 위치 = 바이트 위치 + 그 앞 INPUT_CHECK_BYTES바이트의 해시
+# (전처리는 수집 원본 순서대로 CSV를 다시 쓰므로 새 게시물은 뒤에 붙음,
+#  해시가 다르면 원본이 새로 수집된 것이므로 전체 분석)
+INPUT_CHECK_BYTES = 4096
+
+def _input_check(input_path, offset):
+    with open(input_path, "rb") as f:
+        f.seek(max(0, offset - INPUT_CHECK_BYTES))
+        return hashlib.sha1(f.read(min(offset, INPUT_CHECK_BYTES))).hexdigest()
+
+def _input_mark(input_path, offset):
+    return {"offset": offset, "check": _input_check(input_path, offset)}
+
+def read_new_posts(input_path, state):
+    """전처리 CSV에서 지난 반영 위치 이후의 행만 읽기 → (게시물, 새 반영 위치), 위치를 알 수 없으면 None"""
+    offset = state.get("input_offset")
+    if offset is None or not input_path.exists() or input_path.stat().st_size < offset:
+        return None
+    if _input_check(input_path, offset) != state.get("input_check"):
+        return None
+    with open(input_path, "rb") as f:
+        header = f.readline()
+        f.seek(max(offset, len(header)))
+        body = f.read()
+    posts = pd.read_csv(io.BytesIO(header + body), usecols=["upload_time"], parse_dates=["upload_time"],
+                        encoding="utf-8-sig")
+    return posts, _input_mark(input_path, max(offset, len(header)) + len(body))
+
+def _csv_rows(daily_df):
+    # 결과 CSV의 데이터 행 (바이트열 목록)
+    text = daily_df.to_csv(index=False, header=False)
+    return [line.encode("utf-8") for line in text.splitlines(keepends=True)]
+
+# 분석 실행 (df가 없으면 전처리 CSV에서 로드)
+def run_lifecycle_analysis(meme_name, df=None):
+    output_path = output_path_for(meme_name)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with trace.stage("analysis:lifecycle", platform="instagram", meme=meme_name) as t:
+        input_mark = None
+        if df is None:
+            # 읽은 위치까지 반영한 것으로 기록 (다음 증분 갱신은 그 뒤의 행만 읽음)
+            input_path = input_path_for(meme_name)
+            input_size = input_path.stat().st_size
+            df = pd.read_csv(input_path, parse_dates=["upload_time"])
+            input_mark = _input_mark(input_path, input_size)
+        daily_df = analyze_lifecycle(df)
+
+        # 저장 (다음 증분 갱신용 감지기 상태도 함께)
+        with atomic_path(output_path) as tmp_path:
+            daily_df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        last_row = _csv_rows(daily_df.tail(1))
+        save_state(meme_name, LifecycleDetector.from_daily(daily_df),
+                   output_path.stat().st_size - sum(len(row) for row in last_row), input_mark)
+        t.set(rows_in=len(df), rows_out=len(daily_df))
+        t.output(output_path, state_path_for(meme_name))
+    return daily_df
+
+def load_lifecycle(meme_name):
+    # 저장된 전체 생명주기 표 (update_lifecycle()은 새로 계산한 행만 반환하므로 대시보드는 이 표를 사용)
+    return pd.read_csv(output_path_for(meme_name), parse_dates=["date"])
+
+# 증분 갱신: 아직 반영하지 않은 게시물만 감지기에 추가
+# (결과 CSV는 마지막 행부터 다시 써서 이어 붙임, 상태가 없으면 전체 분석으로 처음 만듦)
+# 어댑터/일괄 실행/감시 모드의 재실행은 모두 이 함수를 사용 (처음 실행은 자동으로 전체 분석)
+def update_lifecycle(meme_name, new_posts=None):
+    # new_posts: 새로 수집된 게시물 (upload_time 컬럼, 이미 반영한 게시물은 넣지 않음)
+    #            없으면 전처리 CSV에서 지난 반영 위치 이후의 행만 읽음
+    state = load_state(meme_name)
+    output_path = output_path_for(meme_name)
+    if state is None or not output_path.exists():
+        return run_lifecycle_analysis(meme_name, new_posts)
+
+    input_mark = None
+    if new_posts is None:
+        new_input = read_new_posts(input_path_for(meme_name), state)
+        if new_input is None:
+            # 반영 위치를 모르거나 전처리 CSV가 새로 만들어짐
+            print(f"♻️  {meme_name}: 전처리 결과의 반영 위치를 확인할 수 없어 전체 분석")
+            return run_lifecycle_analysis(meme_name)
+        new_posts, input_mark = new_input
+    detector = LifecycleDetector(state)
+
+    with trace.stage("analysis:lifecycle", platform="instagram", meme=meme_name) as t:
+        dates = pd.to_datetime(new_posts["upload_time"]).dt.date
+        daily_counts = dates.value_counts().sort_index()
 
-    def classify_phase(x):
-        if x > -10.5:
-            return "성장기"
-        elif x < -10.3:
-            return "쇠퇴기"
+        # 마지막 날짜 이전 게시물은 제외 (늦게 수집된 과거 게시물은 전체 분석에서만 반영)
+        last_date = pd.Timestamp(detector.last_date).date() if detector.last_date else None
+        if last_date:
+            late_rows = int(daily_counts[daily_counts.index < last_date].sum())
+            daily_counts = daily_counts[daily_counts.index >= last_date]
         else:
-            return "정체기"
+            late_rows = 0
 
-    daily_df["phase"] = daily_df["delta"].apply(classify_phase)
+        rows = [detector.update(date, count) for date, count in daily_counts.items()]
+        daily_df = pd.DataFrame(rows, columns=COLUMNS)
+        if rows:
+            # 마지막 날짜가 다시 계산됐으면 그 행부터, 아니면 파일 끝부터 기록
+            reopened = last_date is not None and daily_counts.index[0] == last_date
+            offset = state["last_row_offset"] if reopened else output_path.stat().st_size
+            lines = _csv_rows(daily_df)
+            # 기존 결과의 앞부분 + 새 행을 임시 파일에 쓴 뒤 교체 (중단돼도 결과 CSV는 이전 또는 새 내용 그대로,
+            # 상태를 저장하기 전에 중단되면 다음 갱신이 이전 상태 기준으로 같은 행을 다시 씀)
+            with open(output_path, "rb") as f:
+                head = f.read(offset)
+            with atomic_path(output_path) as tmp_path:
+                with open(tmp_path, "wb") as f:
+                    f.write(head)
+                    f.writelines(lines)
+            save_state(meme_name, detector, offset + sum(len(line) for line in lines[:-1]), input_mark)
+        elif input_mark is not None:
+            save_state(meme_name, detector, state["last_row_offset"], input_mark)
 
-    # 저장
-    daily_df.to_csv(output_path / f"{meme_name}_lifecycle.csv", index=False, encoding="utf-8-sig")
+        t.set(rows_in=len(new_posts), rows_out=len(daily_df), late_rows=late_rows, phase=detector.phase)
+        t.output(output_path, state_path_for(meme_name))
+    print(f"📈 {meme_name}: {len(daily_df)}일 갱신 (마지막 날짜 {detector.last_date}, 현재 {detector.phase})")
+    return daily_df
 
+if __name__ == "__main__":
+    # 기본은 증분 갱신 (pipeline.py 재실행 포함), --full이면 전체 다시 분석
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--full", action="store_true")
+    args, _ = parser.parse_known_args()
+    if args.full:
+        run_lifecycle_analysis(meme_name_from_user())
+    else:
+        update_lifecycle(meme_name_from_user())
 
 # from pathlib import Path
 # import pandas as pd
@@ -0,0 +1,108 @@
+"""
+게시물 창 HTML 파서 벤치마크 (브라우저 없이 저장된 HTML로 실행)
+- fixtures/<이름>.html: 게시물 창 HTML (수집 중 MEME_INSTAGRAM_SAVE_HTML=<폴더>로 저장 가능)
+- fixtures/<이름>.json: {"shortcode": ..., "post": 기대 결과} (있으면 결과 확인)
+
+사용법:
+    python src/data_collection/benchmark_parser.py [--fixtures 폴더] [--repeat 20]
+"""
+from pathlib import Path
+import argparse, json, sys, time
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(BASE_DIR))
+from config.settings import SRC_DIR
+
+sys.path.append(str(SRC_DIR))
+from data_collection.post_parser import parse_post, LIKE_CLASS, CAPTION_CLASS, USER_CLASS
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def parse_post_bs4(page_source):
+    # 예전 수집기 방식 (비교용): html.parser로 파싱 + 태그마다 class 목록 비교
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(page_source, "html.parser")
+
+    time_tag = soup.find("time", attrs={"datetime": True})
+    post_time = time_tag["datetime"] if time_tag else ""
+
+    likes = 0
+    like_tag = next((tag for tag in soup.find_all("span") if tag.get("class") and " ".join(tag.get("class")) == LIKE_CLASS), None)
+    if like_tag:
+        try:
+            likes = int(like_tag.get_text(strip=True).replace(",", ""))
+        except ValueError:
+            likes = 0
+
+    caption = ""
+    caption_tag = next((tag for tag in soup.find_all("h1") if tag.get("class") and " ".join(tag.get("class")) == CAPTION_CLASS), None)
+    if caption_tag:
+        caption = caption_tag.get_text(separator=" ", strip=True)
+
+    username = ""
+    user_tag = next((tag for tag in soup.find_all("a") if tag.get("class") and " ".join(tag.get("class")) == USER_CLASS), None)
+    if user_tag:
+        username = user_tag.get_text(strip=True)
+
+    return {"username": username, "upload_time": post_time, "likes": likes, "caption": caption}
+
+
+def best_time(fn, repeat):
+    # repeat번 실행 중 가장 빠른 시간 (초)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(fixtures_dir=FIXTURES_DIR, repeat=20):
+    pages = sorted(Path(fixtures_dir).glob("*.html"))
+    if not pages:
+        print(f"❌ HTML 파일이 없습니다: {fixtures_dir}")
+        return []
+    try:
+        import bs4  # noqa: F401
+        has_bs4 = True
+    except ImportError:
+        print("⚠️  beautifulsoup4가 설치되어 있지 않아 예전 방식과의 비교를 건너뜁니다.")
+        has_bs4 = False
+
+    results = []
+    failed = 0
+    for page in pages:
+        page_source = page.read_text(encoding="utf-8")
+        expected_path = page.with_suffix(".json")
+        expected = json.loads(expected_path.read_text(encoding="utf-8")) if expected_path.exists() else {}
+        shortcode = expected.get("shortcode")
+
+        post = parse_post(page_source, shortcode)
+        ok = "post" not in expected or post == expected["post"]
+        failed += not ok
+
+        lxml_ms = best_time(lambda: parse_post(page_source, shortcode), repeat) * 1000
+        bs4_ms = best_time(lambda: parse_post_bs4(page_source), max(1, repeat // 4)) * 1000 if has_bs4 else None
+        results.append({"fixture": page.name, "kb": len(page_source.encode("utf-8")) / 1024, "ok": ok,
+                        "lxml_ms": lxml_ms, "bs4_ms": bs4_ms})
+
+        line = f"{'✅' if ok else '❌'} {page.name:<28} {results[-1]['kb']:7.1f}KB  lxml {lxml_ms:7.2f}ms"
+        if bs4_ms is not None:
+            line += f"  bs4 {bs4_ms:8.2f}ms  ({bs4_ms / lxml_ms:5.1f}x)"
+        print(line)
+        if not ok:
+            print(f"   기대: {expected['post']}\n   결과: {post}")
+
+    print(f"\n📊 {len(results)}개 HTML, 결과 불일치 {failed}개, "
+          f"게시물당 평균 {sum(r['lxml_ms'] for r in results) / len(results):.2f}ms (lxml)")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게시물 창 HTML 파서 벤치마크")
+    parser.add_argument("--fixtures", default=str(FIXTURES_DIR), help="HTML(+기대 결과 JSON) 폴더")
+    parser.add_argument("--repeat", type=int, default=20, help="HTML마다 반복 횟수 (가장 빠른 시간 사용)")
+    args = parser.parse_args()
+    results = run_benchmark(args.fixtures, args.repeat)
+    sys.exit(0 if results and all(r["ok"] for r in results) else 1)
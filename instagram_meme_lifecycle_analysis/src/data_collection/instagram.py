@@ -1,122 +1,392 @@
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-import sys, time, json
+import argparse, os, queue, sys, threading, time
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
 from config.env import INSTAGRAM_USERNAME, INSTAGRAM_PASSWORD
-from config.settings import DATA_DIR, SRC_DIR
+from config.settings import SRC_DIR, ROOT_DIR
+
+sys.path.append(str(ROOT_DIR))
+from orchestration.ratelimit import RateLimiter
 
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
+from utils.raw_posts import (jsonl_path_for, start_collection, append_posts,
+                             load_checkpoint, save_checkpoint, resume_collection)
+from data_collection.post_parser import parse_post, parse_permalinks, shortcode_from_url
+
+# 설정하면 게시물 창 HTML을 이 폴더에 저장 (브라우저 없이 파서를 시험할 때 사용)
+SAVE_HTML_ENV = "MEME_INSTAGRAM_SAVE_HTML"
 
-# 밈 검색
-meme_name = meme_name_from_user()
-search_url = f"https://www.instagram.com/explore/search/keyword/?q=%23{meme_name}"
+# 무인 수집 설정 (명령줄 옵션이 없을 때 사용)
+UNATTENDED_ENV = "MEME_INSTAGRAM_UNATTENDED"    # 1이면 Enter 입력 없이 수집
+TARGET_ENV = "MEME_INSTAGRAM_TARGET"            # 목표 게시물 수 (이어서 수집한 것 포함)
+TIME_BUDGET_ENV = "MEME_INSTAGRAM_TIME_BUDGET"  # 이번 실행의 수집 시간 제한 (초)
+PROFILE_ENV = "MEME_INSTAGRAM_PROFILE"          # Chrome 프로필 폴더 (로그인 세션 유지)
+MODE_ENV = "MEME_INSTAGRAM_MODE"                # modal(다음 버튼 따라가기) / permalinks(링크 수집 후 동시 수집)
+WORKERS_ENV = "MEME_INSTAGRAM_WORKERS"          # permalinks 모드의 동시 브라우저 수
+BASE_URL_ENV = "MEME_INSTAGRAM_BASE_URL"        # 모의 사이트로 시험할 때 (mock_site.py)
 
-# Selenium 설정
-options = Options()
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("user-agent=Mozilla/5.0")
+INTERACTIVE_TARGET = 3  # 대화형 수집은 예시로 3개만
+LOGIN_TIMEOUT = 60
+DEFAULT_WORKERS = 2
+IDLE_SCROLLS = 3        # 새 링크 없이 이만큼 스크롤하면 링크 수집 종료
+SCROLL_WAIT = 5         # 스크롤 후 새 링크를 기다리는 시간 (초)
 
-driver = webdriver.Chrome(options=options)
+BASE_URL = os.environ.get(BASE_URL_ENV, "https://www.instagram.com").rstrip("/")
+LOGIN_URL = f"{BASE_URL}/accounts/login/"
+NEXT_BUTTON_XPATH = '//button[.//svg[@aria-label="다음"] or .//*[text()="다음"]]'
 
-# 로그인 절차
-driver.get("https://www.instagram.com/accounts/login/")
-WebDriverWait(driver, 10).until(
-    EC.presence_of_element_located((By.NAME, "username"))
-)
-driver.find_element(By.NAME, "username").send_keys(INSTAGRAM_USERNAME)
-driver.find_element(By.NAME, "password").send_keys(INSTAGRAM_PASSWORD + Keys.RETURN)
 
-input("🔐 로그인 완료 후 Enter를 누르세요...")
+def collection_options():
+    # 명령줄 옵션 (없으면 환경 변수)
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--unattended", action="store_true", default=os.environ.get(UNATTENDED_ENV) == "1")
+    parser.add_argument("--target", type=int, default=int(os.environ[TARGET_ENV]) if os.environ.get(TARGET_ENV) else None)
+    parser.add_argument("--time-budget", type=float,
+                        default=float(os.environ[TIME_BUDGET_ENV]) if os.environ.get(TIME_BUDGET_ENV) else None)
+    parser.add_argument("--profile", default=os.environ.get(PROFILE_ENV))
+    parser.add_argument("--mode", choices=["modal", "permalinks"], default=os.environ.get(MODE_ENV, "modal"))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS)))
+    parser.add_argument("--fresh", action="store_true", help="체크포인트를 무시하고 처음부터 수집")
+    args, _ = parser.parse_known_args()
+    return args
 
-driver.get(search_url)
 
-# 첫 번째 썸네일 클릭
-try:
-    first_thumb = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.CLASS_NAME, "_aagw"))
-    )
-    first_thumb.click()
-    time.sleep(3)
-except Exception as e:
-    print("썸네일 클릭 실패:", e)
+def make_driver(profile_dir=None):
+    # Selenium 설정
+    options = Options()
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("user-agent=Mozilla/5.0")
+    if profile_dir:
+        # 같은 프로필을 쓰면 한 번 로그인한 세션이 다음 실행에도 남음
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    return webdriver.Chrome(options=options)
 
-all_data = []
 
-# while True:
-for i in range(3):  # 예시로 10개의 게시물만 수집
+def login(driver, limiter, unattended=False):
+    limiter.acquire()
+    driver.get(LOGIN_URL)
     try:
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-
-        # 게시 시간
-        time_tag = soup.find("time", attrs={"datetime": True})
-        post_time = time_tag["datetime"] if time_tag else ""
-
-        # # 좋아요 수
-        likes = 0
-        target_class = "html-span xdj266r x11i5rnm xat24cr x1mh8g0r xexx8yu x4uap5 x18d9i69 xkhd6sd x1hl2dhg x16tdsg8 x1vvkbs"
-        like_tag = next(
-            (tag for tag in soup.find_all("span") if tag.get("class") and " ".join(tag.get("class")) == target_class),
-            None
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.NAME, "username"))
         )
-        if like_tag:
-            try:
-                likes = int(like_tag.get_text(strip=True).replace(",", ""))
-            except ValueError:
-                likes = 0
-
-        # 설명 텍스트
-        caption = ""
-        target_caption_class = "_ap3a _aaco _aacu _aacx _aad7 _aade"
-        caption_tag = next(
-            (tag for tag in soup.find_all("h1") if tag.get("class") and " ".join(tag.get("class")) == target_caption_class),
-            None
+    except TimeoutException:
+        # 프로필에 로그인 세션이 남아 있으면 로그인 창이 나오지 않음
+        print("🔐 저장된 로그인 세션 사용")
+        return
+    driver.find_element(By.NAME, "username").send_keys(INSTAGRAM_USERNAME)
+    driver.find_element(By.NAME, "password").send_keys(INSTAGRAM_PASSWORD + Keys.RETURN)
+
+    if not unattended:
+        input("🔐 로그인 완료 후 Enter를 누르세요...")
+        return
+    # 무인 수집: 로그인 페이지를 벗어날 때까지 대기 (2단계 인증은 --profile로 한 번 대화형 로그인 필요)
+    try:
+        WebDriverWait(driver, LOGIN_TIMEOUT).until(lambda d: "/accounts/login" not in d.current_url)
+    except TimeoutException:
+        raise RuntimeError("로그인이 완료되지 않았습니다. 대화형으로 한 번 로그인한 --profile 폴더를 지정하세요.")
+
+
+def search_url(meme_name):
+    return f"{BASE_URL}/explore/search/keyword/?q=%23{meme_name}"
+
+def permalink_url(shortcode):
+    return f"{BASE_URL}/p/{shortcode}/"
+
+
+def share_session(source, target, limiter):
+    # 로그인한 브라우저의 쿠키를 다른 브라우저에 복사 (같은 프로필 폴더는 동시에 쓸 수 없음)
+    limiter.acquire()
+    target.get(f"{BASE_URL}/")
+    for cookie in source.get_cookies():
+        target.add_cookie({key: cookie[key] for key in ("name", "value", "path", "secure", "expiry") if key in cookie})
+
+
+def open_first_post(driver, limiter, meme_name):
+    # 해시태그 검색 후 첫 번째 썸네일 클릭 (게시물 창이 열리면 True)
+    limiter.acquire()
+    driver.get(search_url(meme_name))
+    try:
+        first_thumb = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.CLASS_NAME, "_aagw"))
         )
-        if caption_tag:
-            caption = caption_tag.get_text(separator=" ", strip=True)
-
-        # 작성자 계정명
-        username = ""
-        target_user_class = "x1i10hfl xjbqb8w x1ejq31n xd10rxx x1sy0etr x17r0tee x972fbf xcfux6l x1qhh985 xm0m39n x9f619 x1ypdohk xt0psk2 xe8uvvx xdj266r x11i5rnm xat24cr x1mh8g0r xexx8yu x4uap5 x18d9i69 xkhd6sd x16tdsg8 x1hl2dhg xggy1nq x1a2a7pz _aswp _aswq _aswv _aswz _asw_ _asx2 _a6hd"
-        user_tag = next(
-            (tag for tag in soup.find_all("a") if tag.get("class") and " ".join(tag.get("class")) == target_user_class),
-            None
+        limiter.acquire()
+        first_thumb.click()
+        # 게시물 창이 열릴 때까지 대기
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='dialog']"))
         )
-        if user_tag:
-            username = user_tag.get_text(strip=True)
-
-        # 데이터 저장
-        data = {
-            "username": username,
-            "upload_time": post_time,
-            "likes": likes,
-            "caption": caption,
-        }
-        all_data.append(data)
-        input("넘어가기")
-        # 다음 버튼 클릭
+        return True
+    except Exception as e:
+        print("썸네일 클릭 실패:", e)
+        return False
+
+
+def next_post(driver, limiter):
+    # 다음 버튼 클릭 (없으면 False)
+    try:
         next_button = WebDriverWait(driver, 5).until(
-            EC.element_to_be_clickable((By.XPATH, '//button[.//svg[@aria-label="다음"] or .//*[text()="다음"]]'))
+            EC.element_to_be_clickable((By.XPATH, NEXT_BUTTON_XPATH))
         )
-        next_button.click()
-        print("✅ 다음 게시물로 이동")
+    except TimeoutException:
+        return False
+    limiter.acquire()
+    next_button.click()
+    return True
+
+
+def post_key(shortcode, post):
+    # 중복 확인용 키: shortcode, URL에 shortcode가 없으면 작성자 + 업로드 시각 (둘 다 없으면 None)
+    if shortcode:
+        return shortcode
+    if post["username"] and post["upload_time"]:
+        return f"{post['username']}@{post['upload_time']}"
+    return None
+
+
+class Collection:
+    """
+    수집 결과 기록 (JSONL + 체크포인트, 여러 수집 스레드가 함께 사용)
+    체크포인트가 남아 있으면(중단된 수집) 이어서 수집하고, 이미 모은 게시물(shortcode)은 건너뜀
+    """
+
+    def __init__(self, meme_name, target=None, fresh=False):
+        self.meme_name = meme_name
+        self.target = target
+        self.output_path = jsonl_path_for(meme_name)
+        self.lock = threading.Lock()
+        self.collected = 0
+
+        checkpoint = None if fresh else load_checkpoint(meme_name)
+        if checkpoint and checkpoint.get("status") != "done" and self.output_path.exists():
+            resume_collection(self.output_path, checkpoint["offset"])
+            print(f"♻️  이어서 수집: 이미 {checkpoint['collected']}개 수집됨")
+        else:
+            # 게시물을 하나 모을 때마다 JSONL 뒤에 바로 기록 (중간에 멈춰도 모은 게시물은 남음)
+            start_collection(self.output_path)
+            checkpoint = {"meme_name": meme_name, "collected": 0, "seen": [], "offset": 0}
+        checkpoint["status"] = "running"
+        checkpoint.setdefault("queue", [])
+        self.checkpoint = checkpoint
+        self.seen = set(checkpoint["seen"])
+
+        self.save_html_dir = Path(os.environ[SAVE_HTML_ENV]) if os.environ.get(SAVE_HTML_ENV) else None
+        if self.save_html_dir:
+            self.save_html_dir.mkdir(parents=True, exist_ok=True)
+
+    def reached_target(self):
+        return self.target is not None and self.checkpoint["collected"] >= self.target
 
-    except Exception:
-        print("📍 더 이상 다음 게시물이 없습니다.")
-        break
+    def is_seen(self, shortcode):
+        return shortcode is not None and shortcode in self.seen
+
+    def add(self, shortcode, page_source):
+        """게시물 창 HTML을 파싱해 기록 (목표에 도달했거나 이미 수집한 게시물이면 False)"""
+        # 게시물 창 HTML → 게시물 dict (파싱 규칙은 post_parser.py, 잠금 밖에서 파싱)
+        post = parse_post(page_source, shortcode)
+        key = post_key(shortcode, post)
+        if key is None:
+            # 이어서 수집할 때 중복을 가릴 수 없는 게시물은 기록하지 않음
+            print("⚠️  shortcode/작성자/업로드 시각을 찾을 수 없어 건너뜀")
+            return False
+        with self.lock:
+            if self.reached_target() or self.is_seen(key):
+                return False
+            if self.save_html_dir:
+                # 파서 조정/벤치마크용 HTML 저장 (benchmark_parser.py --fixtures)
+                (self.save_html_dir / f"{self.meme_name}_{self.checkpoint['collected']:05d}.html").write_text(page_source, encoding="utf-8")
+            append_posts(self.output_path, [post])
+
+            # 기록한 게시물까지 체크포인트 (다음 실행은 이 위치부터)
+            self.seen.add(key)
+            self.checkpoint["seen"].append(key)
+            self.checkpoint["collected"] += 1
+            self.checkpoint["offset"] = self.output_path.stat().st_size
+            self.save()
+            self.collected += 1
+            return True
+
+    def add_to_queue(self, shortcodes):
+        # 링크 수집 결과를 대기열에 추가 (중복 제거, 체크포인트에 저장)
+        with self.lock:
+            known = set(self.checkpoint["queue"])
+            added = [code for code in shortcodes if code not in known]
+            self.checkpoint["queue"].extend(added)
+            if added:
+                self.save()
+            return len(added)
+
+    def pending(self):
+        # 대기열에서 아직 수집하지 않은 게시물
+        return [code for code in self.checkpoint["queue"] if code not in self.seen]
+
+    def save(self, done=False):
+        if done:
+            self.checkpoint["status"] = "done"
+        self.checkpoint["updated_at"] = datetime.now().isoformat()
+        save_checkpoint(self.meme_name, self.checkpoint)
+
+
+def collect_modal(driver, limiter, collection, meme_name, deadline=None, unattended=False):
+    # 게시물 창의 다음 버튼을 따라가며 수집 (게시물이 더 없으면 True)
+    if not open_first_post(driver, limiter, meme_name):
+        return False
+    while True:
+        if collection.reached_target():
+            print(f"🎯 목표 {collection.target}개 도달")
+            return True
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        try:
+            shortcode = shortcode_from_url(driver.current_url)
+            if not collection.is_seen(shortcode):
+                collection.add(shortcode, driver.page_source)
+                if not unattended:
+                    input("넘어가기")
+
+            # 다음 버튼 클릭 (이미 수집한 게시물은 파싱 없이 넘어감)
+            if not next_post(driver, limiter):
+                print("📍 더 이상 다음 게시물이 없습니다.")
+                return True
+            print("✅ 다음 게시물로 이동")
+
+        except Exception as e:
+            print("📍 게시물 수집 중단:", e)
+            return False
+
+
+def harvest_permalinks(driver, limiter, collection, meme_name, deadline=None):
+    """
+    1단계: 해시태그 격자를 스크롤하며 게시물 링크를 대기열에 모음
+    (대기열에 남은 게시물이 목표 수를 채우거나, 새 링크 없이 IDLE_SCROLLS번 스크롤하면 종료)
+    격자 끝까지 모은 대기열은 체크포인트에 harvested로 표시 (이어서 수집할 때 다시 스크롤하지 않음)
+    """
+    if collection.checkpoint.get("harvested"):
+        print(f"🔗 저장된 게시물 링크 사용 (수집 대기 {len(collection.pending())}개)")
+        return
+    limiter.acquire()
+    driver.get(search_url(meme_name))
+    known = set(collection.checkpoint["queue"])
+    idle = 0
+    while idle < IDLE_SCROLLS:
+        # 격자는 화면 밖 행을 지우기도 하므로 스크롤마다 현재 HTML에서 링크를 읽음
+        added = collection.add_to_queue(parse_permalinks(driver.page_source))
+        known.update(collection.checkpoint["queue"])
+        idle = 0 if added else idle + 1
+
+        remaining = None if collection.target is None else collection.target - collection.checkpoint["collected"]
+        if remaining is not None and len(collection.pending()) >= remaining:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+
+        limiter.acquire()
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, SCROLL_WAIT).until(
+                lambda d: any(code not in known for code in parse_permalinks(d.page_source))
+            )
+        except TimeoutException:
+            pass
+    else:
+        collection.checkpoint["harvested"] = True
+        collection.save()
+    print(f"🔗 게시물 링크 {len(collection.checkpoint['queue'])}개 (수집 대기 {len(collection.pending())}개)")
+
+
+def fetch_posts(drivers, limiter, collection, deadline=None):
+    """
+    2단계: 대기열의 게시물 페이지를 브라우저 여러 개로 동시에 열어 수집
+    요청 간격은 공유 토큰 버킷이 제어하므로 브라우저 수를 늘려도 예산을 넘지 않음
+    (페이지 로딩 대기가 겹쳐서 처리량이 브라우저 수에 비례해 늘어남, 예산이 상한)
+    """
+    jobs = queue.Queue()
+    for code in collection.pending():
+        jobs.put(code)
+    failed = []
+
+    def worker(driver):
+        while not collection.reached_target():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            try:
+                code = jobs.get_nowait()
+            except queue.Empty:
+                return
+            limiter.acquire()
+            try:
+                driver.get(permalink_url(code))
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "time[datetime], script[type='application/json']"))
+                )
+                collection.add(code, driver.page_source)
+            except Exception as e:
+                # 실패한 게시물은 체크포인트에 남지 않으므로 다음 실행에서 다시 시도
+                print(f"⚠️  {code} 수집 실패: {e}")
+                failed.append(code)
+
+    with ThreadPoolExecutor(max_workers=len(drivers)) as pool:
+        list(pool.map(worker, drivers))
+    return failed
+
+
+def collect(meme_name, unattended=False, target=None, time_budget=None, profile_dir=None, fresh=False,
+            mode="modal", workers=DEFAULT_WORKERS):
+    """
+    게시물마다 JSONL 뒤에 기록하고 체크포인트 저장 (중단되면 다음 실행에서 이어서 수집)
+    mode: modal (게시물 창의 다음 버튼을 따라가며 하나씩)
+          permalinks (격자에서 게시물 링크를 모은 뒤 브라우저 workers개로 동시에 수집)
+    target: 목표 게시물 수 (이어서 수집한 것 포함, None이면 대화형 3개 / 무인 수집은 게시물이 없을 때까지)
+    time_budget: 이번 실행의 수집 시간 제한 (초)
+    """
+    if target is None and not unattended:
+        target = INTERACTIVE_TARGET
+    collection = Collection(meme_name, target, fresh)
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+
+    # 요청 간격은 모든 수집 프로세스(와 스레드)가 공유하는 토큰 버킷으로 제어
+    limiter = RateLimiter("instagram")
+    drivers = [make_driver(profile_dir)]
+    finished = False
+    try:
+        login(drivers[0], limiter, unattended)
+        if mode == "permalinks":
+            harvest_permalinks(drivers[0], limiter, collection, meme_name, deadline)
+            # 브라우저는 남은 게시물 수만큼만 추가 (로그인한 첫 브라우저도 수집에 사용)
+            for _ in range(min(max(1, workers), len(collection.pending())) - 1):
+                drivers.append(make_driver())
+                share_session(drivers[0], drivers[-1], limiter)
+            failed = fetch_posts(drivers, limiter, collection, deadline)
+            finished = collection.reached_target() or not collection.pending()
+            if failed:
+                print(f"⚠️  {len(failed)}개 게시물 수집 실패 (다음 실행에서 다시 시도)")
+        else:
+            finished = collect_modal(drivers[0], limiter, collection, meme_name, deadline, unattended)
+        if deadline is not None and time.monotonic() >= deadline and not finished:
+            print(f"⏱️  시간 제한 {time_budget:.0f}초 도달 (다음 실행에서 이어서 수집)")
+    finally:
+        if finished:
+            collection.save(done=True)
+        print(f"💾 {collection.collected}개 게시물 저장 (누적 {collection.checkpoint['collected']}개): {collection.output_path}")
+        if not unattended:
+            input("\n👋 Enter를 누르면 브라우저를 종료합니다...")
+        for driver in drivers:
+            driver.quit()
+    return collection.checkpoint["collected"]
 
-# 결과 저장
-Path("data/analysis").mkdir(parents=True, exist_ok=True)
-with open(f"data/raw/{meme_name}_instagram.json", "w", encoding="utf-8") as f:
-    json.dump(all_data, f, ensure_ascii=False, indent=2)
 
-input("\n👋 Enter를 누르면 브라우저를 종료합니다...")
-driver.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    options = collection_options()
+    collect(meme_name_from_user(), unattended=options.unattended, target=options.target,
+            time_budget=options.time_budget, profile_dir=options.profile, fresh=options.fresh,
+            mode=options.mode, workers=options.workers)
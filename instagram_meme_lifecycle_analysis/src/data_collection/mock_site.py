@@ -0,0 +1,168 @@
+"""
+Instagram 수집기 시험용 로컬 모의 사이트 (실제 계정/네트워크 없이 수집 흐름 확인)
+- /accounts/login/: 아이디/비밀번호 입력창 (제출하면 홈으로 이동)
+- /explore/search/keyword/?q=...: 썸네일 격자 (아래로 스크롤하면 다음 페이지를 이어 붙임)
+- /p/<shortcode>/: 게시물 창 (post_parser.py가 읽는 class + 포함된 JSON + 다음 버튼)
+게시물 내용은 번호로 정해지므로(post_data) 수집 결과를 그대로 비교 가능
+
+사용법:
+    python src/data_collection/mock_site.py --port 8780 --posts 300 --latency 0.3
+    MEME_INSTAGRAM_BASE_URL=http://127.0.0.1:8780 \\
+        python src/data_collection/instagram.py --meme 킹받네 --unattended --mode permalinks --workers 4
+"""
+from datetime import datetime, timedelta, timezone
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
+import argparse, json, random, sys, time
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(BASE_DIR))
+from config.settings import SRC_DIR
+
+sys.path.append(str(SRC_DIR))
+from data_collection.post_parser import LIKE_CLASS, CAPTION_CLASS, USER_CLASS
+
+DEFAULT_PORT = 8780  # orchestration/daemon.py(8765)와 겹치지 않게
+DEFAULT_POSTS = 300
+DEFAULT_PAGE_SIZE = 24
+
+WORDS = ["킹받네", "진짜", "오늘도", "ㅋㅋㅋㅋ", "챌린지", "밈", "레전드", "웃김", "킹받내", "실화냐"]
+FIRST_DAY = datetime(2025, 4, 1, tzinfo=timezone.utc)
+
+
+def shortcode_for(index):
+    return f"mock{index:07d}"
+
+def post_data(index):
+    # 게시물 번호 → 수집기가 저장해야 하는 게시물 dict
+    rnd = random.Random(index)
+    # 앞쪽 게시물일수록 최근 (격자는 최신순, 하루 5개)
+    uploaded = FIRST_DAY + timedelta(days=60 - index // 5 % 61, minutes=rnd.randrange(24 * 60))
+    return {
+        "username": f"mock_user_{rnd.randrange(500)}",
+        "upload_time": uploaded.strftime("%Y-%m-%dT%H:%M:00.000Z"),
+        "likes": rnd.randrange(5000),
+        "caption": " ".join(rnd.choice(WORDS) for _ in range(rnd.randrange(2, 8))),
+    }
+
+
+def _thumbnails(start, end):
+    return "\n".join(
+        f'<div class="x1lliihq"><a href="/p/{shortcode_for(i)}/" role="link">'
+        f'<div class="_aagu"><div class="_aagw"></div></div></a></div>'
+        for i in range(start, end)
+    )
+
+def grid_page(posts, page_size):
+    # 스크롤이 끝에 가까워지면 /grid?page=N을 불러와 이어 붙임 (Instagram 무한 스크롤 흉내)
+    return f'''<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>Instagram (mock)</title>
+<style>._aagw {{ width: 300px; height: 300px; background: #ddd; display: inline-block; }}</style></head>
+<body><main role="main"><div id="grid">{_thumbnails(0, min(page_size, posts))}</div></main>
+<script>
+let page = 1, loading = false;
+window.addEventListener("scroll", () => {{
+  if (loading || window.innerHeight + window.scrollY < document.body.scrollHeight - 200) return;
+  loading = true;
+  fetch(`/grid?page=${{page}}`).then(r => r.text()).then(html => {{
+    if (html) {{ document.getElementById("grid").insertAdjacentHTML("beforeend", html); page += 1; }}
+    loading = false;
+  }});
+}});
+</script></body></html>'''
+
+def post_page(index, posts):
+    post = post_data(index)
+    code = shortcode_for(index)
+    taken_at = int(datetime.strptime(post["upload_time"], "%Y-%m-%dT%H:%M:%S.000Z").replace(tzinfo=timezone.utc).timestamp())
+    embedded = {"items": [{"code": code, "taken_at": taken_at, "like_count": post["likes"],
+                           "caption": {"text": post["caption"]}, "user": {"username": post["username"]}}]}
+    next_button = (f'<button type="button" onclick="location.href=\'/p/{shortcode_for(index + 1)}/\'">'
+                   f'<svg aria-label="다음"><title>다음</title></svg></button>') if index + 1 < posts else ""
+    return f'''<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>Instagram (mock)</title>
+<script type="application/json">{json.dumps(embedded, ensure_ascii=False)}</script></head>
+<body><div role="dialog"><article>
+<header><a class="{USER_CLASS}" href="/{post["username"]}/">{post["username"]}</a></header>
+<h1 class="{CAPTION_CLASS}">{escape(post["caption"])}</h1>
+<time datetime="{post["upload_time"]}">{post["upload_time"][:10]}</time>
+<section>좋아요 <span class="{LIKE_CLASS}">{post["likes"]:,}</span>개</section>
+{next_button}
+</article></div></body></html>'''
+
+LOGIN_PAGE = '''<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>Login (mock)</title></head>
+<body><form action="/" method="post">
+<input name="username"><input name="password" type="password"><button type="submit">로그인</button>
+</form></body></html>'''
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    posts = DEFAULT_POSTS
+    page_size = DEFAULT_PAGE_SIZE
+    latency = 0.0
+
+    def _send(self, body, status=200):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        if url.path.startswith("/accounts/login"):
+            self._send(LOGIN_PAGE)
+        elif url.path.startswith("/explore/search/keyword"):
+            self._send(grid_page(self.posts, self.page_size))
+        elif url.path == "/grid":
+            page = int(parse_qs(url.query).get("page", ["1"])[0])
+            start = page * self.page_size
+            self._send(_thumbnails(start, min(start + self.page_size, self.posts)))
+        elif len(parts) == 2 and parts[0] == "p" and parts[1].startswith("mock"):
+            index = int(parts[1][4:])
+            if not 0 <= index < self.posts:
+                self._send("not found", 404)
+                return
+            # 게시물 페이지 로딩 시간 흉내
+            time.sleep(self.latency)
+            self._send(post_page(index, self.posts))
+        else:
+            self._send('<!DOCTYPE html><html><body><main role="main">home (mock)</main></body></html>')
+
+    def do_POST(self):
+        # 로그인 제출 → 홈으로
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(303)
+        self.send_header("Location", "/")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(port=DEFAULT_PORT, posts=DEFAULT_POSTS, latency=0.0, page_size=DEFAULT_PAGE_SIZE):
+    # 설정별 핸들러 클래스 (같은 프로세스에서 서버를 여러 개 띄워도 설정이 섞이지 않도록)
+    handler = type("ConfiguredMockHandler", (MockHandler,),
+                   {"posts": posts, "latency": latency, "page_size": page_size})
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Instagram 수집기 시험용 로컬 모의 사이트")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--posts", type=int, default=DEFAULT_POSTS, help="게시물 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="게시물 페이지 응답 지연 (초)")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="스크롤 한 번에 추가되는 썸네일 수")
+    args = parser.parse_args()
+
+    server = make_server(args.port, args.posts, args.latency, args.page_size)
+    print(f"🧪 모의 사이트: http://127.0.0.1:{args.port} (게시물 {args.posts}개, 지연 {args.latency}초)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,134 @@
+"""
+Instagram 게시물 창 HTML → 게시물 dict (브라우저 없이 저장된 HTML로도 동작)
+수집기(instagram.py)가 driver.page_source를 넘겨 호출
+
+- lxml로 한 번 파싱하고, 필드별 XPath는 모듈 로딩 시 한 번만 컴파일
+  (예전 방식: BeautifulSoup html.parser로 매번 파싱 + 모든 span/h1/a의 class를 이어 붙여 비교)
+- class 비교는 예전과 같이 class 목록 전체가 같은 태그 (normalize-space(@class) == 목록)
+- 화면에서 못 찾은 필드는 페이지에 포함된 JSON(<script type="application/json">)의
+  게시물 데이터(taken_at, like_count, caption.text, user.username)로 채움
+  (Instagram이 class 이름을 바꿔도 수집이 계속되도록)
+- parse_permalinks(): 해시태그 격자 HTML → 게시물 shortcode 목록 (permalinks 수집 모드)
+"""
+from datetime import datetime, timezone
+import json
+
+from lxml import etree, html as lxml_html
+
+# 화면 요소 class (Instagram 웹 UI 기준)
+LIKE_CLASS = "html-span xdj266r x11i5rnm xat24cr x1mh8g0r xexx8yu x4uap5 x18d9i69 xkhd6sd x1hl2dhg x16tdsg8 x1vvkbs"
+CAPTION_CLASS = "_ap3a _aaco _aacu _aacx _aad7 _aade"
+USER_CLASS = "x1i10hfl xjbqb8w x1ejq31n xd10rxx x1sy0etr x17r0tee x972fbf xcfux6l x1qhh985 xm0m39n x9f619 x1ypdohk xt0psk2 xe8uvvx xdj266r x11i5rnm xat24cr x1mh8g0r xexx8yu x4uap5 x18d9i69 xkhd6sd x16tdsg8 x1hl2dhg xggy1nq x1a2a7pz _aswp _aswq _aswv _aswz _asw_ _asx2 _a6hd"
+
+def _first_with_class(tag, class_list):
+    return etree.XPath(f'(//{tag}[normalize-space(@class)="{class_list}"])[1]')
+
+TIME_XPATH = etree.XPath("(//time[@datetime])[1]/@datetime")
+LIKE_XPATH = _first_with_class("span", LIKE_CLASS)
+CAPTION_XPATH = _first_with_class("h1", CAPTION_CLASS)
+USER_XPATH = _first_with_class("a", USER_CLASS)
+# 게시물 데이터가 들어 있는 JSON만 (다른 script는 파싱하지 않음)
+EMBEDDED_JSON_XPATH = etree.XPath('//script[@type="application/json"][contains(., "taken_at")]/text()')
+# 격자의 게시물 링크 (/p/<shortcode>/, /reel/<shortcode>/)
+PERMALINK_XPATH = etree.XPath('//a[contains(@href, "/p/") or contains(@href, "/reel/")]/@href')
+
+FIELDS = ["username", "upload_time", "likes", "caption"]
+
+
+def _text(element, separator=""):
+    # BeautifulSoup get_text(separator, strip=True)와 같은 규칙
+    return separator.join(part.strip() for part in element.itertext() if part.strip())
+
+def _likes(text):
+    try:
+        return int(text.replace(",", ""))
+    except ValueError:
+        return 0
+
+def parse_dom(root):
+    """화면 요소에서 찾은 필드만 dict로 (못 찾은 필드는 없음)"""
+    post = {}
+    post_time = TIME_XPATH(root)
+    if post_time:
+        post["upload_time"] = str(post_time[0])
+    like_tag = LIKE_XPATH(root)
+    if like_tag:
+        post["likes"] = _likes(_text(like_tag[0]))
+    caption_tag = CAPTION_XPATH(root)
+    if caption_tag:
+        post["caption"] = _text(caption_tag[0], separator=" ")
+    user_tag = USER_XPATH(root)
+    if user_tag:
+        post["username"] = _text(user_tag[0])
+    return post
+
+
+def _find_media(node, shortcode=None):
+    # JSON 트리에서 게시물 데이터(taken_at이 있는 dict) 찾기 (shortcode가 있으면 그 게시물만)
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "taken_at" in node and (shortcode is None or node.get("code") == shortcode):
+                return node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return None
+
+def parse_embedded(root, shortcode=None):
+    """페이지에 포함된 JSON의 게시물 데이터 → 필드 dict (없으면 빈 dict)"""
+    for text in EMBEDDED_JSON_XPATH(root):
+        try:
+            media = _find_media(json.loads(text), shortcode)
+        except ValueError:
+            continue
+        if media is None:
+            continue
+
+        post = {}
+        if media.get("taken_at"):
+            taken_at = datetime.fromtimestamp(int(media["taken_at"]), timezone.utc)
+            post["upload_time"] = taken_at.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        if media.get("like_count") is not None:
+            post["likes"] = int(media["like_count"])
+        caption = media.get("caption")
+        if isinstance(caption, dict) and caption.get("text") is not None:
+            post["caption"] = " ".join(caption["text"].split())
+        user = media.get("user") or media.get("owner")
+        if isinstance(user, dict) and user.get("username"):
+            post["username"] = user["username"]
+        return post
+    return {}
+
+
+def parse_post(page_source, shortcode=None):
+    """
+    게시물 창 HTML → {"username", "upload_time", "likes", "caption"}
+    shortcode: 현재 게시물 URL의 /p/<shortcode>/ (포함된 JSON에 여러 게시물이 있을 때 구분용)
+    """
+    root = lxml_html.fromstring(page_source)
+    post = parse_dom(root)
+    if len(post) < len(FIELDS):
+        for field, value in parse_embedded(root, shortcode).items():
+            post.setdefault(field, value)
+    return {
+        "username": post.get("username", ""),
+        "upload_time": post.get("upload_time", ""),
+        "likes": post.get("likes", 0),
+        "caption": post.get("caption", ""),
+    }
+
+def shortcode_from_url(url):
+    # https://www.instagram.com/p/<shortcode>/ → shortcode (게시물 URL이 아니면 None)
+    parts = [part for part in url.split("?")[0].split("/") if part]
+    for marker in ("p", "reel"):
+        if marker in parts and parts.index(marker) + 1 < len(parts):
+            return parts[parts.index(marker) + 1]
+    return None
+
+def parse_permalinks(page_source):
+    """격자 HTML → 게시물 shortcode 목록 (페이지 순서, 중복 제거)"""
+    root = lxml_html.fromstring(page_source)
+    shortcodes = (shortcode_from_url(str(href)) for href in PERMALINK_XPATH(root))
+    return list(dict.fromkeys(code for code in shortcodes if code))
@@ -1,43 +1,35 @@
 from pathlib import Path
-import json
 import pandas as pd
 import sys, re, string
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import DATA_DIR, SRC_DIR
+from config.settings import DATA_DIR, SRC_DIR, ROOT_DIR
 
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
+from utils.token_store import write_arrays, files as token_files
+from utils.hangul import decompose_captions, assign_word_ids
+from utils.raw_posts import raw_path_for, iter_batches, load_posts
 
-# 데이터 파일 경로
-meme_name = meme_name_from_user()
-filename_before = f"{meme_name}_instagram.json"
-filename_after = f"{meme_name}_instagram.csv"
-input_path = DATA_DIR / "raw" / filename_before
-output_path = DATA_DIR / "preprocessed" / filename_after
-output_path.parent.mkdir(parents=True, exist_ok=True)
-
-# 파일 로드
-with open(input_path, "r", encoding="utf-8") as f:
-    data = json.load(f)
-
-# JSON 데이터 로드
-df = pd.read_json(input_path)
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+from orchestration.runs import atomic_path
 
-# 작업 1 - 날짜 처리
-df["upload_time"] = pd.to_datetime(df["upload_time"])
+# 데이터 파일 경로
+def input_path_for(meme_name):
+    # 수집 원본 (JSONL, 없으면 예전 형식 JSON) (utils/raw_posts.py)
+    return raw_path_for(meme_name)
 
-# 작업 2 - 결측치 처리
-df = df.dropna(subset=["likes"])
+def output_path_for(meme_name):
+    return DATA_DIR / "preprocessed" / f"{meme_name}_instagram.csv"
 
-# 작업 3 - 파생 변수 생성
-df["year"] = df["upload_time"].dt.year
-df["month"] = df["upload_time"].dt.month
-df["day"] = df["upload_time"].dt.day
-df["weekday"] = df["upload_time"].dt.day_name()
+def tokens_path_for(meme_name):
+    # caption 토큰은 CSV 대신 바이너리 토큰 저장소에 저장 (utils/token_store.py)
+    return DATA_DIR / "preprocessed" / f"{meme_name}_instagram_tokens"
 
-# 작업 4 - caption 토큰화
+# caption 토큰화용 자모 테이블
+# (아래 문자 단위 함수는 참조 구현, 전처리는 같은 규칙의 utils/hangul.py 배열 연산 사용)
 CHO = ["ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
        "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
 JUNG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ",
@@ -99,8 +91,74 @@ def compress_decompose(text):
 
     return result
 
-df["caption_tokens"] = df["caption"].apply(compress_decompose)
-df.drop(columns=["caption"], inplace=True)
-
-# 결과 저장
-df.to_csv(output_path, index=False, encoding="utf-8-sig")
\ No newline at end of file
+def load_raw(meme_name):
+    # 수집 원본 전체 로드 (전처리는 iter_batches()로 나눠 읽음)
+    return load_posts(input_path_for(meme_name))
+
+def preprocess_posts(df):
+    # 수집 원본 DataFrame → (전처리 DataFrame, caption 토큰 배열) (입력은 변경하지 않음)
+    df = df.copy()
+
+    # 작업 1 - 날짜 처리
+    df["upload_time"] = pd.to_datetime(df["upload_time"])
+
+    # 작업 2 - 결측치 처리 (배치마다 결측치 유무가 달라도 같은 형식으로 저장되도록 정수로 통일)
+    df = df.dropna(subset=["likes"])
+    df["likes"] = df["likes"].astype("int64")
+
+    # 작업 3 - 파생 변수 생성
+    df["year"] = df["upload_time"].dt.year
+    df["month"] = df["upload_time"].dt.month
+    df["day"] = df["upload_time"].dt.day
+    df["weekday"] = df["upload_time"].dt.day_name()
+
+    # 작업 4 - caption 토큰화 (전체 caption을 한 번에 분해, 게시물 순서 = 행 순서)
+    # 같은 caption은 한 번만 분해
+    tokens = decompose_captions(df["caption"])
+    df.drop(columns=["caption"], inplace=True)
+    return df, tokens
+
+def run_preprocessing(meme_name, raw_df=None, batch_rows=None):
+    # 수집 원본 → 전처리 CSV + 토큰 저장소 저장
+    # raw_df가 있으면 전처리 DataFrame(caption 제외)을 반환
+    # raw_df가 없으면 원본 파일을 batch_rows행씩 읽어 배치마다 전처리 결과를 이어서 기록하고 전처리 CSV 경로 반환
+    # (단계 캐시는 None/False 반환을 실패로 보고 저장하지 않으므로 경로를 반환)
+    # (원본, caption, 전처리 결과 모두 배치 하나씩만 메모리에 올림 → 다음 단계는 CSV를 읽음)
+    output_path = output_path_for(meme_name)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with trace.stage("preprocessing", platform="instagram", meme=meme_name) as t:
+        batches = [raw_df] if raw_df is not None else iter_batches(input_path_for(meme_name), batch_rows)
+        tokens_path = tokens_path_for(meme_name)
+        # 단어 → 번호 (배치 사이에 공유, 토큰 저장소에 단어 번호와 함께 저장 → 키워드 추출이 재사용)
+        vocabulary = {}
+        n_tokens = 0
+
+        # 결과 저장 (토큰 저장소의 게시물 순서 = CSV 행 순서)
+        n_batches = rows_in = rows_out = 0
+        df = None
+        with atomic_path(output_path) as tmp_path:
+            for i, batch in enumerate(batches):
+                rows_in += len(batch)
+                df, tokens = preprocess_posts(batch)
+                tokens["word_ids"], added = assign_word_ids(tokens, vocabulary)
+                n_tokens += len(tokens["word_ids"])
+                write_arrays(tokens_path, tokens, append=i > 0, words=added)
+                df.to_csv(tmp_path, index=False, encoding="utf-8-sig" if i == 0 else "utf-8",
+                          mode="w" if i == 0 else "a", header=i == 0)
+                rows_out += len(df)
+                n_batches += 1
+            if n_batches == 0:
+                # 빈 원본: 헤더만 있는 CSV와 빈 토큰 저장소
+                df, tokens = preprocess_posts(pd.DataFrame(columns=["username", "upload_time", "likes", "caption"]))
+                tokens["word_ids"], added = assign_word_ids(tokens, vocabulary)
+                write_arrays(tokens_path, tokens, words=added)
+                df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+
+        t.set(rows_in=rows_in, rows_out=rows_out, batches=max(n_batches, 1),
+              tokens=n_tokens, words=len(vocabulary))
+        t.output(output_path, *token_files(tokens_path))
+    return df if raw_df is not None else output_path
+
+if __name__ == "__main__":
+    run_preprocessing(meme_name_from_user())
@@ -0,0 +1,83 @@
+from pathlib import Path
+import os, sys
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(BASE_DIR))
+from config.settings import DATA_DIR, RESULTS_DIR, SRC_DIR, ROOT_DIR
+
+sys.path.append(str(ROOT_DIR))
+from orchestration.stage_cache import StageCache
+
+sys.path.append(str(SRC_DIR))
+from utils import token_store, raw_posts
+
+SETTINGS_PATH = BASE_DIR / "config" / "settings.py"
+
+# 스크립트별 (추적 단계 이름, 입력 파일, 결과 파일)
+def stage_files(relative_path, meme_name):
+    raw = raw_posts.raw_path_for(meme_name)
+    preprocessed = DATA_DIR / "preprocessed" / f"{meme_name}_instagram.csv"
+    tokens = token_store.files(DATA_DIR / "preprocessed" / f"{meme_name}_instagram_tokens")
+    analysis = DATA_DIR / "analysis" / meme_name
+    results = RESULTS_DIR / meme_name
+
+    engagement_csv = [analysis / "engagement" / f"{meme_name}_{name}.csv"
+                      for name in ["likes_cleaned", "weekly_likes", "weekday_likes"]]
+    keywords_csv = analysis / "keywords" / f"{meme_name}_keywords.csv"
+    keyword_groups_csv = analysis / "keywords" / f"{meme_name}_keyword_groups.csv"
+    lifecycle_csv = analysis / "lifecycle" / f"{meme_name}_lifecycle.csv"
+    lifecycle_state = analysis / "lifecycle" / f"{meme_name}_lifecycle_state.json"
+
+    specs = {
+        "preprocessing/instagram.py": ("preprocessing", [raw], [preprocessed] + tokens),
+        "analysis/engagement.py": ("analysis:engagement", [preprocessed], engagement_csv),
+        "analysis/keywords.py": ("analysis:keywords", tokens, [keywords_csv, keyword_groups_csv]),
+        "analysis/lifecycle.py": ("analysis:lifecycle", [preprocessed], [lifecycle_csv, lifecycle_state]),
+        "visualization/engagement_dashboard.py": ("visualization:engagement", engagement_csv, [
+            results / "engagement" / "visualization" / f"{meme_name}_{name}.png"
+            for name in ["like_distribution", "weekly_likes", "weekday_likes"]
+        ] + [results / "engagement" / f"{meme_name}_dashboard.png"]),
+        "visualization/keywords_dashboard.py": ("visualization:keywords", [keywords_csv], [
+            results / "keywords" / "visualization" / f"{meme_name}_{name}.png"
+            for name in ["bar_chart", "wordcloud", "keyword_network"]
+        ] + [results / "keywords" / f"{meme_name}_dashboard.png"]),
+        "visualization/lifecycle_dashboard.py": ("visualization:lifecycle", [lifecycle_csv], [
+            results / "lifecycle" / "visualization" / f"{meme_name}_{name}.png"
+            for name in ["daily_trend", "cumulative_trend"]
+        ] + [results / "lifecycle" / f"{meme_name}_lifecycle.png"]),
+    }
+    return specs.get(relative_path)
+
+# 결과에 영향을 주는 환경 변수 (캐시 키 파라미터에 포함)
+STAGE_ENV = {
+    "analysis/keywords.py": ["MEME_KEYWORD_MODE", "MEME_KEYWORD_TOPK", "MEME_KEYWORD_CHUNK_POSTS"],
+}
+
+# 스크립트가 import하는 결과 관련 보조 모듈 (코드 버전에 포함, SRC_DIR 기준)
+STAGE_CODE = {
+    "preprocessing/instagram.py": ["utils/hangul.py", "utils/token_store.py", "utils/raw_posts.py"],
+    "analysis/keywords.py": ["utils/hangul.py", "utils/token_store.py", "utils/topk.py", "utils/variants.py"],
+}
+
+_cache = None
+
+def run_cached(relative_path, meme_name, runner):
+    # 입력/코드/밈 이름이 이전 실행과 같으면 결과 파일만 복원하고 스크립트 실행 생략
+    global _cache
+    spec = stage_files(relative_path, meme_name)
+    if spec is None:
+        return runner(relative_path)
+
+    if _cache is None:
+        _cache = StageCache()
+
+    stage, inputs, outputs = spec
+    result, _ = _cache.run(
+        stage, lambda: runner(relative_path),
+        inputs=inputs, outputs=outputs,
+        params={"meme": meme_name, "script": relative_path,
+                "env": {name: os.environ.get(name) for name in STAGE_ENV.get(relative_path, [])}},
+        code=[SRC_DIR / path for path in [relative_path] + STAGE_CODE.get(relative_path, [])] + [SETTINGS_PATH],
+        platform="instagram", meme=meme_name,
+    )
+    return result
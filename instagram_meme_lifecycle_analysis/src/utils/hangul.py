@@ -0,0 +1,349 @@
+"""
+한글 자모 분해/조합 엔진 (NumPy 정수 연산)
+preprocessing/instagram.py의 compress_decompose()와 analysis/keywords.py의 combine_units()를
+문자 단위 파이썬 반복 대신 전체 caption을 하나의 코드 포인트 배열로 만들어 한 번에 처리
+
+- decompose_captions(): caption 목록 → 토큰 저장소 배열 (utils/token_store.py 형식)
+  compress_decompose()와 같은 토큰/단위/순서를 만듦
+- recompose(): 토큰 저장소 배열 → 토큰별 단어 (combine_units()와 같은 결과)
+- count_words(): 단어별 빈도 (단어가 처음 나온 순서 유지)
+- assign_word_ids(): 토큰별 단어 번호 (전처리가 토큰 저장소에 함께 저장 → 키워드 추출은 다시 조합하지 않고 번호만 셈)
+- 같은 caption은 한 호출 안에서 한 번만 분해, 같은 단어는 해시로 묶어 한 번만 문자열로 변환
+"""
+from collections import Counter
+
+import numpy as np
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+COMPAT_CONSONANT_FIRST = 0x3131  # ㄱ
+COMPAT_CONSONANT_LAST = 0x314E   # ㅎ
+COMPAT_LAST = 0x3163             # ㅣ
+
+CHO = ["ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+       "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+JUNG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ",
+        "ㅙ", "ㅚ", "ㅛ", "ㅜ", "ㅝ", "ㅞ", "ㅟ", "ㅠ", "ㅡ", "ㅢ", "ㅣ"]
+JONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ",
+        "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ",
+        "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 단위 종류 코드 (token_store.UNIT_KINDS 순서)
+ENG, KIND_CHO, KIND_JUNG, KIND_JONG = 0, 1, 2, 3
+
+# 자모 인덱스 → 호환 자모 코드 포인트
+CHO_CODES = np.array([ord(c) for c in CHO], dtype=np.int64)
+JUNG_CODES = np.array([ord(c) for c in JUNG], dtype=np.int64)
+JONG_CODES = np.array([ord(c) if c else 0 for c in JONG], dtype=np.int64)
+
+
+def _index_table(letters):
+    # 호환 자모 코드 포인트 → 자모 인덱스 (없으면 -1)
+    table = np.full(COMPAT_LAST - COMPAT_CONSONANT_FIRST + 1, -1, dtype=np.int64)
+    for i, letter in enumerate(letters):
+        if letter:
+            table[ord(letter) - COMPAT_CONSONANT_FIRST] = i
+    return table
+
+CHO_INDEX = _index_table(CHO)
+JUNG_INDEX = _index_table(JUNG)
+JONG_INDEX = _index_table(JONG)
+
+# str.isspace() 문자 (정규식 \s, str.split() 기준과 동일, 모두 U+3000 이하)
+WHITESPACE = np.array([c for c in range(0x3001) if chr(c).isspace()], dtype=np.int64)
+
+
+def _code_points(texts):
+    # 문자열 목록 → 하나의 코드 포인트 배열 + 문자별 게시물 번호 (게시물 사이에 공백 삽입)
+    texts = [str(text) for text in texts]
+    joined = "".join(text + "\n" for text in texts)
+    codes = np.frombuffer(joined.encode("utf-32-le", "surrogatepass"), dtype=np.uint32).astype(np.int64)
+    lengths = np.array([len(text) + 1 for text in texts], dtype=np.int64)
+    posts = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+    return codes, posts
+
+
+def _shift(mask, fill, forward):
+    # 이전(forward=False) / 다음(forward=True) 문자의 값
+    if forward:
+        return np.concatenate([mask[1:], [fill]])
+    return np.concatenate([[fill], mask[:-1]])
+
+
+def _starts(ends):
+    return np.concatenate([[0], ends[:-1]]).astype(np.int64)
+
+
+def _ranges(starts, lengths):
+    # 구간 [start, start + length) 들을 이어 붙인 인덱스
+    ends = np.cumsum(lengths)
+    total = int(ends[-1]) if len(ends) else 0
+    return np.repeat(starts - (ends - lengths), lengths) + np.arange(total, dtype=np.int64)
+
+
+def take_posts(arrays, posts):
+    """토큰 저장소 배열에서 게시물 번호 순서대로 게시물을 모은 배열 (중복 가능)"""
+    posts = np.asarray(posts, dtype=np.int64)
+    post_ends = np.asarray(arrays["post_ends"], dtype=np.int64)
+    token_ends = np.asarray(arrays["token_ends"], dtype=np.int64)
+    unit_ends = np.asarray(arrays["unit_ends"], dtype=np.int64)
+
+    post_start = _starts(post_ends)[posts]
+    post_len = post_ends[posts] - post_start
+    tokens = _ranges(post_start, post_len)
+    token_start = _starts(token_ends)[tokens]
+    token_len = token_ends[tokens] - token_start
+    units = _ranges(token_start, token_len)
+    unit_start = _starts(unit_ends)[units]
+    unit_len = unit_ends[units] - unit_start
+    chars = _ranges(unit_start, unit_len)
+
+    return {
+        "chars": np.asarray(arrays["chars"])[chars].astype(np.int32),
+        "unit_kinds": np.asarray(arrays["unit_kinds"])[units].astype(np.int8),
+        "unit_ends": np.cumsum(unit_len).astype(np.int64),
+        "token_ends": np.cumsum(token_len).astype(np.int64),
+        "post_ends": np.cumsum(post_len).astype(np.int64),
+    }
+
+
+def decompose_captions(captions):
+    """
+    caption 목록 → 토큰 저장소 배열 (chars, unit_kinds, unit_ends, token_ends, post_ends)
+    compress_decompose()와 같은 규칙:
+      - 영문/숫자/완성형 한글/호환 자음/공백 이외 문자 제거 후 공백으로 단어 분리
+      - 연속된 영문 → ENG 토큰 (영문이 아닌 문자를 만나거나 단어가 끝날 때 추가)
+      - 호환 자음 → CHO 단위 하나짜리 토큰 (바로 추가)
+      - 단어 안의 완성형 한글 전체 → CHO/JUNG/JONG 단위를 이어 붙인 토큰 하나 (단어 끝에 추가)
+    같은 caption(리포스트, 해시태그 묶음 등)은 한 번만 분해한 뒤 게시물 순서로 펼침
+    """
+    texts = [str(caption) for caption in captions]
+
+    # 호출 안에서 중복 제거 (처음 나온 순서)
+    first = {}
+    inverse = [first.setdefault(text, len(first)) for text in texts]
+    arrays = _decompose(list(first))
+    if len(first) == len(texts):
+        return arrays
+    return take_posts(arrays, inverse)
+
+
+def _decompose(texts):
+    # decompose_captions()의 배열 연산 본체 (문자열 목록, 중복 제거 없음)
+    codes, posts = _code_points(texts)
+
+    is_ws = np.isin(codes, WHITESPACE)
+    is_letter = ((codes >= 0x41) & (codes <= 0x5A)) | ((codes >= 0x61) & (codes <= 0x7A))
+    is_digit = (codes >= 0x30) & (codes <= 0x39)
+    is_syl = (codes >= SYLLABLE_BASE) & (codes <= SYLLABLE_LAST)
+    is_cons = (codes >= COMPAT_CONSONANT_FIRST) & (codes <= COMPAT_CONSONANT_LAST)
+
+    # clean_text(): 남길 문자만 선택
+    keep = is_ws | is_letter | is_digit | is_syl | is_cons
+    codes, posts = codes[keep], posts[keep]
+    is_ws, is_letter, is_syl, is_cons = is_ws[keep], is_letter[keep], is_syl[keep], is_cons[keep]
+    index = np.arange(len(codes), dtype=np.int64)
+
+    # 단어 경계 (게시물 사이에는 항상 공백이 있음)
+    word_start = ~is_ws & _shift(is_ws, True, forward=False)
+    word_last = ~is_ws & _shift(is_ws, True, forward=True)
+    word_id = np.cumsum(word_start) - 1
+    word_starts = index[word_start]
+    word_ends = index[word_last] + 1
+
+    # 토큰 추가 시점(emit)과 같은 시점 안의 순서(rank): ENG 비우기 → 자음 → 단어 끝 음절 묶음
+    # 단위마다 (emit, rank, order, 원본 위치, 길이, 종류, 게시물)
+    eng_starts = index[is_letter & ~_shift(is_letter, False, forward=False)]
+    eng_ends = index[is_letter & ~_shift(is_letter, False, forward=True)] + 1
+
+    cons = index[is_cons]
+
+    syl = index[is_syl]
+    base = codes[syl] - SYLLABLE_BASE
+    cho, jung, jong = base // 588, (base % 588) // 28, base % 28
+    syl_emit = word_ends[word_id[syl]]
+    has_jong = jong != 0
+
+    # 자모 단위 값은 원본 배열 뒤에 붙여서 같은 방식으로 모음
+    jamo_values = np.concatenate([CHO_CODES[cho], JUNG_CODES[jung], JONG_CODES[jong[has_jong]]])
+    jamo_src = len(codes) + np.arange(len(jamo_values), dtype=np.int64)
+    n_syl, n_jong = len(syl), int(has_jong.sum())
+
+    def zeros(n, value=0):
+        return np.full(n, value, dtype=np.int64)
+
+    # 음절 단위 순서는 단어 안의 위치 기준 (정렬 키를 int64 하나로 만들기 위해 작은 값 유지)
+    syl_offset = 3 * (syl - word_starts[word_id[syl]])
+    emit = np.concatenate([eng_ends, cons, syl_emit, syl_emit, syl_emit[has_jong]])
+    rank = np.concatenate([zeros(len(eng_ends)), zeros(len(cons), 1), zeros(n_syl + n_syl + n_jong, 2)])
+    order = np.concatenate([zeros(len(eng_ends)), zeros(len(cons)), syl_offset, syl_offset + 1,
+                            syl_offset[has_jong] + 2])
+    src = np.concatenate([eng_starts, cons, jamo_src])
+    length = np.concatenate([eng_ends - eng_starts, zeros(len(cons) + len(jamo_values), 1)])
+    kind = np.concatenate([zeros(len(eng_ends), ENG), zeros(len(cons), KIND_CHO), zeros(n_syl, KIND_CHO),
+                           zeros(n_syl, KIND_JUNG), zeros(n_jong, KIND_JONG)])
+    unit_post = np.concatenate([posts[eng_starts], posts[cons], posts[syl], posts[syl], posts[syl[has_jong]]])
+
+    # (emit, rank, order) 순 정렬 (대부분 이미 정렬된 구간이라 안정 정렬이 빠름)
+    order_span = int(order.max()) + 1 if len(order) else 1
+    sort = np.argsort((emit * 3 + rank) * order_span + order, kind="stable")
+    emit, rank, src, length, kind, unit_post = (a[sort] for a in (emit, rank, src, length, kind, unit_post))
+
+    # (emit, rank)가 바뀌는 곳이 새 토큰
+    new_token = np.ones(len(emit), dtype=bool)
+    new_token[1:] = (emit[1:] != emit[:-1]) | (rank[1:] != rank[:-1])
+    token_first_unit = np.flatnonzero(new_token)
+    token_ends = np.append(token_first_unit[1:], len(emit))[:len(token_first_unit)].astype(np.int64)
+
+    # 단위별 문자 모으기
+    unit_ends = np.cumsum(length).astype(np.int64)
+    source = np.concatenate([codes, jamo_values])
+    gather = np.repeat(src - (unit_ends - length), length) + np.arange(int(unit_ends[-1]) if len(unit_ends) else 0)
+    chars = source[gather].astype(np.int32)
+
+    token_post = unit_post[token_first_unit]
+    post_ends = np.searchsorted(token_post, np.arange(len(texts)), side="right").astype(np.int64)
+
+    return {
+        "chars": chars,
+        "unit_kinds": kind.astype(np.int8),
+        "unit_ends": unit_ends,
+        "token_ends": token_ends,
+        "post_ends": post_ends,
+    }
+
+
+def recompose(arrays):
+    """
+    토큰 저장소 배열 → (단어 코드 포인트 배열, 토큰별 단어 끝 위치)
+    combine_units()와 같은 규칙: 같은 토큰 안에서 CHO 다음이 JUNG이면 (JONG까지) 음절로 조합,
+    나머지 단위는 값을 그대로 이어 붙임
+    """
+    chars = np.asarray(arrays["chars"], dtype=np.int64)
+    kinds = np.asarray(arrays["unit_kinds"], dtype=np.int64)
+    unit_ends = np.asarray(arrays["unit_ends"], dtype=np.int64)
+    token_ends = np.asarray(arrays["token_ends"], dtype=np.int64)
+    n_units = len(kinds)
+    if n_units == 0:
+        return np.empty(0, dtype=np.int32), np.zeros(len(token_ends), dtype=np.int64)
+
+    unit_starts = np.concatenate([[0], unit_ends[:-1]])
+    length = unit_ends - unit_starts
+    first_char = chars[np.minimum(unit_starts, max(len(chars) - 1, 0))]
+    token_of = np.repeat(np.arange(len(token_ends)), np.diff(np.concatenate([[0], token_ends])))
+
+    def ahead(values, step, fill):
+        out = np.full(n_units, fill, dtype=values.dtype)
+        out[:-step] = values[step:]
+        return out
+
+    same_next = ahead(token_of, 1, -1) == token_of
+    same_next2 = ahead(token_of, 2, -1) == token_of
+
+    def jamo_index(table, codes):
+        offset = codes - COMPAT_CONSONANT_FIRST
+        valid = (offset >= 0) & (offset < len(table))
+        return np.where(valid, table[np.clip(offset, 0, len(table) - 1)], -1)
+
+    cho_idx = jamo_index(CHO_INDEX, first_char)
+    next_char = ahead(first_char, 1, 0)
+    next2_char = ahead(first_char, 2, 0)
+
+    start = (kinds == KIND_CHO) & same_next & (ahead(kinds, 1, -1) == KIND_JUNG) & (cho_idx >= 0)
+    with_jong = start & same_next2 & (ahead(kinds, 2, -1) == KIND_JONG)
+
+    consumed = np.zeros(n_units, dtype=bool)
+    consumed[1:] |= start[:-1]
+    consumed[2:] |= with_jong[:-2]
+
+    syl_units = np.flatnonzero(start)
+    jung_idx = jamo_index(JUNG_INDEX, next_char[syl_units])
+    jong_idx = np.where(with_jong[syl_units], jamo_index(JONG_INDEX, next2_char[syl_units]), 0)
+    syllables = SYLLABLE_BASE + cho_idx[syl_units] * 588 + jung_idx * 28 + jong_idx
+
+    out_len = np.where(start, 1, np.where(consumed, 0, length))
+    src = unit_starts.copy()
+    src[syl_units] = len(chars) + np.arange(len(syl_units))
+    out_ends = np.cumsum(out_len)
+    total = int(out_ends[-1])
+    gather = np.repeat(src - (out_ends - out_len), out_len) + np.arange(total)
+    word_chars = np.concatenate([chars, syllables])[gather].astype(np.int32)
+
+    word_ends = np.concatenate([[0], out_ends])[token_ends]
+    return word_chars, word_ends
+
+
+HASH_BASE = np.uint64(0x100000001B3)
+
+
+def _word_keys(word_chars, starts, lengths):
+    # 단어별 64비트 다항식 해시 (uint64 오버플로 허용) + 길이
+    total = len(word_chars)
+    position = np.arange(total, dtype=np.int64) - np.repeat(starts, lengths)
+    max_len = int(lengths.max()) if len(lengths) else 0
+    powers = np.cumprod(np.full(max_len + 1, HASH_BASE, dtype=np.uint64))
+    with np.errstate(over="ignore"):
+        contrib = word_chars.astype(np.uint64) * powers[position]
+        prefix = np.concatenate([[np.uint64(0)], np.cumsum(contrib, dtype=np.uint64)])
+        return (prefix[starts + lengths] - prefix[starts]) ^ (lengths.astype(np.uint64) << np.uint64(48))
+
+
+def _group_words(arrays):
+    """
+    토큰 저장소 배열 → (단어 목록, 토큰별 단어 위치, 단어별 빈도) (단어는 처음 나온 순서)
+    같은 단어는 해시로 묶어 한 번만 문자열로 변환 (묶음이 실제로 같은 단어인지 배열 비교로 확인)
+    """
+    word_chars, word_ends = recompose(arrays)
+    if len(word_ends) == 0:
+        return [], np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    starts = _starts(word_ends)
+    lengths = word_ends - starts
+    data = word_chars.tobytes()
+
+    keys = _word_keys(word_chars, starts, lengths)
+    _, first, inverse, counts = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+
+    # 해시 충돌 확인: 모든 단어가 대표 단어(처음 나온 단어)와 글자까지 같아야 함
+    rep = first[inverse]
+    same = np.array_equal(lengths, lengths[rep]) and np.array_equal(
+        word_chars, word_chars[_ranges(starts[rep], lengths)]
+    )
+    if not same:
+        return _group_bytes(data, starts, word_ends)
+
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order), dtype=np.int64)
+    words = [data[start * 4:end * 4].decode("utf-32-le", "surrogatepass")
+             for start, end in zip(starts[first[order]].tolist(), word_ends[first[order]].tolist())]
+    return words, rank[inverse], counts[order]
+
+
+def _group_bytes(data, starts, word_ends):
+    # 단어 바이트열 기준 묶음 (해시 충돌 시 사용)
+    groups = {}
+    inverse = np.array([groups.setdefault(data[start:end], len(groups))
+                        for start, end in zip((starts * 4).tolist(), (word_ends * 4).tolist())], dtype=np.int64)
+    words = [key.decode("utf-32-le", "surrogatepass") for key in groups]
+    return words, inverse, np.bincount(inverse, minlength=len(words))
+
+
+def count_words(arrays):
+    """토큰 저장소 배열 → 단어별 빈도 Counter (단어가 처음 나온 순서대로 삽입)"""
+    words, _, counts = _group_words(arrays)
+    return Counter(dict(zip(words, counts.tolist())))
+
+
+def assign_word_ids(arrays, vocabulary):
+    """
+    토큰 저장소 배열 → (토큰별 단어 번호 int32, 새로 추가된 단어 목록)
+    vocabulary(단어 → 번호 dict)에 없는 단어는 처음 나온 순서대로 뒤에 번호를 붙여 추가
+    (배치마다 같은 vocabulary를 넘기면 번호 순서 = 전체 게시물에서 단어가 처음 나온 순서)
+    """
+    words, inverse, _ = _group_words(arrays)
+    added = [word for word in words if word not in vocabulary]
+    for word in added:
+        vocabulary[word] = len(vocabulary)
+    ids = np.array([vocabulary[word] for word in words], dtype=np.int32)
+    return ids[inverse], added
@@ -1,19 +1,57 @@
-import json, sys
+import argparse, json, os, sys
+from datetime import datetime
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import CACHE_DIR
+from config.settings import CACHE_DIR, ROOT_DIR
+
+sys.path.append(str(ROOT_DIR))
+from orchestration.runs import MEME_ENV, current_run_id
 
 cache_meme_name = CACHE_DIR / "meme_name.json"
+RUNS_DIR = CACHE_DIR / "runs"
 
 def meme_name_from_user():
+    # 1) 환경 변수 MEME_NAME (main.py, pipeline.py, 어댑터가 실행마다 설정)
+    meme_name = os.environ.get(MEME_ENV)
+    if meme_name:
+        return meme_name
+
+    # 2) 단독 실행 시 명령줄 --meme
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--meme")
+    args, _ = parser.parse_known_args()
+    if args.meme:
+        return args.meme.lstrip("#")
+
+    # 3) 예전 방식: cache/meme_name.json (여러 실행이 동시에 쓰면 덮어써지므로 호환용으로만 사용)
     if cache_meme_name.exists():
         with open(cache_meme_name, "r", encoding="utf-8") as f:
             return json.load(f)["meme_name"]
 
     #  meme_name = input("검색할 밈을 입력하세요 : ").strip().lstrip("#")
     meme_name = "sample"
+    save_meme_name(meme_name)
+    return meme_name
+
+def save_meme_name(meme_name):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     with open(cache_meme_name, "w", encoding="utf-8") as f:
         json.dump({"meme_name": meme_name}, f, ensure_ascii=False)
-    return meme_name
\ No newline at end of file
+
+def run_state_dir(meme_name, run_id=None):
+    # 실행별 작업 상태 디렉토리 (cache/runs/<실행 ID>/run.json)
+    run_id = run_id or current_run_id()
+    state_dir = RUNS_DIR / run_id
+    state_dir.mkdir(parents=True, exist_ok=True)
+    state_path = state_dir / "run.json"
+    if not state_path.exists():
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "run_id": run_id,
+                "meme_name": meme_name,
+                "pid": os.getpid(),
+                "started_at": datetime.now().isoformat(),
+            }, f, ensure_ascii=False, indent=2)
+    return state_dir
@@ -0,0 +1,132 @@
+"""
+Instagram 수집 원본 (data/raw/)
+수집기는 게시물을 하나 모을 때마다 {밈}_instagram.jsonl 뒤에 JSON 한 줄을 추가
+(수집이 중간에 멈춰도 이미 모은 게시물은 남음)
+예전 형식 {밈}_instagram.json (게시물 배열 하나)도 읽기 지원
+
+- iter_batches(): batch_rows행씩 DataFrame으로 읽기
+  JSONL은 한 줄씩 읽으므로 메모리는 파일 크기가 아니라 batch_rows에 비례
+- 기록 중이던 마지막 줄(잘린 JSON)은 건너뜀
+- 수집 체크포인트 {밈}_instagram.checkpoint.json: 이미 모은 게시물(shortcode)과
+  마지막 체크포인트 시점의 JSONL 크기 → 중단된 수집을 이어서 진행
+"""
+from pathlib import Path
+import json, os, sys
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(BASE_DIR))
+from config.settings import DATA_DIR
+
+BATCH_ROWS_ENV = "MEME_INGEST_BATCH_ROWS"
+DEFAULT_BATCH_ROWS = 10_000
+
+RAW_COLUMNS = ["username", "upload_time", "likes", "caption"]
+
+
+def jsonl_path_for(meme_name):
+    return DATA_DIR / "raw" / f"{meme_name}_instagram.jsonl"
+
+def json_path_for(meme_name):
+    # 예전 형식 (게시물 배열)
+    return DATA_DIR / "raw" / f"{meme_name}_instagram.json"
+
+def raw_path_for(meme_name):
+    # 읽을 원본 파일 (JSONL 우선, 없으면 예전 형식, 둘 다 없으면 JSONL 경로)
+    jsonl_path = jsonl_path_for(meme_name)
+    if jsonl_path.exists():
+        return jsonl_path
+    json_path = json_path_for(meme_name)
+    return json_path if json_path.exists() else jsonl_path
+
+def checkpoint_path_for(meme_name):
+    return DATA_DIR / "raw" / f"{meme_name}_instagram.checkpoint.json"
+
+def batch_rows_default():
+    return int(os.environ.get(BATCH_ROWS_ENV, DEFAULT_BATCH_ROWS))
+
+
+def start_collection(path):
+    # 새 수집 시작: 빈 파일 생성 (이전 수집 결과 교체)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+    return path
+
+def append_posts(path, posts):
+    # 게시물 dict 목록을 JSONL 뒤에 추가 (줄 단위로 바로 디스크에 기록)
+    with open(path, "a", encoding="utf-8") as f:
+        for post in posts:
+            f.write(json.dumps(post, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def load_checkpoint(meme_name):
+    # 수집 체크포인트 (없거나 읽을 수 없으면 None)
+    path = checkpoint_path_for(meme_name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_checkpoint(meme_name, checkpoint):
+    # 임시 파일에 쓴 뒤 교체 (기록 중 중단되어도 이전 체크포인트 유지)
+    path = checkpoint_path_for(meme_name)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def resume_collection(path, offset):
+    # 이어서 수집: 마지막 체크포인트 이후에 기록된 줄은 잘라냄 (그 게시물은 다시 수집되므로 중복 방지)
+    path = Path(path)
+    with open(path, "r+b") as f:
+        f.truncate(offset)
+    return path
+
+
+def _frame(rows):
+    df = pd.DataFrame.from_records(rows)
+    for column in RAW_COLUMNS:
+        if column not in df:
+            df[column] = None
+    return df
+
+def iter_batches(path, batch_rows=None):
+    """원본 파일 → batch_rows행씩 DataFrame (파일 순서 유지)"""
+    path = Path(path)
+    batch_rows = batch_rows or batch_rows_default()
+
+    if path.suffix != ".jsonl":
+        # 예전 형식은 배열 하나라 한 번에 읽은 뒤 나눔
+        df = pd.read_json(path)
+        for start in range(0, len(df), batch_rows):
+            yield df.iloc[start:start + batch_rows]
+        return
+
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"⚠️  {path.name}:{line_number} 읽을 수 없는 줄 건너뜀 (기록 중 중단된 게시물)")
+                continue
+            if len(rows) >= batch_rows:
+                yield _frame(rows)
+                rows = []
+    if rows:
+        yield _frame(rows)
+
+def load_posts(path):
+    # 원본 전체를 하나의 DataFrame으로 (작은 파일용)
+    batches = list(iter_batches(path))
+    return pd.concat(batches, ignore_index=True) if batches else _frame([])
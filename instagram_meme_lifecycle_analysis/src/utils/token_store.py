@@ -0,0 +1,269 @@
+"""
+caption 토큰 바이너리 저장소
+compress_decompose() / hangul.decompose_captions() 결과 (게시물 → 토큰 → 단위 {"CHO": "ㄱ"} / {"ENG": "abc"})를
+CSV 문자열 대신 고정 타입 배열로 평탄화해 디렉토리에 저장
+
+    chars.bin       int32  단위 값의 문자 코드 (모든 단위를 이어 붙임)
+    unit_kinds.bin  int8   단위 종류 (UNIT_KINDS 순서)
+    unit_ends.bin   int64  단위별 chars 끝 위치
+    token_ends.bin  int64  토큰별 unit 끝 위치
+    post_ends.bin   int64  게시물별 token 끝 위치
+    word_ids.bin    int32  토큰별 단어 번호 (선택, hangul.assign_word_ids())
+    words.txt              단어 번호 → 단어 (한 줄에 하나, 줄 번호 = 단어 번호)
+    meta.json              배열별 개수 (마지막에 기록 → 기록된 개수까지만 유효)
+
+- 읽을 때는 np.memmap으로 열어 파싱 없이 사용
+- append=True면 기존 파일 뒤에 이어 쓰기 (끝 위치는 기존 개수만큼 더해 저장)
+- 단어 번호가 있으면 키워드 추출이 단어를 다시 조합하지 않고 번호만 셈 (프로세스가 달라도 재사용)
+"""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+FORMAT_VERSION = 2
+UNIT_KINDS = ["ENG", "CHO", "JUNG", "JONG"]
+KIND_CODES = {kind: code for code, kind in enumerate(UNIT_KINDS)}
+
+# 파일 이름 → (dtype, meta.json 개수 키)
+ARRAYS = {
+    "chars": (np.int32, "chars"),
+    "unit_kinds": (np.int8, "units"),
+    "unit_ends": (np.int64, "units"),
+    "token_ends": (np.int64, "tokens"),
+    "post_ends": (np.int64, "posts"),
+}
+WORD_IDS = "word_ids"
+WORD_IDS_DTYPE = np.int32
+WORDS_FILE = "words.txt"
+META_FILE = "meta.json"
+COUNT_KEYS = ["posts", "tokens", "units", "chars"]
+
+
+def files(path):
+    # 저장소를 구성하는 파일 목록 (단계 캐시 입력/결과용)
+    path = Path(path)
+    return ([path / f"{name}.bin" for name in ARRAYS]
+            + [path / f"{WORD_IDS}.bin", path / WORDS_FILE, path / META_FILE])
+
+
+def exists(path):
+    return (Path(path) / META_FILE).exists()
+
+
+def read_meta(path):
+    meta_path = Path(path) / META_FILE
+    if not meta_path.exists():
+        return None
+    with open(meta_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def has_word_ids(meta):
+    return meta is not None and "words" in meta
+
+
+def _write_meta(path, counts):
+    meta_path = Path(path) / META_FILE
+    tmp_path = meta_path.with_name(f".{META_FILE}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": FORMAT_VERSION, "unit_kinds": UNIT_KINDS, **counts}, f, indent=2)
+    os.replace(tmp_path, meta_path)
+
+
+def flatten(token_lists):
+    # 게시물별 토큰 리스트 → 배열 (끝 위치는 0부터 시작)
+    chars, kinds, unit_ends, token_ends, post_ends = [], [], [], [], []
+    for tokens in token_lists:
+        for token in tokens:
+            for unit in token:
+                (kind, value), = unit.items()
+                kinds.append(KIND_CODES[kind])
+                chars.extend(map(ord, value))
+                unit_ends.append(len(chars))
+            token_ends.append(len(kinds))
+        post_ends.append(len(token_ends))
+
+    return {
+        "chars": np.array(chars, dtype=np.int32),
+        "unit_kinds": np.array(kinds, dtype=np.int8),
+        "unit_ends": np.array(unit_ends, dtype=np.int64),
+        "token_ends": np.array(token_ends, dtype=np.int64),
+        "post_ends": np.array(post_ends, dtype=np.int64),
+    }
+
+
+def write_tokens(path, token_lists, append=False):
+    # 토큰 리스트 저장 (compress_decompose() 결과용)
+    return write_arrays(path, flatten(token_lists), append)
+
+
+def write_arrays(path, arrays, append=False, words=None):
+    """
+    토큰 배열(flatten() / hangul.decompose_captions() 형식) 저장 후 전체 개수(meta) 반환
+    append=False면 기존 저장소를 교체, True면 뒤에 추가
+    arrays에 "word_ids"가 있으면 단어 번호도 저장 (words: 이번에 새로 번호를 받은 단어 목록)
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    word_ids = arrays.get(WORD_IDS)
+    arrays = {name: np.array(arrays[name], dtype=dtype) for name, (dtype, _) in ARRAYS.items()}
+
+    previous = read_meta(path) if append else None
+    if previous and has_word_ids(previous) != (word_ids is not None):
+        raise ValueError(f"단어 번호 저장 여부가 기존 저장소와 다릅니다: {path}")
+    base = {key: (previous or {}).get(key, 0) for key in COUNT_KEYS}
+
+    # 끝 위치를 기존 개수만큼 이동
+    arrays["unit_ends"] += base["chars"]
+    arrays["token_ends"] += base["units"]
+    arrays["post_ends"] += base["tokens"]
+
+    if not previous:
+        # 교체하는 동안 읽는 쪽이 옛 개수로 새 배열을 읽지 않도록 meta부터 삭제
+        (path / META_FILE).unlink(missing_ok=True)
+
+    for name, (dtype, count_key) in ARRAYS.items():
+        file_path = path / f"{name}.bin"
+        itemsize = np.dtype(dtype).itemsize
+        with open(file_path, "r+b" if previous and file_path.exists() else "wb") as f:
+            # 중단된 이전 추가 작업의 잔여 데이터는 버리고 meta 기준 위치부터 기록
+            f.truncate(base[count_key] * itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(arrays[name].tobytes())
+
+    counts = {
+        "posts": base["posts"] + len(arrays["post_ends"]),
+        "tokens": base["tokens"] + len(arrays["token_ends"]),
+        "units": base["units"] + len(arrays["unit_ends"]),
+        "chars": base["chars"] + len(arrays["chars"]),
+    }
+    if word_ids is not None:
+        counts.update(_write_words(path, previous, base, word_ids, words or []))
+    elif not previous:
+        # 단어 번호 없이 교체하면 예전 단어 번호 파일은 삭제
+        (path / f"{WORD_IDS}.bin").unlink(missing_ok=True)
+        (path / WORDS_FILE).unlink(missing_ok=True)
+    _write_meta(path, counts)
+    return counts
+
+
+def _write_words(path, previous, base, word_ids, words):
+    # 단어 번호 배열 + 단어 목록 추가 (배열과 같이 meta 기준 위치부터 기록)
+    with open(path / f"{WORD_IDS}.bin", "r+b" if previous else "wb") as f:
+        f.truncate(base["tokens"] * np.dtype(WORD_IDS_DTYPE).itemsize)
+        f.seek(0, os.SEEK_END)
+        f.write(np.asarray(word_ids, dtype=WORD_IDS_DTYPE).tobytes())
+
+    data = "".join(f"{word}\n" for word in words).encode("utf-8")
+    words_bytes = previous["words_bytes"] if previous else 0
+    with open(path / WORDS_FILE, "r+b" if previous else "wb") as f:
+        f.truncate(words_bytes)
+        f.seek(0, os.SEEK_END)
+        f.write(data)
+    return {"words": (previous["words"] if previous else 0) + len(words), "words_bytes": words_bytes + len(data)}
+
+
+def _open_array(path, name, meta):
+    dtype, count_key = ARRAYS[name]
+    count = meta[count_key]
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(Path(path) / f"{name}.bin", dtype=dtype, mode="r", shape=(count,))
+
+
+class TokenStore:
+    """memmap으로 연 토큰 저장소"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.meta = read_meta(self.path)
+        if self.meta is None:
+            raise FileNotFoundError(f"토큰 저장소가 없습니다: {self.path}")
+        for name in ARRAYS:
+            setattr(self, name, _open_array(self.path, name, self.meta))
+        self.word_ids = None
+        if has_word_ids(self.meta) and self.meta["tokens"]:
+            self.word_ids = np.memmap(self.path / f"{WORD_IDS}.bin", dtype=WORD_IDS_DTYPE, mode="r",
+                                      shape=(self.meta["tokens"],))
+        elif has_word_ids(self.meta):
+            self.word_ids = np.empty(0, dtype=WORD_IDS_DTYPE)
+
+    def __len__(self):
+        return self.meta["posts"]
+
+    def arrays(self, start=None, end=None):
+        """
+        배열 이름 → memmap (hangul.recompose() 등에 그대로 전달)
+        start/end를 주면 게시물 구간 [start, end)만 잘라 끝 위치를 0부터 다시 매긴 배열
+        (memmap에서 해당 구간만 읽으므로 메모리는 구간 크기만큼만 사용)
+        """
+        if start is None and end is None:
+            return {name: getattr(self, name) for name in ARRAYS}
+
+        start = 0 if start is None else start
+        end = len(self) if end is None else min(end, len(self))
+
+        def bounds(ends, first, last):
+            # 구간 [first, last) 항목들이 가리키는 하위 배열 구간
+            if last <= first:
+                return 0, 0
+            return (int(ends[first - 1]) if first else 0), int(ends[last - 1])
+
+        token_start, token_end = bounds(self.post_ends, start, end)
+        unit_start, unit_end = bounds(self.token_ends, token_start, token_end)
+        char_start, char_end = bounds(self.unit_ends, unit_start, unit_end)
+        return {
+            "chars": np.array(self.chars[char_start:char_end]),
+            "unit_kinds": np.array(self.unit_kinds[unit_start:unit_end]),
+            "unit_ends": np.array(self.unit_ends[unit_start:unit_end]) - char_start,
+            "token_ends": np.array(self.token_ends[token_start:token_end]) - unit_start,
+            "post_ends": np.array(self.post_ends[start:end]) - token_start,
+        }
+
+    def post_word_ids(self, start=None, end=None):
+        # 게시물 구간 [start, end)의 토큰별 단어 번호 (단어 번호가 없으면 None)
+        if self.word_ids is None:
+            return None
+        start = 0 if start is None else start
+        end = len(self) if end is None else min(end, len(self))
+        if end <= start:
+            return np.empty(0, dtype=WORD_IDS_DTYPE)
+        token_start = int(self.post_ends[start - 1]) if start else 0
+        return np.array(self.word_ids[token_start:int(self.post_ends[end - 1])])
+
+    def words(self, ids=None):
+        """
+        단어 번호 → 단어
+        ids가 없으면 전체 단어 목록, 있으면 {번호: 단어} (필요한 줄만 남기고 나머지는 읽고 버림)
+        """
+        wanted = None if ids is None else set(int(i) for i in ids)
+        found = {}
+        with open(self.path / WORDS_FILE, "r", encoding="utf-8", newline="\n") as f:
+            for index, line in enumerate(f):
+                if index >= self.meta["words"]:
+                    break
+                if wanted is None or index in wanted:
+                    found[index] = line[:-1]
+        return list(found.values()) if wanted is None else found
+
+    def token_units(self, token_index):
+        # 토큰 하나 → [{"CHO": "ㄱ"}, ...]
+        unit_start = int(self.token_ends[token_index - 1]) if token_index else 0
+        unit_end = int(self.token_ends[token_index])
+        units = []
+        for u in range(unit_start, unit_end):
+            char_start = int(self.unit_ends[u - 1]) if u else 0
+            value = "".join(map(chr, self.chars[char_start:int(self.unit_ends[u])].tolist()))
+            units.append({UNIT_KINDS[self.unit_kinds[u]]: value})
+        return units
+
+    def to_lists(self):
+        # 전처리 직후와 같은 게시물별 토큰 리스트로 복원
+        posts = []
+        token_start = 0
+        for token_end in self.post_ends.tolist():
+            posts.append([self.token_units(t) for t in range(token_start, token_end)])
+            token_start = token_end
+        return posts
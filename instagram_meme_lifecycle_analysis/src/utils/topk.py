@@ -0,0 +1,66 @@
+"""
+상위 K개 키워드 근사 집계 (Space-Saving)
+전체 단어 빈도(Counter)를 끝까지 들고 있는 대신 최대 capacity개 단어만 유지
+
+- update(counts): 구간(chunk)별 정확한 빈도를 요약에 합침 (가중치 Space-Saving 병합)
+- 요약에 없는 단어의 실제 빈도는 항상 min_count() 이하
+- 요약에 있는 단어: count는 실제 빈도의 상한, count - error는 하한
+  → error == 0이면 정확한 값, count - error > min_count()이면 상위 K 포함이 확실
+- 단어를 하나씩 넣지 않고 구간 단위로 합치므로 결과와 오차 범위는 구간 크기에 따라 달라짐
+  (위 상한/하한은 구간 크기와 무관하게 성립, 구간이 클수록 정확하게 센 부분이 많아 error가 작아지는 대신
+   메모리는 capacity + 구간 하나의 고유 단어 수)
+"""
+
+
+class SpaceSaving:
+    """Space-Saving 요약 (단어 → [추정 빈도, 최대 오차])"""
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError(f"capacity는 1 이상이어야 합니다: {capacity}")
+        self.capacity = capacity
+        self.total = 0
+        # 단어가 처음 들어온 순서 유지 (같은 빈도일 때 정확한 집계와 같은 순서)
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def min_count(self):
+        # 요약에 없는 단어의 빈도 상한 (요약이 가득 차지 않았으면 0)
+        if len(self.entries) < self.capacity:
+            return 0
+        return min(count for count, _ in self.entries.values())
+
+    def update(self, counts):
+        """단어 → 빈도 묶음(dict/Counter)을 합친 뒤 상위 capacity개만 유지"""
+        floor = self.min_count()
+        merged = self.entries
+        for word, n in counts.items():
+            entry = merged.get(word)
+            if entry is None:
+                # 요약에서 빠졌던 단어는 최대 floor번 나왔을 수 있음
+                merged[word] = [floor + n, floor]
+            else:
+                entry[0] += n
+            self.total += n
+
+        if len(merged) > self.capacity:
+            keep = sorted(merged, key=lambda word: -merged[word][0])[:self.capacity]
+            keep = set(keep)
+            self.entries = {word: entry for word, entry in merged.items() if word in keep}
+        return self
+
+    def most_common(self, n=None):
+        """[(단어, 추정 빈도, 최대 오차), ...] (빈도 내림차순)"""
+        items = sorted(self.entries.items(), key=lambda item: -item[1][0])
+        return [(word, count, error) for word, (count, error) in items[:n]]
+
+    def summary(self):
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "size": len(self.entries),
+            "min_count": self.min_count(),
+            "exact": sum(1 for _, error in self.entries.values() if error == 0),
+        }
@@ -0,0 +1,101 @@
+"""
+키워드 변형 묶기 (킹받네/킹받내, 오타, ㅋㅋㅋㅋ 같은 늘여 쓰기)
+단어를 자모 문자열로 풀어 자모 역색인으로 후보를 찾고,
+SequenceMatcher 유사도로 확인한 쌍을 union-find로 묶어 대표 단어 + 빈도 합계로 정리
+
+- 늘여 쓰기: 같은 문자가 3번 이상 이어지면 2번으로 줄인 형태가 같으면 바로 묶음
+- 후보 찾기: 자모 하나를 뺀 부분 문자열(길이 L-1 n-gram)을 키로 색인
+  → 자모 하나가 다르거나(오타) 더/덜 붙은 단어는 같은 키를 가짐
+  (2~3자모 n-gram 색인은 한글 자모 조합 수가 적어 색인 목록이 길어지고 후보 비교가 단어 수의 제곱으로 늘어남)
+- 자모 길이가 min_length보다 짧은 단어는 묶지 않음 (짧은 단어는 한 글자만 달라도 다른 단어)
+"""
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+from utils.hangul import CHO, JUNG, JONG, SYLLABLE_BASE, SYLLABLE_LAST
+
+DEFAULT_THRESHOLD = 0.85
+DEFAULT_MIN_LENGTH = 6
+
+ELONGATION = re.compile(r"(.)\1{2,}")
+
+
+def to_jamo(word):
+    # 완성형 한글 → 초성/중성/종성 호환 자모, 나머지 문자는 소문자로
+    chars = []
+    for ch in str(word).lower():
+        code = ord(ch)
+        if SYLLABLE_BASE <= code <= SYLLABLE_LAST:
+            base = code - SYLLABLE_BASE
+            chars.append(CHO[base // 588])
+            chars.append(JUNG[(base % 588) // 28])
+            chars.append(JONG[base % 28])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def normalize(word):
+    # 비교용 형태: 자모 문자열 + 늘여 쓰기 축약
+    return ELONGATION.sub(r"\1\1", to_jamo(word))
+
+
+def deletion_keys(form):
+    # 자모 하나씩 뺀 문자열 + 원래 문자열 (색인 키)
+    return {form} | {form[:i] + form[i + 1:] for i in range(len(form))}
+
+
+class UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            # 번호가 작은 쪽(빈도가 높은 단어)을 대표로
+            self.parent[max(a, b)] = min(a, b)
+
+
+def group_variants(word_counts, threshold=DEFAULT_THRESHOLD, min_length=DEFAULT_MIN_LENGTH):
+    """
+    [(단어, 빈도), ...] → [(대표 단어, 빈도 합계, [(단어, 빈도), ...]), ...] (빈도 합계 내림차순)
+    대표 단어는 묶음 안에서 가장 빈도가 높은 단어 (같으면 먼저 나온 단어)
+    """
+    items = sorted(word_counts, key=lambda item: -item[1])
+    words = [word for word, _ in items]
+    forms = [normalize(word) for word in words]
+    groups = UnionFind(len(words))
+
+    # 1) 늘여 쓰기까지 같은 형태면 바로 묶음
+    same_form = {}
+    for i, form in enumerate(forms):
+        groups.union(same_form.setdefault(form, i), i)
+
+    # 2) 형태별 대표만 색인, 같은 키를 가진 앞선 단어와 유사도 확인
+    index = defaultdict(list)
+    for i, form in enumerate(forms):
+        if same_form[form] != i or len(form) < min_length:
+            continue
+        seen = set()
+        for key in deletion_keys(form):
+            for j in index[key]:
+                if j in seen:
+                    continue
+                seen.add(j)
+                if SequenceMatcher(None, form, forms[j], autojunk=False).ratio() >= threshold:
+                    groups.union(i, j)
+            index[key].append(i)
+
+    members = defaultdict(list)
+    for i, (word, count) in enumerate(items):
+        members[groups.find(i)].append((word, count))
+
+    result = [(words[root], sum(count for _, count in group), group) for root, group in members.items()]
+    return sorted(result, key=lambda group: -group[1])
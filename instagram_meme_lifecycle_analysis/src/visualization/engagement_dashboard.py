@@ -6,32 +6,38 @@ import sys
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import RESULTS_DIR, SRC_DIR, DATA_DIR
+from config.settings import RESULTS_DIR, SRC_DIR, DATA_DIR, ROOT_DIR
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
 
-# 스타일 설정
-plt.style.use("seaborn-v0_8-muted")
-sns.set_palette("rocket")
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+from orchestration.runs import atomic_path
 
-# 파일 경로
-meme_name = meme_name_from_user()
-
-df_path_before = DATA_DIR / "analysis" / f"{meme_name}" /  "engagement" / f"{meme_name}_likes_cleaned.csv"
-weekly_path_before = DATA_DIR / "analysis" / f"{meme_name}" /  "engagement" / f"{meme_name}_weekly_likes.csv"
-weekday_path_before = DATA_DIR / "analysis" / f"{meme_name}" /  "engagement" / f"{meme_name}_weekday_likes.csv"
-
-output_path = RESULTS_DIR / f"{meme_name}" / "engagement"
-output_path.mkdir(parents=True, exist_ok=True)
-output_path_visualization = output_path / "visualization"
-output_path_visualization.mkdir(parents=True, exist_ok=True)
+# 스타일 설정 (그릴 때만 적용)
+STYLE = "seaborn-v0_8-muted"
+PALETTE = "rocket"
 
-df = pd.read_csv(df_path_before)
-weekly = pd.read_csv(weekly_path_before)
-weekday = pd.read_csv(weekday_path_before, index_col=0)
+# 파일 경로
+def input_paths_for(meme_name):
+    input_dir = DATA_DIR / "analysis" / f"{meme_name}" /  "engagement"
+    return [input_dir / f"{meme_name}_{name}.csv" for name in ["likes_cleaned", "weekly_likes", "weekday_likes"]]
+
+def output_paths_for(meme_name):
+    output_path = RESULTS_DIR / f"{meme_name}" / "engagement"
+    output_path_visualization = output_path / "visualization"
+    output_path_visualization.mkdir(parents=True, exist_ok=True)
+    return output_path, output_path_visualization
+
+def load_engagement(meme_name):
+    df_path, weekly_path, weekday_path = input_paths_for(meme_name)
+    df = pd.read_csv(df_path)
+    weekly = pd.read_csv(weekly_path)
+    weekday = pd.read_csv(weekday_path, index_col=0)
+    return df, weekly, weekday
 
 # 시각화 1 - 좋아요 분포
-def plot_like_distribution():
+def plot_like_distribution(df, meme_name, output_path_visualization):
     plt.figure(figsize=(10, 6))
     sns.histplot(df["likes"], bins=30, kde=True, color="skyblue")
     plt.title(f"'{meme_name}' 좋아요 수 분포")
@@ -39,11 +45,12 @@ def plot_like_distribution():
     plt.ylabel("게시물 수")
     plt.grid(True)
     plt.tight_layout()
-    plt.savefig(output_path_visualization / f"{meme_name}_like_distribution.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_like_distribution.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # 시각화 2 - 주간 변화
-def plot_weekly_likes():
+def plot_weekly_likes(weekly, meme_name, output_path_visualization):
     plt.figure(figsize=(12, 6))
     sns.lineplot(data=weekly, x="week", y="likes", marker="o", color="orange")
     plt.title(f"'{meme_name}' 좋아요 최근 동향")
@@ -51,11 +58,12 @@ def plot_weekly_likes():
     plt.ylabel("좋아요 수")
     plt.grid(True)
     plt.tight_layout()
-    plt.savefig(output_path_visualization / f"{meme_name}_weekly_likes.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_weekly_likes.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # 시각화 3 - 요일별 평균
-def plot_weekday_likes():
+def plot_weekday_likes(weekday, meme_name, output_path_visualization):
     weekday_df = weekday.reset_index()
     weekday_df.columns = ["weekday", "likes"]
 
@@ -66,11 +74,12 @@ def plot_weekday_likes():
     plt.ylabel("평균 좋아요 수")
     plt.grid(True, axis="y")
     plt.tight_layout()
-    plt.savefig(output_path_visualization / f"{meme_name}_weekday_likes.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_weekday_likes.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # 시각화 4 - 대시보드 결합
-def plot_engagement_dashboard():
+def plot_engagement_dashboard(df, weekly, weekday, meme_name, output_path):
     fig = plt.figure(figsize=(16, 12))
     fig.suptitle(f"'{meme_name}' 반응 강도 대시보드", fontsize=18, weight="bold")
 
@@ -106,12 +115,34 @@ def plot_engagement_dashboard():
 
     # 자동 정렬
     plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.savefig(output_path / f"{meme_name}_dashboard.png", dpi=300)
+    with atomic_path(output_path / f"{meme_name}_dashboard.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
+# 전체 그림 생성 (데이터가 없으면 분석 결과 CSV에서 로드)
+def render_engagement_dashboard(meme_name, df=None, weekly=None, weekday=None):
+    if df is None or weekly is None or weekday is None:
+        df, weekly, weekday = load_engagement(meme_name)
+    output_path, output_path_visualization = output_paths_for(meme_name)
+
+    figures = [
+        (lambda: plot_like_distribution(df, meme_name, output_path_visualization),
+         output_path_visualization / f"{meme_name}_like_distribution.png"),
+        (lambda: plot_weekly_likes(weekly, meme_name, output_path_visualization),
+         output_path_visualization / f"{meme_name}_weekly_likes.png"),
+        (lambda: plot_weekday_likes(weekday, meme_name, output_path_visualization),
+         output_path_visualization / f"{meme_name}_weekday_likes.png"),
+        (lambda: plot_engagement_dashboard(df, weekly, weekday, meme_name, output_path),
+         output_path / f"{meme_name}_dashboard.png"),
+    ]
+    with plt.style.context(STYLE), sns.color_palette(PALETTE):
+        with trace.stage("visualization:engagement", platform="instagram", meme=meme_name, rows_in=len(df)):
+            for plot, figure_path in figures:
+                with trace.stage(f"figure:{figure_path.stem}") as t:
+                    plot()
+                    t.output(figure_path)
+    return [figure_path for _, figure_path in figures]
+
 # 실행
 if __name__ == "__main__":
-    plot_like_distribution()
-    plot_weekly_likes()
-    plot_weekday_likes()
-    plot_engagement_dashboard()
\ No newline at end of file
+    render_engagement_dashboard(meme_name_from_user())
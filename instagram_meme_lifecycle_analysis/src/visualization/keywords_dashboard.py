@@ -10,36 +10,36 @@ import sys
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import DATA_DIR, RESULTS_DIR, SRC_DIR
+from config.settings import DATA_DIR, RESULTS_DIR, SRC_DIR, ROOT_DIR
 
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
 
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+from orchestration.runs import atomic_path
+
 # 데이터 파일 경로
-meme_name = meme_name_from_user()
-input_path = DATA_DIR / "analysis" / f"{meme_name}" /  "keywords" / f"{meme_name}_keywords.csv"
+def input_path_for(meme_name):
+    return DATA_DIR / "analysis" / f"{meme_name}" /  "keywords" / f"{meme_name}_keywords.csv"
 
-# 스타일
-plt.style.use("seaborn-v0_8-colorblind")
-sns.set_palette("Set2")
+# 스타일 (그릴 때만 적용)
+STYLE = "seaborn-v0_8-colorblind"
+PALETTE = "Set2"
 
 # macOS의 Apple Gothic 폰트 경로
 font_path = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
 font_prop = fm.FontProperties(fname=font_path)
 
-# 전역 폰트 설정
-plt.rcParams['font.family'] = font_prop.get_name()
-
-df = pd.read_csv(input_path)
-
 # 폴더 생성
-output_path = RESULTS_DIR / f"{meme_name}" / "keywords"
-output_path.mkdir(parents=True, exist_ok=True)
-output_path_visualization = output_path / "visualization"
-output_path_visualization.mkdir(parents=True, exist_ok=True)
+def output_paths_for(meme_name):
+    output_path = RESULTS_DIR / f"{meme_name}" / "keywords"
+    output_path_visualization = output_path / "visualization"
+    output_path_visualization.mkdir(parents=True, exist_ok=True)
+    return output_path, output_path_visualization
 
 # 시각화 1 - 막대그래프
-def plot_bar_chart(df, meme_name):
+def plot_bar_chart(df, meme_name, output_path_visualization):
     fig, ax = plt.subplots(figsize=(10, 6))
     top = df.head(20)
     ax.barh(top["word"], top["count"], color="skyblue")
@@ -47,11 +47,12 @@ def plot_bar_chart(df, meme_name):
     ax.set_title(f"Top 20 Keywords for '{meme_name}'", fontsize=15, weight="bold")
     ax.set_xlabel("Frequency")
     fig.tight_layout()
-    plt.savefig(output_path_visualization / f"{meme_name}_bar_chart.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_bar_chart.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # 시각화 2 - 워드클라우드
-def plot_wordcloud(df, meme_name):
+def plot_wordcloud(df, meme_name, output_path_visualization):
     freq = dict(zip(df["word"], df["count"]))
 
     wc = WordCloud(
@@ -64,11 +65,12 @@ def plot_wordcloud(df, meme_name):
     ax.imshow(wc, interpolation="bilinear")
     ax.axis("off")
     fig.tight_layout()
-    plt.savefig(output_path_visualization / f"{meme_name}_wordcloud.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_wordcloud.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # 시각화 3 - 네트워크 그래프
-def plot_network(df, meme_name):
+def plot_network(df, meme_name, output_path_visualization):
     G = nx.Graph()
     words = df.head(20)["word"].tolist()
     counts = df.head(20)["count"].tolist()
@@ -86,11 +88,12 @@ def plot_network(df, meme_name):
     sizes = [G.nodes[n]["size"] * 10 for n in G.nodes]
     nx.draw(G, pos, with_labels=True, node_size=sizes, node_color="lightgreen", edge_color="gray", font_size=10, font_family=font_prop.get_name(), ax=ax)
     plt.title(f"Keyword Network for '{meme_name}'", fontsize=14, weight="bold")
-    plt.savefig(output_path_visualization / f"{meme_name}_keyword_network.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_keyword_network.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # 시각화 4 - 대시보드
-def plot_dashboard(df, meme_name):
+def plot_dashboard(df, meme_name, output_path):
     # 준비
     freq = dict(zip(df["word"], df["count"]))
     words = df.head(20)["word"].tolist()
@@ -153,12 +156,31 @@ def plot_dashboard(df, meme_name):
 
     # 자동 여백 조정
     plt.tight_layout(rect=[0, 0, 1, 0.95])  # suptitle 공간 확보
-    plt.savefig(output_path / f"{meme_name}_dashboard.png", dpi=300)
+    with atomic_path(output_path / f"{meme_name}_dashboard.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
+# 전체 그림 생성 (df가 없으면 키워드 분석 CSV에서 로드)
+def render_keywords_dashboard(meme_name, df=None):
+    if df is None:
+        df = pd.read_csv(input_path_for(meme_name))
+    output_path, output_path_visualization = output_paths_for(meme_name)
+
+    figures = [
+        (plot_bar_chart, output_path_visualization, f"{meme_name}_bar_chart.png"),
+        (plot_wordcloud, output_path_visualization, f"{meme_name}_wordcloud.png"),
+        (plot_network, output_path_visualization, f"{meme_name}_keyword_network.png"),
+        (plot_dashboard, output_path, f"{meme_name}_dashboard.png"),
+    ]
+    # 전역 폰트 설정
+    with plt.style.context(STYLE), sns.color_palette(PALETTE), plt.rc_context({"font.family": font_prop.get_name()}):
+        with trace.stage("visualization:keywords", platform="instagram", meme=meme_name, rows_in=len(df)):
+            for plot, figure_dir, filename in figures:
+                with trace.stage(f"figure:{Path(filename).stem}") as t:
+                    plot(df, meme_name, figure_dir)
+                    t.output(figure_dir / filename)
+    return [figure_dir / filename for _, figure_dir, filename in figures]
+
 # 실행
 if __name__ == "__main__":
-    plot_bar_chart(df, meme_name)
-    plot_wordcloud(df, meme_name)
-    plot_network(df, meme_name)
-    plot_dashboard(df, meme_name)
\ No newline at end of file
+    render_keywords_dashboard(meme_name_from_user())
@@ -8,21 +8,24 @@ from matplotlib.lines import Line2D
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(BASE_DIR))
-from config.settings import DATA_DIR, RESULTS_DIR, SRC_DIR
+from config.settings import DATA_DIR, RESULTS_DIR, SRC_DIR, ROOT_DIR
 
 sys.path.append(str(SRC_DIR))
 from utils.input_utils import meme_name_from_user
 
-# 경로 설정
-meme_name = meme_name_from_user()
-input_path = DATA_DIR / "analysis" / f"{meme_name}" /  "lifecycle" / f"{meme_name}_lifecycle.csv"
+sys.path.append(str(ROOT_DIR))
+from orchestration import trace
+from orchestration.runs import atomic_path
 
-output_path = RESULTS_DIR / f"{meme_name}" / "lifecycle"
-output_path.mkdir(parents=True, exist_ok=True)
-output_path_visualization = output_path / "visualization"
-output_path_visualization.mkdir(parents=True, exist_ok=True)
+# 경로 설정
+def input_path_for(meme_name):
+    return DATA_DIR / "analysis" / f"{meme_name}" /  "lifecycle" / f"{meme_name}_lifecycle.csv"
 
-df = pd.read_csv(input_path, parse_dates=["date"])
+def output_paths_for(meme_name):
+    output_path = RESULTS_DIR / f"{meme_name}" / "lifecycle"
+    output_path_visualization = output_path / "visualization"
+    output_path_visualization.mkdir(parents=True, exist_ok=True)
+    return output_path, output_path_visualization
 
 # 구간 배경색 정의
 def add_phase_background(ax, df, phase_column="phase", x_column="date", phase_colors=None, alpha=0.3, return_legend=False):
@@ -51,7 +54,7 @@ def add_phase_background(ax, df, phase_column="phase", x_column="date", phase_co
             return handles
     
 # 시각화 1 - 일별 게시물 수와 이동 평균
-def plot_daily_trend():
+def plot_daily_trend(df, meme_name, output_path_visualization):
     plt.figure(figsize=(12, 6))
     ax = plt.gca()
     ax.plot(df["date"], df["count"], label="일일 게시물 수", alpha=0.3)
@@ -63,11 +66,12 @@ def plot_daily_trend():
     ax.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(output_path_visualization / f"{meme_name}_daily_trend.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_daily_trend.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # 시각화 2 - 누적 게시물 수
-def plot_cumulative_trend():
+def plot_cumulative_trend(df, meme_name, output_path_visualization):
     plt.figure(figsize=(12, 6))
     ax = plt.gca()
     legend_handles = add_phase_background(ax, df, return_legend=True)
@@ -80,7 +84,8 @@ def plot_cumulative_trend():
     ax.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(output_path_visualization / f"{meme_name}_cumulative_trend.png", dpi=300)
+    with atomic_path(output_path_visualization / f"{meme_name}_cumulative_trend.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
 # # 시각화 3 - 날짜-시간 히트맵
@@ -103,7 +108,7 @@ def plot_cumulative_trend():
 #     plt.close()
 
 # 시각화 4 - 전체 대시보드
-def plot_lifecycle_dashboard():
+def plot_lifecycle_dashboard(df, meme_name, output_path):
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
     fig.suptitle(f"'{meme_name}' 밈 수명 주기 대시보드", fontsize=18, weight="bold")
 
@@ -126,11 +131,28 @@ def plot_lifecycle_dashboard():
     ax2.grid(True, alpha=0.3)
 
     plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.savefig(output_path / f"{meme_name}_lifecycle.png", dpi=300)
+    with atomic_path(output_path / f"{meme_name}_lifecycle.png") as tmp_path:
+        plt.savefig(tmp_path, dpi=300)
     plt.close()
 
+# 전체 그림 생성 (df가 없으면 생명주기 분석 CSV에서 로드)
+def render_lifecycle_dashboard(meme_name, df=None):
+    if df is None:
+        df = pd.read_csv(input_path_for(meme_name), parse_dates=["date"])
+    output_path, output_path_visualization = output_paths_for(meme_name)
+
+    figures = [
+        (plot_daily_trend, output_path_visualization, f"{meme_name}_daily_trend.png"),
+        (plot_cumulative_trend, output_path_visualization, f"{meme_name}_cumulative_trend.png"),
+        # (plot_heatmap_by_time, output_path_visualization, f"{meme_name}_time_heatmap.png"),
+        (plot_lifecycle_dashboard, output_path, f"{meme_name}_lifecycle.png"),
+    ]
+    with trace.stage("visualization:lifecycle", platform="instagram", meme=meme_name, rows_in=len(df)):
+        for plot, figure_dir, filename in figures:
+            with trace.stage(f"figure:{Path(filename).stem}") as t:
+                plot(df, meme_name, figure_dir)
+                t.output(figure_dir / filename)
+    return [figure_dir / filename for _, figure_dir, filename in figures]
+
 if __name__ == "__main__":
-    plot_daily_trend()
-    plot_cumulative_trend()
-    # plot_heatmap_by_time()
-    plot_lifecycle_dashboard()
\ No newline at end of file
+    render_lifecycle_dashboard(meme_name_from_user())
@@ -11,32 +11,87 @@ import argparse
 import time
 from datetime import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from orchestration.workers import WorkerGroup, prefixed_print, python_command
+from orchestration.jobs import BatchRunner, STAGES, load_meme_list
+from orchestration.adapters import PlatformAdapter, skip_stages_from_args
+from orchestration import trace
+from orchestration.governor import ResourceGovernor, thread_limits
+from orchestration.stage_cache import CACHE_ENV
+from orchestration.watcher import RawDataWatcher
+from orchestration.results_store import ResultsStore
+from orchestration.runs import new_run_id, run_env, atomic_path
+from orchestration.lag_correlation import run_lag_correlation, METRICS, DEFAULT_MAX_LAG
+from orchestration.daemon import AnalysisDaemon, DEFAULT_PORT, find_daemon, request_analysis
 
 class TotalMemeAnalyzer:
-    def __init__(self):
-        """통합 밈 분석기 초기화"""
+    def __init__(self, in_process=True, core_budget=None):
+        """
+        통합 밈 분석기 초기화
+        in_process: 어댑터가 있는 플랫폼은 현재 프로세스에서 실행
+        core_budget: 동시 실행 워커들이 나눠 쓸 코어 수 (기본값: 사용 가능한 전체 코어)
+        """
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self.platforms = {
             'instagram': {
                 'dir': 'instagram_meme_lifecycle_analysis',
                 'script': 'pipeline.py',
-                'name': 'Instagram'
+                'name': 'Instagram',
+                # 감시 모드에서 확인할 원시 데이터 디렉토리
+                'raw_dir': 'data/raw',
+                # 배치 모드 단계별 실행 스크립트 및 인자
+                'stages': {
+                    # 배치 작업은 입력을 받을 수 없으므로 무인 수집 + 시간 제한 (다음 실행에서 이어서 수집)
+                    'collection': ['src/data_collection/instagram.py', '--unattended',
+                                   '--time-budget', '{time_budget}'],
+                    'analysis': ['pipeline.py', '--meme', '{meme}']
+                }
             },
             'reddit': {
                 'dir': 'reddit_meme_lifecycle_analysis', 
                 'script': 'run_pipeline.py',
-                'name': 'Reddit'
+                'name': 'Reddit',
+                'raw_dir': 'data/raw',
+                'stages': {
+                    'collection': ['run_pipeline.py', '--meme', '{meme}', '--skip-analysis', '--skip-visualization'],
+                    'analysis': ['run_pipeline.py', '--meme', '{meme}', '--skip-collection']
+                }
             },
             'twitter': {
                 'dir': 'twitter_meme_lifecycle_analysis',
                 'script': 'run_pipeline_twitter.py', 
-                'name': 'Twitter'
+                'name': 'Twitter',
+                'raw_dir': 'data/raw',
+                'stages': {
+                    'collection': ['twitter_only_collector.py', '--meme', '{meme}'],
+                    'analysis': ['run_pipeline_twitter.py', '--meme', '{meme}', '--skip-collection']
+                }
             }
         }
         
         # 결과 저장용 디렉토리
         self.results_dir = os.path.join(self.base_dir, 'integrated_results')
         os.makedirs(self.results_dir, exist_ok=True)
+        
+        # 플랫폼별 실행 시간 기록
+        self.platform_timings = {}
+        
+        # 단계별 성능 추적 기록
+        self.trace_records = []
+        
+        # 현재 실행 ID (플랫폼 파이프라인, 결과 저장소, 요약 파일이 같은 ID 공유)
+        self.run_id = None
+        
+        # 플랫폼 어댑터 (현재 프로세스 실행용)
+        self.in_process = in_process
+        self.adapters = {}
+        
+        # 동시 실행 워커별 연산 스레드 수 분배
+        self.governor = ResourceGovernor(core_budget)
+        
+        # 플랫폼 공통 스키마 결과 저장소 (integrated_results/store/)
+        self.store = ResultsStore(os.path.join(self.results_dir, 'store'))
     
     def check_platform_availability(self):
         """각 플랫폼 스크립트 존재 여부 확인"""
@@ -65,8 +120,15 @@ class TotalMemeAnalyzer:
         
         return available_platforms
     
+    def start_run(self):
+        """새 실행 ID 발급 (밈 이름과 함께 하위 파이프라인에 전달)"""
+        self.run_id = new_run_id()
+        return self.run_id
+    
     def run_platform_analysis(self, platform, meme_name, additional_args=None):
         """특정 플랫폼에서 밈 분석 실행"""
+        if self.run_id is None:
+            self.start_run()
         available_platforms = self.check_platform_availability()
         
         if platform not in available_platforms:
@@ -82,9 +144,79 @@ class TotalMemeAnalyzer:
         print(f"\n{'='*60}")
         print(f"🚀 {platform_info['name']} 파이프라인 실행 시작")
         print(f"밈: {meme_name}")
+        print(f"실행 ID: {self.run_id}")
         print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}")
         
+        # 어댑터가 있으면 현재 프로세스에서 실행 (import 공유)
+        adapter = self.get_adapter(platform)
+        if self.in_process and adapter.available:
+            success = self.run_platform_in_process(platform, platform_info, adapter, meme_name, additional_args)
+        else:
+            success = self.run_platform_subprocess(platform, platform_info, meme_name, additional_args)
+        
+        if success:
+            self.store_platform_results(platform, meme_name)
+        return success
+    
+    def store_platform_results(self, platform, meme_name, run_id=None):
+        """플랫폼 결과를 공통 스키마로 변환해 통합 결과 저장소에 추가"""
+        adapter = self.get_adapter(platform)
+        if not adapter.available:
+            return []
+        try:
+            posts = adapter.posts(meme_name)
+            if posts is None:
+                return []
+            return self.store.write(posts, platform, meme_name, run_id=run_id or self.run_id)
+        except Exception as e:
+            print(f"⚠️  통합 결과 저장소 기록 실패 ({platform}): {e}")
+            return []
+    
+    def get_adapter(self, platform):
+        """플랫폼 어댑터 반환 (한 번 로드한 어댑터는 재사용)"""
+        if platform not in self.adapters:
+            config = self.platforms[platform]
+            self.adapters[platform] = PlatformAdapter(
+                platform, os.path.join(self.base_dir, config['dir']), config['name']
+            )
+        return self.adapters[platform]
+    
+    def run_platform_in_process(self, platform, platform_info, adapter, meme_name, additional_args=None):
+        """플랫폼 어댑터를 통해 현재 프로세스에서 파이프라인 실행"""
+        print(f"🔌 어댑터 실행: {adapter.adapter_path}")
+        print()
+        
+        start_time = time.time()
+        try:
+            # 하위 프로세스 워커와 같은 스레드 예산을 현재 프로세스에도 적용 (실행이 끝나면 복원)
+            with thread_limits(self.governor.threads_per_worker):
+                stage_timings = adapter.run(
+                    meme_name, skip_stages=skip_stages_from_args(additional_args), run_id=self.run_id
+                )
+            success = True
+        except (Exception, SystemExit) as e:
+            print(f"\n❌ {platform_info['name']} 실행 중 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            stage_timings = {}
+            success = False
+        end_time = time.time()
+        self.trace_records.extend(trace.drain())
+        
+        self.platform_timings[platform] = {
+            'wall_time': round(end_time - start_time, 2),
+            'mode': 'in-process',
+            'stages': stage_timings
+        }
+        
+        if success:
+            print(f"\n✅ {platform_info['name']} 분석 완료!")
+            print(f"⏱️  소요 시간: {end_time - start_time:.2f}초")
+        return success
+    
+    def run_platform_subprocess(self, platform, platform_info, meme_name, additional_args=None):
+        """별도 Python 프로세스로 플랫폼 파이프라인 실행"""
         # 명령어 구성
         cmd = [sys.executable, platform_info['path'], '--meme', meme_name]
         
@@ -92,19 +224,23 @@ class TotalMemeAnalyzer:
         if additional_args:
             cmd.extend(additional_args)
         
-        # 작업 디렉토리를 플랫폼 디렉토리로 변경
-        original_cwd = os.getcwd()
-        
         try:
-            os.chdir(platform_info['dir'])
             print(f"📁 작업 디렉토리: {platform_info['dir']}")
             print(f"🔧 실행 명령어: {' '.join(cmd)}")
             print()
             
-            # 파이프라인 실행
+            # 파이프라인 실행 (os.chdir 대신 cwd 지정)
+            env, trace_file = self.trace_env(platform, meme_name)
+            env = self.governor.worker_env(env)
             start_time = time.time()
-            result = subprocess.run(cmd, capture_output=False, text=True)
+            result = subprocess.run(cmd, cwd=platform_info['dir'], env=env, capture_output=False, text=True)
             end_time = time.time()
+            self.collect_trace_file(trace_file)
+            self.platform_timings[platform] = {
+                'wall_time': round(end_time - start_time, 2),
+                'mode': 'subprocess',
+                'returncode': result.returncode
+            }
             
             if result.returncode == 0:
                 print(f"\n✅ {platform_info['name']} 분석 완료!")
@@ -117,34 +253,132 @@ class TotalMemeAnalyzer:
         except Exception as e:
             print(f"❌ {platform_info['name']} 실행 중 오류: {e}")
             return False
+    
+    def trace_env(self, platform, meme_name):
+        """하위 프로세스에 밈 이름/실행 ID와 단계별 추적 기록 파일 경로를 환경 변수로 전달"""
+        pending_dir = os.path.join(self.results_dir, 'traces', 'pending')
+        os.makedirs(pending_dir, exist_ok=True)
+        trace_file = os.path.join(pending_dir, f"{platform}_{os.getpid()}_{int(time.time() * 1000)}.jsonl")
+        
+        env = run_env(meme_name, self.run_id)
+        env[trace.TRACE_FILE_ENV] = trace_file
+        return env, trace_file
+    
+    def collect_trace_file(self, trace_file):
+        """하위 프로세스 추적 기록 수집 후 임시 파일 삭제"""
+        self.trace_records.extend(trace.read_trace_file(trace_file))
+        if os.path.exists(trace_file):
+            os.remove(trace_file)
+    
+    def run_platform_worker(self, platform, platform_info, meme_name, workers, additional_args=None):
+        """동시 실행 모드에서 한 플랫폼 파이프라인을 워커 프로세스로 실행"""
+        prefix = platform_info['name']
+        cmd = python_command(platform_info['path'], '--meme', meme_name, *(additional_args or []))
+        
+        prefixed_print(prefix, f"🚀 파이프라인 시작 ({datetime.now().strftime('%H:%M:%S')})")
+        prefixed_print(prefix, f"🔧 실행 명령어: {' '.join(cmd)}")
+        
+        try:
+            # os.chdir 대신 cwd 지정 (스레드 간 작업 디렉토리 공유 문제 방지)
+            env, trace_file = self.trace_env(platform, meme_name)
+            env = self.governor.worker_env(env)
+            result = workers.run(cmd, cwd=platform_info['dir'], prefix=prefix, env=env)
+            self.collect_trace_file(trace_file)
+        except Exception as e:
+            prefixed_print(prefix, f"❌ 실행 중 오류: {e}")
+            return False, {'wall_time': 0.0, 'returncode': None, 'error': str(e)}
+        
+        timing = {
+            'wall_time': round(result['wall_time'], 2),
+            'mode': 'subprocess',
+            'returncode': result['returncode']
+        }
+        if result['cancelled']:
+            timing['cancelled'] = True
+        
+        success = result['returncode'] == 0 and not result['cancelled']
+        if success:
+            self.store_platform_results(platform, meme_name)
+            prefixed_print(prefix, f"✅ 분석 완료! (⏱️  {result['wall_time']:.2f}초)")
+        else:
+            prefixed_print(prefix, f"❌ 분석 실패 (종료 코드: {result['returncode']})")
+        return success, timing
+    
+    def run_concurrent_platform_analysis(self, platforms, meme_name, additional_args=None, jobs=2):
+        """여러 플랫폼 파이프라인을 워커별로 동시에 실행"""
+        available_platforms = self.check_platform_availability()
+        
+        results = {}
+        runnable = []
+        for platform in platforms:
+            platform_info = available_platforms.get(platform)
+            if not platform_info or not platform_info['available']:
+                print(f"❌ {platform.title()} 파이프라인을 찾을 수 없습니다.")
+                results[platform] = False
+            else:
+                runnable.append(platform)
+        
+        threads = self.governor.plan(min(jobs, len(runnable)))
+        print(f"🧮 코어 예산 {self.governor.core_budget}개 → 워커당 스레드 {threads}개")
+        
+        workers = WorkerGroup()
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        futures = {
+            executor.submit(
+                self.run_platform_worker, platform, available_platforms[platform],
+                meme_name, workers, additional_args
+            ): platform
+            for platform in runnable
+        }
+        
+        try:
+            for future in as_completed(futures):
+                platform = futures[future]
+                success, timing = future.result()
+                results[platform] = success
+                self.platform_timings[platform] = timing
+        except KeyboardInterrupt:
+            print("\n⛔ 중단 요청 - 실행 중인 워커를 종료합니다...")
+            workers.cancel_all()
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
         finally:
-            os.chdir(original_cwd)
+            executor.shutdown(wait=True)
+        
+        # 입력 순서대로 정렬
+        return {platform: results[platform] for platform in platforms}
     
-    def run_multi_platform_analysis(self, platforms, meme_name, additional_args=None):
-        """여러 플랫폼에서 동시 분석"""
+    def run_multi_platform_analysis(self, platforms, meme_name, additional_args=None, jobs=1):
+        """여러 플랫폼에서 동시 분석 (jobs > 1이면 플랫폼별 워커로 동시 실행)"""
         print(f"\n🎯 다중 플랫폼 분석 시작")
         print(f"밈: {meme_name}")
         print(f"플랫폼: {', '.join([p.title() for p in platforms])}")
+        if jobs > 1:
+            print(f"동시 실행 워커 수: {min(jobs, len(platforms))}")
         
         results = {}
+        self.platform_timings = {}
+        self.start_run()
+        self.governor.plan(1)
+        self.governor.start()
         total_start_time = time.time()
         
-        for platform in platforms:
-            print(f"\n🔄 {platform.title()} 분석 중...")
-            success = self.run_platform_analysis(platform, meme_name, additional_args)
-            results[platform] = success
-            
-            if success:
-                print(f"✅ {platform.title()} 완료")
-            else:
-                print(f"❌ {platform.title()} 실패")
-            
-            # 플랫폼 간 대기 시간 (API 제한 고려)
-            if platform != platforms[-1]:  # 마지막이 아니면
-                print("⏳ 플랫폼 전환 대기... (10초)")
-                time.sleep(10)
+        if jobs > 1:
+            results = self.run_concurrent_platform_analysis(platforms, meme_name, additional_args, jobs)
+        else:
+            for platform in platforms:
+                print(f"\n🔄 {platform.title()} 분석 중...")
+                success = self.run_platform_analysis(platform, meme_name, additional_args)
+                results[platform] = success
+                
+                if success:
+                    print(f"✅ {platform.title()} 완료")
+                else:
+                    print(f"❌ {platform.title()} 실패")
+                # 요청 제한은 각 수집기의 플랫폼별 공유 토큰 버킷(orchestration.ratelimit)이 담당
         
         total_end_time = time.time()
+        resource_usage = self.governor.finish(self.trace_records)
         
         # 결과 요약
         print(f"\n{'='*60}")
@@ -161,21 +395,46 @@ class TotalMemeAnalyzer:
             status = "✅" if success else "❌"
             print(f"  {status} {platform.title()}")
         
+        for platform, timing in self.platform_timings.items():
+            print(f"  ⏱️  {platform.title()}: {timing['wall_time']:.2f}초")
+        
         # 결과 저장
-        self.save_analysis_summary(meme_name, platforms, results)
+        self.save_analysis_summary(
+            meme_name, platforms, results,
+            timings=self.platform_timings,
+            total_wall_time=total_end_time - total_start_time,
+            jobs=jobs,
+            resource_usage=resource_usage
+        )
         
         return results
     
-    def save_analysis_summary(self, meme_name, platforms, results):
+    def save_analysis_summary(self, meme_name, platforms, results, timings=None, total_wall_time=None, jobs=1,
+                              resource_usage=None):
         """분석 결과 요약 저장"""
+        trace_file = trace.save_run_trace(
+            self.results_dir, meme_name, self.trace_records,
+            run_info={
+                'platforms': platforms, 'jobs': jobs,
+                'platform_timings': timings or {}, 'resource_usage': resource_usage
+            }
+        )
+        
         summary = {
             'meme_name': meme_name,
+            'run_id': self.run_id,
             'analysis_date': datetime.now().isoformat(),
             'platforms_analyzed': platforms,
             'results': results,
             'success_rate': sum(results.values()) / len(results),
             'total_platforms': len(platforms),
-            'successful_platforms': sum(results.values())
+            'successful_platforms': sum(results.values()),
+            'jobs': jobs,
+            'platform_timings': timings or {},
+            'total_wall_time': round(total_wall_time, 2) if total_wall_time is not None else None,
+            'stage_summary': trace.summarize(self.trace_records),
+            'resource_usage': resource_usage,
+            'trace_file': trace_file
         }
         
         summary_file = os.path.join(
@@ -183,10 +442,16 @@ class TotalMemeAnalyzer:
             f"{meme_name.replace(' ', '_').lower()}_analysis_summary.json"
         )
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        # 같은 밈을 동시에 분석해도 읽는 쪽은 완성된 요약 파일만 보도록 교체 방식으로 저장
+        with atomic_path(summary_file) as tmp_file:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
         
         print(f"📄 분석 요약 저장: {summary_file}")
+        print(f"📈 단계별 추적 기록 저장: {trace_file}")
+        
+        summary['summary_file'] = summary_file
+        return summary
     
     def list_available_platforms(self):
         """사용 가능한 플랫폼 목록 출력"""
@@ -286,6 +551,60 @@ class TotalMemeAnalyzer:
         else:
             print("❌ 실행이 취소되었습니다.")
 
+def run_batch_mode(analyzer, args):
+    """배치 모드 실행"""
+    memes = [args.meme] if args.meme else load_meme_list(args.memes_file, analyzer.base_dir)
+    if not memes:
+        print("❌ 배치로 실행할 밈이 없습니다.")
+        return
+    
+    if not args.platform or 'all' in args.platform:
+        platforms, _ = analyzer.list_available_platforms()
+    else:
+        platforms = args.platform
+    
+    runner = BatchRunner(
+        analyzer, memes, platforms,
+        stages=args.stages,
+        jobs=args.jobs,
+        job_timeout=args.job_timeout,
+        batch_id=args.batch_id,
+        restart=args.restart
+    )
+    
+    try:
+        runner.run()
+    except KeyboardInterrupt:
+        print(f"\n⛔ 배치 중단: python main.py --batch --batch-id {runner.batch_id} 로 이어서 실행할 수 있습니다.")
+
+def run_via_daemon(daemon_info, platforms, meme_name, additional_args, no_cache=False, cores=None):
+    """실행 중인 상주 분석 서비스에 분석 요청 (서비스 코드가 오래되어 거절되면 False)"""
+    print(f"🛰️  상주 분석 서비스에 요청: http://{daemon_info['host']}:{daemon_info['port']}")
+    response = request_analysis(daemon_info, meme_name, platforms, additional_args,
+                                no_cache=no_cache, cores=cores)
+    
+    if response.get('stale_code'):
+        print(f"⚠️  {response['error']}")
+        print("   이번 요청은 직접 실행합니다.")
+        return False
+    
+    if 'error' in response:
+        print(f"❌ 서비스 오류: {response['error']}")
+        return True
+    
+    for platform, success in response['results'].items():
+        status = "✅" if success else "❌"
+        timing = response['platform_timings'].get(platform, {})
+        print(f"  {status} {platform.title()} ({timing.get('wall_time', 0):.2f}초)")
+    
+    print(f"📄 분석 요약: {response['summary_file']}")
+    print(f"📈 단계별 추적 기록: {response['trace_file']}")
+    if response.get('outputs'):
+        print(f"📁 생성된 파일 ({len(response['outputs'])}개):")
+        for path in response['outputs']:
+            print(f"  • {path}")
+    return True
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(
@@ -305,6 +624,21 @@ def main():
   # 여러 플랫폼 선택
   python main.py --meme "pepe" --platform reddit twitter
   
+  # 모든 플랫폼을 동시에 실행 (워커 3개)
+  python main.py --meme "wojak" --platform all --jobs 3
+  
+  # 배치 모드 (memes.txt의 밈 목록, 중단 후 재실행 시 이어서 진행)
+  python main.py --batch --memes-file memes.txt --platform twitter --jobs 4
+  
+  # 원시 데이터 감시 (새 수집 파일이 생긴 밈만 재분석)
+  python main.py --watch --platform twitter instagram
+  
+  # 플랫폼 간 시차 상관 (통합 결과 저장소의 모든 밈, 6시간 격자)
+  python main.py --lag-correlation --lag-freq 6h --max-lag 28
+  
+  # 상주 분석 서비스 실행 (모델/폰트를 한 번만 로딩, 이후 실행은 자동으로 서비스에 요청)
+  python main.py --serve
+  
   # 플랫폼 상태 확인
   python main.py --list-platforms
         """
@@ -325,17 +659,85 @@ def main():
                        help='시각화 건너뛰기 (모든 플랫폼에 적용)')
     parser.add_argument('--skip-analysis', action='store_true',
                        help='분석 건너뛰기 (모든 플랫폼에 적용)')
+    parser.add_argument('--subprocess', action='store_true',
+                       help='플랫폼 어댑터 대신 플랫폼별 Python 프로세스로 실행')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='동시에 실행할 플랫폼 워커 수 (기본값: 1, 순차 실행)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='단계 캐시를 사용하지 않고 모든 단계를 다시 계산')
+    parser.add_argument('--cores', type=int,
+                       help='동시 실행 워커들이 나눠 쓸 코어 수 (기본값: 사용 가능한 전체 코어)')
+    parser.add_argument('--batch', action='store_true',
+                       help='배치 모드: 여러 밈 × 플랫폼 × 단계 작업 실행')
+    parser.add_argument('--memes-file', type=str,
+                       help='배치 모드 밈 목록 파일 (한 줄에 하나, 없으면 config.TARGET_MEMES)')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES,
+                       help='배치 모드에서 실행할 단계')
+    parser.add_argument('--job-timeout', type=int, default=3600,
+                       help='배치 작업당 제한 시간(초)')
+    parser.add_argument('--batch-id', type=str,
+                       help='배치 ID (같은 ID로 재실행하면 저널을 보고 이어서 실행)')
+    parser.add_argument('--restart', action='store_true',
+                       help='저널을 무시하고 배치를 처음부터 실행')
+    parser.add_argument('--watch', action='store_true',
+                       help='원시 데이터 디렉토리를 감시하다가 새 파일이 생긴 밈만 재분석')
+    parser.add_argument('--watch-window', type=float, default=10.0,
+                       help='감시 모드에서 파일 도착을 묶어 기다리는 시간(초)')
+    parser.add_argument('--lag-correlation', action='store_true',
+                       help='통합 결과 저장소로 플랫폼 간 시차 상관(선행/후행) 표 생성')
+    parser.add_argument('--lag-freq', type=str, default='D',
+                       help='시차 상관 시간 격자 (예: D, 6h, h)')
+    parser.add_argument('--lag-metric', choices=METRICS, default='posts',
+                       help='시차 상관에 사용할 지표')
+    parser.add_argument('--max-lag', type=int, default=DEFAULT_MAX_LAG,
+                       help='최대 시차 (격자 칸 수)')
+    parser.add_argument('--serve', action='store_true',
+                       help='상주 분석 서비스 실행 (localhost)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                       help=f'상주 분석 서비스 포트 (기본값: {DEFAULT_PORT})')
+    parser.add_argument('--no-daemon', action='store_true',
+                       help='상주 분석 서비스가 실행 중이어도 직접 실행')
     
     args = parser.parse_args()
     
+    # 하위 프로세스와 어댑터 모두 환경 변수로 캐시 사용 여부 확인
+    if args.no_cache:
+        os.environ[CACHE_ENV] = '0'
+    
     # 통합 분석기 생성
-    analyzer = TotalMemeAnalyzer()
+    analyzer = TotalMemeAnalyzer(in_process=not args.subprocess, core_budget=args.cores)
     
     # 플랫폼 목록 출력
     if args.list_platforms:
         analyzer.list_available_platforms()
         return
     
+    # 상주 분석 서비스
+    if args.serve:
+        AnalysisDaemon(analyzer, port=args.port).serve_forever()
+        return
+    
+    # 플랫폼 간 시차 상관
+    if args.lag_correlation:
+        run_lag_correlation(
+            analyzer.results_dir,
+            platforms=None if not args.platform or 'all' in args.platform else args.platform,
+            memes=[args.meme] if args.meme else None,
+            freq=args.lag_freq, metric=args.lag_metric, max_lag=args.max_lag
+        )
+        return
+    
+    # 감시 모드
+    if args.watch:
+        platforms = None if not args.platform or 'all' in args.platform else args.platform
+        RawDataWatcher(analyzer, platforms, window=args.watch_window).run()
+        return
+    
+    # 배치 모드
+    if args.batch:
+        run_batch_mode(analyzer, args)
+        return
+    
     # 대화형 모드 또는 인자 없을 때
     if args.interactive or (not args.meme and not args.platform):
         analyzer.interactive_mode()
@@ -366,12 +768,29 @@ def main():
     else:
         platforms = args.platform
     
+    # 순차 실행은 상주 분석 서비스가 있으면 서비스에 요청 (모델 로딩 생략)
+    daemon_info = None
+    if args.jobs <= 1 and not args.subprocess and not args.no_daemon:
+        daemon_info = find_daemon(analyzer.results_dir)
+    
     # 실행
     try:
+        if daemon_info and run_via_daemon(daemon_info, platforms, args.meme, additional_args,
+                                          no_cache=args.no_cache, cores=args.cores):
+            return
         if len(platforms) == 1:
-            analyzer.run_platform_analysis(platforms[0], args.meme, additional_args)
+            analyzer.start_run()
+            analyzer.governor.start()
+            start_time = time.time()
+            success = analyzer.run_platform_analysis(platforms[0], args.meme, additional_args)
+            analyzer.save_analysis_summary(
+                args.meme, platforms, {platforms[0]: success},
+                timings=analyzer.platform_timings,
+                total_wall_time=time.time() - start_time,
+                resource_usage=analyzer.governor.finish(analyzer.trace_records)
+            )
         else:
-            analyzer.run_multi_platform_analysis(platforms, args.meme, additional_args)
+            analyzer.run_multi_platform_analysis(platforms, args.meme, additional_args, jobs=args.jobs)
     except KeyboardInterrupt:
         print("\n\n⛔ 사용자에 의해 중단되었습니다.")
     except Exception as e:
@@ -0,0 +1,136 @@
+"""
+플랫폼 어댑터 로더
+각 플랫폼 디렉토리의 adapter.py(collect/preprocess/analyze/visualize)를
+하나의 프로세스에서 호출하여 pandas, matplotlib 등 무거운 import를 공유
+"""
+
+import os
+import sys
+import time
+import threading
+import importlib.util
+from contextlib import contextmanager
+
+from orchestration.runs import run_environment
+
+ADAPTER_FILE = 'adapter.py'
+STAGE_FUNCTIONS = ['collect', 'preprocess', 'analyze', 'visualize']
+
+# 플랫폼마다 같은 이름으로 존재하는 최상위 모듈 (config, src, utils)
+# 플랫폼을 전환할 때 서로 섞이지 않도록 sys.modules에서 분리 보관
+ISOLATED_PACKAGES = ('config', 'src', 'utils')
+
+# sys.modules / sys.path를 교체하므로 동시에 하나의 플랫폼만 활성화
+_activation_lock = threading.RLock()
+
+
+def _is_isolated(module_name):
+    return module_name.split('.')[0] in ISOLATED_PACKAGES
+
+
+class PlatformAdapter:
+    """플랫폼 파이프라인을 현재 프로세스에서 실행하는 어댑터"""
+
+    def __init__(self, platform, platform_dir, name=None):
+        self.platform = platform
+        self.platform_dir = platform_dir
+        self.name = name or platform.title()
+        self.adapter_path = os.path.join(platform_dir, ADAPTER_FILE)
+        self._module = None
+        # 이 플랫폼에서 import된 config/src/utils 모듈 (재실행 시 재사용)
+        self._modules = {}
+
+    @property
+    def available(self):
+        return os.path.exists(self.adapter_path)
+
+    @contextmanager
+    def activate(self):
+        """플랫폼 모듈 공간으로 전환 (절대 경로 기반, 작업 디렉토리는 변경하지 않음)"""
+        with _activation_lock:
+            outside = {n: m for n, m in sys.modules.items() if _is_isolated(n)}
+            for module_name in outside:
+                del sys.modules[module_name]
+            sys.modules.update(self._modules)
+
+            saved_path = list(sys.path)
+            sys.path.insert(0, self.platform_dir)
+            try:
+                yield
+            finally:
+                self._modules = {n: m for n, m in sys.modules.items() if _is_isolated(n)}
+                for module_name in self._modules:
+                    del sys.modules[module_name]
+                sys.modules.update(outside)
+                sys.path[:] = saved_path
+
+    def load(self):
+        """adapter.py 로드 (최초 1회)"""
+        if self._module is None:
+            with self.activate():
+                spec = importlib.util.spec_from_file_location(
+                    f"{self.platform}_platform_adapter", self.adapter_path
+                )
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+
+            missing = [fn for fn in STAGE_FUNCTIONS if not callable(getattr(module, fn, None))]
+            if missing:
+                raise AttributeError(f"{self.adapter_path}에 진입점이 없습니다: {', '.join(missing)}")
+            self._module = module
+        return self._module
+
+    def warm_up(self):
+        """adapter.py에 warm_up()이 있으면 실행 (모델, 폰트 등 미리 로딩)"""
+        module = self.load()
+        warm_up = getattr(module, 'warm_up', None)
+        if callable(warm_up):
+            with self.activate():
+                warm_up()
+
+    def posts(self, meme_name):
+        """adapter.py의 posts()로 공통 스키마 게시물 DataFrame 조회 (없으면 None)"""
+        module = self.load()
+        posts = getattr(module, 'posts', None)
+        if not callable(posts):
+            return None
+        with self.activate():
+            return posts(meme_name)
+
+    @property
+    def default_stages(self):
+        return list(getattr(self.load(), 'DEFAULT_STAGES', STAGE_FUNCTIONS))
+
+    def run_stage(self, stage, meme_name):
+        """단일 단계 실행"""
+        module = self.load()
+        with self.activate():
+            return getattr(module, stage)(meme_name)
+
+    def run(self, meme_name, skip_stages=(), run_id=None):
+        """
+        기본 단계 순서대로 실행 후 단계별 소요 시간 반환
+        실행하는 동안 MEME_NAME / MEME_RUN_ID를 설정해 플랫폼 스크립트가 전역 파일 대신 이 값을 읽음
+        """
+        timings = {}
+        with run_environment(meme_name, run_id):
+            for stage in self.default_stages:
+                if stage in skip_stages:
+                    print(f"⏭️  {self.name} {stage} 단계 건너뜀")
+                    continue
+
+                print(f"▶ {self.name} {stage} 단계 실행")
+                start_time = time.time()
+                self.run_stage(stage, meme_name)
+                timings[stage] = round(time.time() - start_time, 2)
+        return timings
+
+
+def skip_stages_from_args(additional_args):
+    """main.py의 --skip-* 인자를 어댑터 단계 이름으로 변환"""
+    mapping = {
+        '--skip-collection': 'collect',
+        '--skip-analysis': 'analyze',
+        '--skip-visualization': 'visualize',
+    }
+    return {mapping[arg] for arg in (additional_args or []) if arg in mapping}
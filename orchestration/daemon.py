@@ -0,0 +1,292 @@
+"""
+상주 분석 서비스 (localhost HTTP)
+임베딩 모델, 폰트, 시각화 라이브러리를 한 번만 로딩해 두고
+"밈 X를 플랫폼 Y에서 분석" 요청을 받아 결과 경로와 지표를 반환
+
+실행:   python main.py --serve
+요청:   python main.py --meme "chill guy" --platform twitter --skip-collection
+        (서비스가 실행 중이면 main.py가 자동으로 서비스에 요청)
+
+- --no-cache / --cores는 요청마다 전달되어 그 요청에만 적용
+- 시작할 때 소스 코드 해시를 기록하고, 디스크의 코드가 바뀌었으면 요청을 거절
+  (main.py는 거절되면 직접 실행으로 전환)
+"""
+
+import os
+import json
+import hashlib
+import time
+import threading
+import urllib.request
+import urllib.error
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from orchestration.governor import ResourceGovernor
+from orchestration.stage_cache import CACHE_ENV
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+STATE_FILE = '.daemon.json'
+
+# 상태 확인은 짧게, 분석 요청은 오래 기다림
+HEALTH_TIMEOUT = 1.0
+REQUEST_TIMEOUT = 6 * 60 * 60
+
+
+# 코드 해시에 포함할 소스 (프로젝트 루트 기준)
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_SUFFIXES = ('.py',)
+SKIP_DIRS = {'__pycache__', 'tests', 'data', 'results', 'integrated_results'}
+
+
+def state_path(results_dir):
+    return os.path.join(results_dir, STATE_FILE)
+
+
+def code_hash(root=SOURCE_ROOT):
+    """프로젝트 소스 파일 전체의 해시 (서비스가 로딩한 코드와 디스크의 코드 비교용)"""
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        for filename in sorted(filenames):
+            if not filename.endswith(SOURCE_SUFFIXES):
+                continue
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, root).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class AnalysisDaemon:
+    """분석기를 상주시켜 두고 HTTP 요청을 처리하는 서비스"""
+
+    def __init__(self, analyzer, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.analyzer = analyzer
+        self.host = host
+        self.port = port
+        self.started_at = None
+        self.requests_served = 0
+        self.code_hash = None
+        # 어댑터는 sys.modules를 교체하므로 분석은 한 번에 하나씩
+        self._analysis_lock = threading.Lock()
+
+    def warm_up(self):
+        """무거운 라이브러리, 모델, 폰트 미리 로딩"""
+        # 서비스 스레드에서 그림을 그리므로 GUI 없는 백엔드 사용
+        import matplotlib
+        matplotlib.use('Agg')
+        import pandas
+        import matplotlib.pyplot
+        import seaborn
+
+        available_platforms = self.analyzer.check_platform_availability()
+        for platform, info in available_platforms.items():
+            if not info['available']:
+                continue
+            adapter = self.analyzer.get_adapter(platform)
+            if not adapter.available:
+                continue
+
+            start_time = time.time()
+            try:
+                adapter.warm_up()
+                print(f"🔥 {info['name']} 준비 완료 ({time.time() - start_time:.2f}초)")
+            except Exception as e:
+                print(f"⚠️  {info['name']} 사전 로딩 실패 (요청 시 다시 시도): {e}")
+
+    def code_changed(self):
+        """서비스 시작 이후 디스크의 소스 코드가 바뀌었는지 확인"""
+        return self.code_hash is not None and code_hash() != self.code_hash
+
+    def analyze(self, meme_name, platforms, additional_args=None, no_cache=False, cores=None):
+        """
+        분석 실행 후 결과 경로와 지표 반환
+        no_cache / cores는 이 요청에만 적용 (끝나면 서비스 설정으로 되돌림)
+        """
+        with self._analysis_lock:
+            analyzer = self.analyzer
+            saved_cache = os.environ.get(CACHE_ENV)
+            saved_governor = analyzer.governor
+            if no_cache:
+                os.environ[CACHE_ENV] = '0'
+            if cores:
+                analyzer.governor = ResourceGovernor(cores)
+            try:
+                return self._analyze(meme_name, platforms, additional_args)
+            finally:
+                analyzer.governor = saved_governor
+                if saved_cache is None:
+                    os.environ.pop(CACHE_ENV, None)
+                else:
+                    os.environ[CACHE_ENV] = saved_cache
+
+    def _analyze(self, meme_name, platforms, additional_args):
+        # analyze()가 잠금과 요청별 설정을 적용한 뒤 호출
+        analyzer = self.analyzer
+        analyzer.platform_timings = {}
+        analyzer.trace_records = []
+        analyzer.start_run()
+
+        analyzer.governor.start()
+        start_time = time.time()
+        results = {}
+        for platform in platforms:
+            results[platform] = analyzer.run_platform_analysis(platform, meme_name, additional_args)
+        total_wall_time = time.time() - start_time
+
+        summary = analyzer.save_analysis_summary(
+            meme_name, platforms, results,
+            timings=analyzer.platform_timings,
+            total_wall_time=total_wall_time,
+            resource_usage=analyzer.governor.finish(analyzer.trace_records)
+        )
+
+        outputs = []
+        for record in analyzer.trace_records:
+            for path in record.get('outputs') or []:
+                if path not in outputs:
+                    outputs.append(path)
+
+        self.requests_served += 1
+        summary['outputs'] = outputs
+        return summary
+
+    def health(self):
+        return {
+            'status': 'ok',
+            'pid': os.getpid(),
+            'started_at': self.started_at,
+            'requests_served': self.requests_served,
+            'busy': self._analysis_lock.locked(),
+            'code_hash': self.code_hash,
+        }
+
+    def serve_forever(self):
+        """서비스 시작 (Ctrl-C로 종료)"""
+        print("\n🛰️  상주 분석 서비스 시작 준비")
+        # 이 프로세스가 로딩한 코드 기준 (이후 코드가 바뀌면 요청 거절)
+        self.code_hash = code_hash()
+        self.warm_up()
+
+        server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        self.port = server.server_address[1]
+        self.started_at = datetime.now().isoformat()
+
+        state_file = state_path(self.analyzer.results_dir)
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'host': self.host,
+                'port': self.port,
+                'pid': os.getpid(),
+                'started_at': self.started_at,
+                'code_hash': self.code_hash
+            }, f, ensure_ascii=False, indent=2)
+
+        print(f"✅ 서비스 실행 중: http://{self.host}:{self.port} (Ctrl-C로 종료)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n⛔ 서비스 종료")
+        finally:
+            server.server_close()
+            if os.path.exists(state_file):
+                os.remove(state_file)
+
+
+def _make_handler(daemon):
+    class Handler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send_json(200, daemon.health())
+            else:
+                self._send_json(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if self.path != '/analyze':
+                self._send_json(404, {'error': 'not found'})
+                return
+
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length).decode('utf-8'))
+                meme_name = request['meme']
+                platforms = request['platforms']
+            except (ValueError, KeyError) as e:
+                self._send_json(400, {'error': f"잘못된 요청: {e}"})
+                return
+
+            unknown = [p for p in platforms if p not in daemon.analyzer.platforms]
+            if unknown:
+                self._send_json(400, {'error': f"지원하지 않는 플랫폼: {', '.join(unknown)}"})
+                return
+
+            if daemon.code_changed():
+                self._send_json(409, {
+                    'error': "서비스 시작 이후 코드가 변경되었습니다. 서비스를 다시 시작하세요 (python main.py --serve)",
+                    'stale_code': True,
+                })
+                return
+
+            try:
+                result = daemon.analyze(meme_name, platforms, request.get('additional_args'),
+                                        no_cache=bool(request.get('no_cache')), cores=request.get('cores'))
+            except Exception as e:
+                self._send_json(500, {'error': str(e)})
+                return
+            self._send_json(200, result)
+
+        def log_message(self, format, *args):
+            print(f"🛰️  {self.address_string()} {format % args}")
+
+    return Handler
+
+
+def find_daemon(results_dir):
+    """실행 중인 서비스 정보 반환 (없거나 응답이 없으면 None)"""
+    state_file = state_path(results_dir)
+    if not os.path.exists(state_file):
+        return None
+
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        url = f"http://{info['host']}:{info['port']}/health"
+        with urllib.request.urlopen(url, timeout=HEALTH_TIMEOUT) as response:
+            if json.loads(response.read().decode('utf-8')).get('status') == 'ok':
+                return info
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def request_analysis(info, meme_name, platforms, additional_args=None, no_cache=False, cores=None):
+    """서비스에 분석 요청 후 결과 반환 (no_cache / cores는 이 요청에만 적용)"""
+    payload = json.dumps({
+        'meme': meme_name,
+        'platforms': platforms,
+        'additional_args': additional_args or [],
+        'no_cache': no_cache,
+        'cores': cores
+    }, ensure_ascii=False).encode('utf-8')
+
+    request = urllib.request.Request(
+        f"http://{info['host']}:{info['port']}/analyze",
+        data=payload,
+        headers={'Content-Type': 'application/json; charset=utf-8'},
+        method='POST'
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            return json.loads(response.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+        return json.loads(e.read().decode('utf-8'))
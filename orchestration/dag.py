@@ -0,0 +1,135 @@
+"""
+의존 관계 그래프(DAG) 실행기
+단계 사이의 의존 관계만 선언하면 선행 단계가 끝난 노드부터 스레드 풀에서 동시에 실행
+
+- 노드 함수가 False를 반환하거나 예외가 나면 실패, 그 노드에 의존하는 노드는 건너뜀
+- 실행 후 노드별 시작/종료 시각과 임계 경로(전체 소요 시간을 결정한 의존 사슬) 보고
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_SKIPPED = 'skipped'
+
+
+class DagRunner:
+    """의존 관계 그래프 실행기"""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        # 노드 이름 → (함수, 선행 노드 목록), 추가한 순서 유지
+        self.nodes = {}
+
+    def add(self, name, func, deps=()):
+        """노드 추가 (선행 노드는 먼저 추가되어 있어야 함)"""
+        if name in self.nodes:
+            raise ValueError(f"이미 있는 노드: {name}")
+        missing = [dep for dep in deps if dep not in self.nodes]
+        if missing:
+            raise ValueError(f"{name}: 알 수 없는 선행 노드 {', '.join(missing)}")
+        self.nodes[name] = (func, list(deps))
+        return name
+
+    def _run_node(self, name):
+        func, _ = self.nodes[name]
+        start = time.time()
+        error = None
+        try:
+            ok = func() is not False
+        except Exception as e:
+            ok = False
+            error = f"{type(e).__name__}: {e}"
+        return ok, start, time.time(), error
+
+    def run(self):
+        """전체 그래프 실행 후 보고서(dict) 반환"""
+        results = {}
+        started_at = time.time()
+        pending = dict(self.nodes)
+        running = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers or max(1, len(self.nodes)))
+        try:
+            while pending or running:
+                # 선행 노드가 모두 끝난 노드 제출 (선행 노드가 실패했으면 건너뜀)
+                for name, (_, deps) in list(pending.items()):
+                    if not all(dep in results for dep in deps):
+                        continue
+                    del pending[name]
+                    if any(results[dep]['status'] != STATUS_DONE for dep in deps):
+                        results[name] = {'status': STATUS_SKIPPED, 'deps': deps}
+                        continue
+                    running[executor.submit(self._run_node, name)] = name
+
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    ok, start, end, error = future.result()
+                    results[name] = {
+                        'status': STATUS_DONE if ok else STATUS_FAILED,
+                        'deps': self.nodes[name][1],
+                        'start': round(start - started_at, 3),
+                        'end': round(end - started_at, 3),
+                        'duration': round(end - start, 3),
+                    }
+                    if error:
+                        results[name]['error'] = error
+        finally:
+            executor.shutdown(wait=True)
+
+        wall_time = time.time() - started_at
+        critical_path, critical_time = self.critical_path(results)
+        return {
+            'wall_time': round(wall_time, 3),
+            'serial_time': round(sum(r.get('duration', 0.0) for r in results.values()), 3),
+            'max_workers': self.max_workers,
+            'critical_path': critical_path,
+            'critical_path_time': round(critical_time, 3),
+            'nodes': {name: results[name] for name in self.nodes},
+        }
+
+    def critical_path(self, results):
+        """실행된 노드 기준 소요 시간 합이 가장 긴 의존 사슬"""
+        longest = {}
+        previous = {}
+        for name in self.nodes:  # 추가 순서 = 위상 정렬 순서
+            result = results.get(name, {})
+            if 'duration' not in result:
+                continue
+            best_dep = max(
+                (dep for dep in result['deps'] if dep in longest),
+                key=lambda dep: longest[dep], default=None
+            )
+            longest[name] = result['duration'] + (longest[best_dep] if best_dep else 0.0)
+            previous[name] = best_dep
+
+        if not longest:
+            return [], 0.0
+
+        node = max(longest, key=longest.get)
+        total = longest[node]
+        path = []
+        while node:
+            path.append(node)
+            node = previous[node]
+        return path[::-1], total
+
+
+def print_report(report):
+    """노드별 소요 시간과 임계 경로 출력"""
+    icons = {STATUS_DONE: '✅', STATUS_FAILED: '❌', STATUS_SKIPPED: '⏭️ '}
+    print(f"\n⏱️  단계별 소요 시간 (총 {report['wall_time']:.2f}초, 순차 실행 시 {report['serial_time']:.2f}초)")
+    for name, result in report['nodes'].items():
+        icon = icons[result['status']]
+        if 'duration' in result:
+            print(f"  {icon} {name:<28} {result['duration']:>7.2f}초  "
+                  f"({result['start']:.2f} → {result['end']:.2f})")
+        else:
+            print(f"  {icon} {name:<28} {'-':>7}   (선행 단계 실패)")
+    if report['critical_path']:
+        print(f"🧭 임계 경로 ({report['critical_path_time']:.2f}초): {' → '.join(report['critical_path'])}")
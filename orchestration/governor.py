@@ -0,0 +1,174 @@
+"""
+CPU 스레드 자원 분배
+동시에 실행되는 파이프라인 워커들이 각자 모든 코어를 쓰려고 하면
+BLAS/OpenMP/torch 스레드가 과도하게 생겨 오히려 느려지므로
+코어 예산을 워커 수로 나누어 워커별 스레드 수를 제한
+
+- 하위 프로세스: THREAD_ENV_VARS 환경 변수로 전달 (라이브러리 로딩 전에 적용됨)
+- 현재 프로세스: apply_thread_limits()로 torch / threadpoolctl 설정
+  (main.py 어댑터 실행은 thread_limits()로 플랫폼 실행 동안만 적용 후 복원)
+- 실행 후 CPU 사용률(코어 예산 대비)을 요약에 기록
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 워커 스레드 수 (플랫폼 코드에서 apply_thread_limits()가 읽음)
+WORKER_THREADS_ENV = 'MEME_WORKER_THREADS'
+# 전체 코어 예산 (기본값: 현재 프로세스가 사용할 수 있는 코어 수)
+CORE_BUDGET_ENV = 'MEME_CORE_BUDGET'
+
+THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'NUMEXPR_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+)
+
+
+def available_cores():
+    """현재 프로세스가 사용할 수 있는 코어 수"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _cpu_seconds():
+    """현재 프로세스 + 종료된 하위 프로세스의 누적 CPU 시간"""
+    if resource is None:
+        return time.process_time()
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+def apply_thread_limits(threads=None):
+    """
+    현재 프로세스의 연산 스레드 수 제한
+    threads가 없으면 MEME_WORKER_THREADS 환경 변수 사용 (없으면 아무것도 하지 않음)
+    """
+    if threads is None:
+        value = os.environ.get(WORKER_THREADS_ENV)
+        if not value:
+            return None
+        threads = int(value)
+
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+
+    # 이미 로딩된 라이브러리는 환경 변수를 다시 읽지 않으므로 직접 설정
+    if 'torch' in sys.modules:
+        sys.modules['torch'].set_num_threads(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=threads)
+    except ImportError:
+        pass
+    return threads
+
+
+@contextmanager
+def thread_limits(threads):
+    """
+    with 블록 동안 현재 프로세스의 연산 스레드 수 제한 (끝나면 이전 설정으로 복원)
+    블록 안에서 처음 로딩되는 라이브러리도 환경 변수(MEME_WORKER_THREADS 포함)로 같은 제한을 받음
+    """
+    names = THREAD_ENV_VARS + (WORKER_THREADS_ENV,)
+    saved_env = {name: os.environ.get(name) for name in names}
+    torch = sys.modules.get('torch')
+    saved_torch = torch.get_num_threads() if torch else None
+    try:
+        from threadpoolctl import threadpool_limits
+        controller = threadpool_limits(limits=threads)
+    except ImportError:
+        controller = None
+
+    for name in names:
+        os.environ[name] = str(threads)
+    if torch:
+        torch.set_num_threads(threads)
+    try:
+        yield threads
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        if torch:
+            torch.set_num_threads(saved_torch)
+        if controller is not None:
+            controller.restore_original_limits()
+
+
+class ResourceGovernor:
+    """코어 예산을 동시 실행 워커에 분배하고 사용률 측정"""
+
+    def __init__(self, core_budget=None):
+        budget = core_budget or os.environ.get(CORE_BUDGET_ENV) or available_cores()
+        self.core_budget = max(1, int(budget))
+        self.workers = 1
+        self._started = None
+
+    def plan(self, workers):
+        """동시 워커 수에 맞춰 워커별 스레드 수 결정"""
+        self.workers = max(1, min(workers, self.core_budget))
+        return self.threads_per_worker
+
+    @property
+    def threads_per_worker(self):
+        return max(1, self.core_budget // self.workers)
+
+    def worker_env(self, env=None):
+        """워커 프로세스 환경 변수에 스레드 제한 추가"""
+        env = dict(os.environ if env is None else env)
+        threads = str(self.threads_per_worker)
+        for name in THREAD_ENV_VARS:
+            env[name] = threads
+        env[WORKER_THREADS_ENV] = threads
+        return env
+
+    def start(self):
+        """사용률 측정 시작"""
+        self._started = (time.time(), _cpu_seconds())
+
+    def finish(self, trace_records=None):
+        """측정 종료 후 사용률 보고 (trace_records가 있으면 플랫폼별 CPU 시간 포함)"""
+        if self._started is None:
+            return None
+        wall_start, cpu_start = self._started
+        self._started = None
+
+        wall_time = time.time() - wall_start
+        cpu_time = _cpu_seconds() - cpu_start
+        report = {
+            'core_budget': self.core_budget,
+            'workers': self.workers,
+            'threads_per_worker': self.threads_per_worker,
+            'wall_time': round(wall_time, 2),
+            'cpu_time': round(cpu_time, 2),
+            'utilization': round(cpu_time / (wall_time * self.core_budget), 3) if wall_time > 0 else None,
+        }
+
+        if trace_records:
+            platform_cpu = {}
+            for record in trace_records:
+                if record.get('parent') or record.get('cpu_time') is None:
+                    continue
+                platform = record.get('platform') or 'unknown'
+                platform_cpu[platform] = round(platform_cpu.get(platform, 0.0) + record['cpu_time'], 2)
+            report['platform_cpu_time'] = platform_cpu
+
+        print(f"🧮 CPU 사용률: {report['utilization'] or 0:.0%} "
+              f"(코어 {self.core_budget}개, 워커 {self.workers}개 × 스레드 {self.threads_per_worker}개)")
+        return report
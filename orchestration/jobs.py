@@ -0,0 +1,315 @@
+"""
+여러 밈 × 플랫폼 × 단계 배치 작업 큐
+작업 상태를 로컬 저널(JSON Lines)에 기록하여 중단된 배치를 이어서 실행
+"""
+
+import os
+import ast
+import json
+import hashlib
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from orchestration.workers import WorkerGroup, prefixed_print, python_command
+from orchestration.runs import new_run_id, run_env
+
+# 단계 실행 순서
+STAGES = ['collection', 'analysis']
+
+# 작업 상태
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_TIMEOUT = 'timeout'
+STATUS_SKIPPED = 'skipped'
+STATUS_CANCELLED = 'cancelled'
+
+# 단계 인자의 {time_budget}: 작업 제한 시간이 없을 때 기본값 (초)
+DEFAULT_TIME_BUDGET = 1800
+# 작업 제한 시간 중 스크립트가 스스로 멈추는 데 쓰는 비율 (나머지는 체크포인트 저장/종료 여유)
+TIME_BUDGET_RATIO = 0.9
+
+
+def load_meme_list(memes_file=None, base_dir=None):
+    """밈 목록 로드 (파일 지정 시 한 줄에 하나, 없으면 Twitter config의 TARGET_MEMES)"""
+    if memes_file:
+        with open(memes_file, 'r', encoding='utf-8') as f:
+            memes = [line.strip() for line in f]
+        return [m for m in memes if m and not m.startswith('#')]
+
+    return load_target_memes(base_dir)
+
+
+def load_target_memes(base_dir):
+    """
+    twitter_meme_lifecycle_analysis/config/config.py의 TARGET_MEMES 읽기
+    config 모듈은 import 시 디렉토리 생성/.env 로딩을 수행하므로 값만 파싱
+    """
+    config_path = os.path.join(base_dir, 'twitter_meme_lifecycle_analysis', 'config', 'config.py')
+    with open(config_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=config_path)
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == 'TARGET_MEMES':
+                    return list(ast.literal_eval(node.value))
+    return []
+
+
+def job_id(meme, platform, stage):
+    """작업 식별자"""
+    return f"{meme}::{platform}::{stage}"
+
+
+def expand_jobs(memes, platforms, stages=None):
+    """밈 목록을 (밈, 플랫폼, 단계) 작업으로 전개"""
+    stages = [s for s in STAGES if s in (stages or STAGES)]
+    jobs = []
+    for meme in memes:
+        for platform in platforms:
+            for stage in stages:
+                jobs.append({
+                    'id': job_id(meme, platform, stage),
+                    'meme': meme,
+                    'platform': platform,
+                    'stage': stage
+                })
+    return jobs
+
+
+def default_batch_id(memes, platforms, stages):
+    """
+    같은 구성(밈 × 플랫폼 × 단계)의 배치는 날짜와 관계없이 같은 ID
+    (다음 날 재실행해도 저널을 보고 이어서 실행, 처음부터 다시 하려면 --restart)
+    """
+    key = json.dumps([memes, sorted(platforms), stages], ensure_ascii=False)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:8]
+    return f"batch_{digest}"
+
+
+class JobJournal:
+    """작업 상태 저널 (추가 전용 JSON Lines)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def load(self):
+        """저널 재생 - 작업별 마지막 상태 반환"""
+        states = {}
+        if not os.path.exists(self.path):
+            return states
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 강제 종료로 마지막 줄이 잘린 경우 무시
+                    continue
+                states[record['id']] = record
+        return states
+
+    def record(self, job, status, **fields):
+        """작업 상태 기록 (즉시 디스크에 반영)"""
+        record = {
+            'id': job['id'],
+            'meme': job['meme'],
+            'platform': job['platform'],
+            'stage': job['stage'],
+            'status': status,
+            'time': datetime.now().isoformat(),
+            **fields
+        }
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        return record
+
+
+class BatchRunner:
+    """제한된 워커 풀로 배치 작업 실행"""
+
+    def __init__(self, analyzer, memes, platforms, stages=None, jobs=1,
+                 job_timeout=None, batch_id=None, restart=False):
+        self.analyzer = analyzer
+        self.memes = memes
+        self.platforms = platforms
+        self.stages = [s for s in STAGES if s in (stages or STAGES)]
+        self.jobs = max(1, jobs)
+        self.job_timeout = job_timeout
+        self.batch_id = batch_id or default_batch_id(memes, platforms, self.stages)
+        self.restart = restart
+
+        self.batch_dir = os.path.join(analyzer.results_dir, 'batches')
+        self.journal = JobJournal(os.path.join(self.batch_dir, f"{self.batch_id}.jsonl"))
+        self.workers = WorkerGroup()
+        self.resource_usage = None
+
+    def time_budget(self):
+        """스크립트가 스스로 멈출 시간 (초, 작업 제한 시간보다 짧게)"""
+        if self.job_timeout:
+            return int(self.job_timeout * TIME_BUDGET_RATIO)
+        return DEFAULT_TIME_BUDGET
+
+    def build_command(self, job, platform_info):
+        """작업 단계별 실행 명령어 구성 (인자의 {meme}, {time_budget} 치환)"""
+        stage_config = self.analyzer.platforms[job['platform']]['stages'][job['stage']]
+        script_path = os.path.join(platform_info['dir'], stage_config[0])
+        args = [arg.format(meme=job['meme'], time_budget=self.time_budget()) for arg in stage_config[1:]]
+        return python_command(script_path, *args)
+
+    def run_job(self, job, platform_info):
+        """단일 작업 실행 후 상태 반환"""
+        prefix = f"{platform_info['name']}:{job['meme']}:{job['stage']}"
+        cmd = self.build_command(job, platform_info)
+
+        if not os.path.exists(cmd[1]):
+            prefixed_print(prefix, f"❌ 스크립트 없음: {cmd[1]}")
+            self.journal.record(job, STATUS_FAILED, error='script not found')
+            return STATUS_FAILED
+
+        # 작업마다 실행 ID를 따로 발급해 같은 체크아웃에서 여러 밈을 동시에 실행해도 작업 상태가 섞이지 않음
+        run_id = new_run_id()
+        self.journal.record(job, STATUS_RUNNING)
+        result = self.workers.run(
+            cmd, cwd=platform_info['dir'], prefix=prefix,
+            env=self.analyzer.governor.worker_env(run_env(job['meme'], run_id)),
+            timeout=self.job_timeout, stdin_devnull=True
+        )
+
+        if result['cancelled']:
+            status = STATUS_CANCELLED
+        elif result['timed_out']:
+            status = STATUS_TIMEOUT
+        elif result['returncode'] == 0:
+            status = STATUS_DONE
+        else:
+            status = STATUS_FAILED
+
+        self.journal.record(
+            job, status,
+            returncode=result['returncode'],
+            wall_time=round(result['wall_time'], 2),
+            run_id=run_id
+        )
+
+        if status == STATUS_DONE and job['stage'] == 'analysis':
+            self.analyzer.store_platform_results(job['platform'], job['meme'], run_id=run_id)
+        return status
+
+    def run_chain(self, chain, platform_info):
+        """같은 (밈, 플랫폼)의 단계들을 순서대로 실행 (앞 단계 실패 시 이후 단계 건너뜀)"""
+        statuses = {}
+        blocked = False
+        for job in chain:
+            if blocked:
+                self.journal.record(job, STATUS_SKIPPED, reason='previous stage failed')
+                statuses[job['id']] = STATUS_SKIPPED
+                continue
+
+            status = self.run_job(job, platform_info)
+            statuses[job['id']] = status
+            if status != STATUS_DONE:
+                blocked = True
+        return statuses
+
+    def run(self):
+        """배치 실행 (완료된 작업은 저널을 보고 건너뜀)"""
+        all_jobs = expand_jobs(self.memes, self.platforms, self.stages)
+        previous = {} if self.restart else self.journal.load()
+
+        available_platforms = self.analyzer.check_platform_availability()
+
+        print(f"\n📦 배치 실행: {self.batch_id}")
+        print(f"📒 저널: {self.journal.path}")
+
+        statuses = {}
+        chains = {}
+        for job in all_jobs:
+            if previous.get(job['id'], {}).get('status') == STATUS_DONE:
+                statuses[job['id']] = STATUS_DONE
+                continue
+
+            platform_info = available_platforms.get(job['platform'])
+            if not platform_info or not platform_info['available']:
+                statuses[job['id']] = STATUS_SKIPPED
+                continue
+
+            chains.setdefault((job['meme'], job['platform']), []).append(job)
+
+        resumed = sum(1 for s in statuses.values() if s == STATUS_DONE)
+        pending = sum(len(chain) for chain in chains.values())
+        print(f"🧮 전체 작업 {len(all_jobs)}개 | 완료(건너뜀) {resumed}개 | 실행 대기 {pending}개")
+        print(f"👷 워커 수: {self.jobs} | 작업 제한 시간: {self.job_timeout or '없음'}초")
+
+        governor = self.analyzer.governor
+        threads = governor.plan(min(self.jobs, max(1, len(chains))))
+        print(f"🧮 코어 예산 {governor.core_budget}개 → 워커당 스레드 {threads}개")
+        governor.start()
+
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        futures = [
+            executor.submit(self.run_chain, chain, available_platforms[platform])
+            for (meme, platform), chain in chains.items()
+        ]
+
+        try:
+            for future in as_completed(futures):
+                statuses.update(future.result())
+        except KeyboardInterrupt:
+            print("\n⛔ 중단 요청 - 실행 중인 작업을 종료합니다. 다시 실행하면 이어서 진행합니다.")
+            self.workers.cancel_all()
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+        self.resource_usage = governor.finish()
+        self.save_batch_summary(all_jobs, statuses)
+        return statuses
+
+    def save_batch_summary(self, all_jobs, statuses):
+        """배치 결과 요약 저장"""
+        counts = {}
+        for status in statuses.values():
+            counts[status] = counts.get(status, 0) + 1
+
+        print(f"\n{'='*60}")
+        print(f"🏁 배치 완료: {self.batch_id}")
+        for status, count in sorted(counts.items()):
+            print(f"  • {status}: {count}개")
+        print(f"{'='*60}")
+
+        summary = {
+            'batch_id': self.batch_id,
+            'finished_at': datetime.now().isoformat(),
+            'memes': self.memes,
+            'platforms': self.platforms,
+            'stages': self.stages,
+            'jobs': self.jobs,
+            'job_timeout': self.job_timeout,
+            'status_counts': counts,
+            'resource_usage': self.resource_usage,
+            'job_status': {job['id']: statuses.get(job['id']) for job in all_jobs}
+        }
+
+        summary_file = os.path.join(self.batch_dir, f"{self.batch_id}_summary.json")
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        print(f"📄 배치 요약 저장: {summary_file}")
+
+        unfinished = sum(count for status, count in counts.items() if status != STATUS_DONE)
+        if unfinished:
+            print(f"🔁 남은 작업 {unfinished}개: python main.py --batch --batch-id {self.batch_id} 로 이어서 실행할 수 있습니다.")
+        return summary_file
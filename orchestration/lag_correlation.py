@@ -0,0 +1,158 @@
+"""
+플랫폼 간 시차 상관 분석
+밈별로 플랫폼 시계열(게시물 수 또는 참여 지표)을 같은 시간 격자에 맞춘 뒤
+모든 (밈, 플랫폼 쌍)의 시차 교차 상관을 FFT로 한 번에 계산해
+어느 플랫폼에서 먼저 정점을 찍는지(선행 플랫폼과 시차)를 표로 저장
+
+- 입력: 통합 결과 저장소(orchestration.results_store)의 게시물 테이블
+- lag > 0 : platform_a가 platform_b보다 lag만큼 먼저 움직임
+- 밈 수가 많아도 밈 묶음(chunk) 단위로 rfft/irfft 한 번씩만 수행
+"""
+
+import os
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from orchestration.results_store import load_posts
+
+METRICS = ('posts', 'likes', 'shares', 'views', 'engagement')
+DEFAULT_MAX_LAG = 14
+CHUNK_SIZE = 512
+
+
+def _step(freq):
+    """격자 간격 ('D', '6h' 등 → Timedelta)"""
+    return pd.Timedelta(freq if freq[0].isdigit() else f"1{freq}")
+
+
+def build_series(posts, freq='D', metric='posts'):
+    """
+    게시물 → 밈별 플랫폼 시계열 배열
+    반환값: (memes, platforms, starts, values[밈, 플랫폼, 시간], lengths[밈])
+    - 밈마다 모든 플랫폼의 첫 게시물 ~ 마지막 게시물 구간을 같은 격자로 사용
+    - 관측이 없는 칸은 0, 격자 뒤쪽 남는 칸도 0
+    """
+    posts = posts.dropna(subset=['created_at'])
+    if posts.empty:
+        return [], [], [], np.zeros((0, 0, 0)), np.zeros(0, dtype=int)
+
+    posts = posts.assign(bucket=pd.to_datetime(posts['created_at'], utc=True).dt.floor(freq))
+    if metric == 'posts':
+        grouped = posts.groupby(['meme', 'platform', 'bucket']).size()
+    else:
+        grouped = posts.groupby(['meme', 'platform', 'bucket'])[metric].sum(min_count=1).fillna(0)
+
+    memes = sorted(grouped.index.get_level_values('meme').unique())
+    platforms = sorted(grouped.index.get_level_values('platform').unique())
+    meme_index = {m: i for i, m in enumerate(memes)}
+    platform_index = {p: i for i, p in enumerate(platforms)}
+
+    step = _step(freq)
+    bounds = grouped.reset_index().groupby('meme')['bucket'].agg(['min', 'max'])
+    starts = [bounds.loc[m, 'min'] for m in memes]
+    lengths = np.array([int((bounds.loc[m, 'max'] - bounds.loc[m, 'min']) / step) + 1 for m in memes])
+
+    values = np.zeros((len(memes), len(platforms), int(lengths.max())), dtype=np.float64)
+    frame = grouped.reset_index(name='value')
+    rows = frame['meme'].map(meme_index).to_numpy()
+    cols = frame['platform'].map(platform_index).to_numpy()
+    offsets = ((frame['bucket'] - frame['meme'].map(bounds['min'])) / step).astype(int).to_numpy()
+    values[rows, cols, offsets] = frame['value'].to_numpy(dtype=np.float64)
+
+    return memes, platforms, starts, values, lengths
+
+
+def cross_correlate(values, lengths, max_lag):
+    """
+    values[밈, 플랫폼, 시간]의 모든 플랫폼 쌍 교차 상관 (FFT)
+    반환값: (쌍 목록, corr[밈, 쌍, 2*max_lag+1]) - 가운데가 lag 0
+    상관은 각 밈의 유효 구간에서 평균을 뺀 뒤 에너지로 정규화 (lag 0 = 피어슨 상관)
+    |lag|가 밈의 격자 길이 - 1보다 크면 NaN (겹치는 구간이 없고, FFT 버퍼에서 다른 lag 값으로 감김)
+    """
+    n_memes, n_platforms, n_time = values.shape
+    pairs = list(combinations(range(n_platforms), 2))
+    corr = np.full((n_memes, len(pairs), 2 * max_lag + 1), np.nan)
+    if not pairs or n_memes == 0:
+        return pairs, corr
+
+    a_idx = np.array([a for a, _ in pairs])
+    b_idx = np.array([b for _, b in pairs])
+    nfft = 1 << int(np.ceil(np.log2(max(2, 2 * n_time - 1))))
+    lags = np.arange(-max_lag, max_lag + 1)
+
+    for start in range(0, n_memes, CHUNK_SIZE):
+        chunk = values[start:start + CHUNK_SIZE]
+        chunk_lengths = lengths[start:start + CHUNK_SIZE]
+
+        # 유효 구간만 평균 제거 (뒤쪽 패딩은 0 유지)
+        valid = np.arange(n_time)[None, None, :] < chunk_lengths[:, None, None]
+        means = chunk.sum(axis=2, keepdims=True) / chunk_lengths[:, None, None]
+        centered = np.where(valid, chunk - means, 0.0)
+        energy = (centered ** 2).sum(axis=2)
+
+        spectrum = np.fft.rfft(centered, n=nfft, axis=2)
+        # irfft(conj(A) * B)[k] = sum_t a[t] * b[t + k]
+        raw = np.fft.irfft(np.conj(spectrum[:, a_idx]) * spectrum[:, b_idx], n=nfft, axis=2)
+        raw = raw[:, :, lags % nfft]
+
+        norm = np.sqrt(energy[:, a_idx] * energy[:, b_idx])
+        # 밈마다 유효한 lag만 (nfft >= 2*n_time-1이므로 |lag| <= 길이-1 범위는 감기지 않음)
+        in_range = np.abs(lags)[None, None, :] <= (chunk_lengths[:, None, None] - 1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr[start:start + CHUNK_SIZE] = np.where((norm[:, :, None] > 0) & in_range, raw / norm[:, :, None], np.nan)
+
+    return pairs, corr
+
+
+def lead_lag_table(posts, freq='D', metric='posts', max_lag=DEFAULT_MAX_LAG):
+    """밈 × 플랫폼 쌍별 선행/후행 표"""
+    memes, platforms, starts, values, lengths = build_series(posts, freq, metric)
+    pairs, corr = cross_correlate(values, lengths, max_lag)
+
+    step = _step(freq)
+    active = values.sum(axis=2) > 0
+    rows = []
+    for m, meme in enumerate(memes):
+        for p, (a, b) in enumerate(pairs):
+            if not (active[m, a] and active[m, b]):
+                continue
+            series = corr[m, p]
+            if np.all(np.isnan(series)):
+                continue
+            best = int(np.nanargmax(series))
+            lag = best - max_lag
+            rows.append({
+                'meme': meme,
+                'platform_a': platforms[a],
+                'platform_b': platforms[b],
+                'leader': platforms[a] if lag > 0 else platforms[b] if lag < 0 else 'simultaneous',
+                'lag_steps': lag,
+                'lag_hours': round(lag * step / pd.Timedelta(hours=1), 2),
+                'peak_corr': round(float(series[best]), 4),
+                'zero_lag_corr': round(float(series[max_lag]), 4),
+                'grid_start': starts[m],
+                'grid_length': int(lengths[m]),
+            })
+    return pd.DataFrame(rows)
+
+
+def run_lag_correlation(results_dir, platforms=None, memes=None, freq='D', metric='posts',
+                        max_lag=DEFAULT_MAX_LAG):
+    """통합 결과 저장소에서 읽어 선행/후행 표를 CSV로 저장"""
+    if metric not in METRICS:
+        raise ValueError(f"지원하지 않는 지표: {metric}")
+
+    columns = ['platform', 'meme', 'created_at'] + ([metric] if metric != 'posts' else [])
+    posts = load_posts(platforms, memes, columns=columns, store_dir=os.path.join(results_dir, 'store'))
+    table = lead_lag_table(posts, freq, metric, max_lag)
+    if table.empty:
+        print("⚠️  두 개 이상의 플랫폼에 결과가 있는 밈이 없습니다.")
+        return None
+
+    output_path = os.path.join(results_dir, f"lag_correlation_{metric}_{freq.lower()}.csv")
+    table.to_csv(output_path, index=False, encoding='utf-8-sig')
+    print(f"📐 플랫폼 간 시차 상관: {table['meme'].nunique()}개 밈, {len(table)}개 플랫폼 쌍")
+    print(f"📄 선행/후행 표 저장: {output_path}")
+    return output_path
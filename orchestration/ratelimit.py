@@ -0,0 +1,119 @@
+"""
+플랫폼별 요청 속도 제한 (프로세스 간 공유 토큰 버킷)
+수집기 프로세스가 여러 개 동시에 실행되어도 플랫폼별 요청 예산을 넘지 않도록
+버킷 상태를 로컬 파일에 저장하고 파일 잠금으로 갱신
+
+사용 예시:
+    limiter = RateLimiter('twitter')
+    limiter.acquire()          # 토큰이 생길 때까지 대기 후 요청
+    driver.get(url)
+
+- 버킷이 가득 차 있으면 대기 없이 바로 진행 (유휴 시간만큼 예산이 쌓임)
+- 설정은 RATE_LIMITS, 환경 변수 MEME_RATE_<PLATFORM>="초당 요청 수,버스트" 로 덮어쓰기 가능
+- 상태 파일 위치: integrated_results/.ratelimit/ (MEME_RATELIMIT_DIR 로 변경 가능)
+"""
+
+import os
+import json
+import time
+
+from orchestration.filelock import locked
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR_ENV = 'MEME_RATELIMIT_DIR'
+DEFAULT_STATE_DIR = os.path.join(ROOT_DIR, 'integrated_results', '.ratelimit')
+
+# 플랫폼별 예산: rate = 초당 토큰 보충량, burst = 버킷 크기
+# 기존 고정 대기 시간(스크롤당 3초)과 평균 속도가 같도록 설정
+RATE_LIMITS = {
+    'twitter': {'rate': 1 / 3, 'burst': 3},
+    'instagram': {'rate': 1 / 3, 'burst': 2},
+    'reddit': {'rate': 1.0, 'burst': 5},
+}
+DEFAULT_LIMIT = {'rate': 1 / 3, 'burst': 1}
+
+
+def limit_for(platform):
+    """플랫폼 예산 조회 (환경 변수 우선)"""
+    limit = dict(RATE_LIMITS.get(platform, DEFAULT_LIMIT))
+    override = os.environ.get(f"MEME_RATE_{platform.upper()}")
+    if override:
+        try:
+            rate, _, burst = override.partition(',')
+            limit['rate'] = float(rate)
+            if burst:
+                limit['burst'] = float(burst)
+        except ValueError:
+            print(f"⚠️  잘못된 속도 제한 설정 무시: MEME_RATE_{platform.upper()}={override}")
+    return limit
+
+
+class RateLimiter:
+    """파일 기반 토큰 버킷"""
+
+    def __init__(self, platform, rate=None, burst=None, state_dir=None):
+        limit = limit_for(platform)
+        self.platform = platform
+        self.rate = rate if rate is not None else limit['rate']
+        self.burst = burst if burst is not None else limit['burst']
+
+        state_dir = state_dir or os.environ.get(STATE_DIR_ENV) or DEFAULT_STATE_DIR
+        os.makedirs(state_dir, exist_ok=True)
+        self.state_path = os.path.join(state_dir, f"{platform}.json")
+        self.lock_path = os.path.join(state_dir, f"{platform}.lock")
+
+        self.total_wait = 0.0
+        self.acquired = 0
+
+    def _read_state(self, now):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return float(state['tokens']), float(state['updated_at'])
+        except (OSError, ValueError, KeyError):
+            # 상태가 없으면 가득 찬 버킷으로 시작
+            return float(self.burst), now
+
+    def _write_state(self, tokens, now):
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'tokens': tokens, 'updated_at': now}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def try_acquire(self, tokens=1):
+        """토큰을 가져오면 0, 부족하면 필요한 대기 시간(초) 반환"""
+        with locked(self.lock_path):
+            # 여러 프로세스가 공유하므로 벽시계 시간 기준
+            now = time.time()
+            available, updated_at = self._read_state(now)
+            available = min(self.burst, available + max(0.0, now - updated_at) * self.rate)
+
+            if available >= tokens:
+                self._write_state(available - tokens, now)
+                return 0.0
+
+            self._write_state(available, now)
+            return (tokens - available) / self.rate
+
+    def acquire(self, tokens=1):
+        """토큰이 생길 때까지 대기 후 가져오기 (대기한 시간 반환)"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                break
+            time.sleep(delay)
+            waited += delay
+
+        self.total_wait += waited
+        self.acquired += 1
+        return waited
+
+    def stats(self):
+        return {
+            'platform': self.platform,
+            'rate': self.rate,
+            'burst': self.burst,
+            'acquired': self.acquired,
+            'total_wait': round(self.total_wait, 2),
+        }
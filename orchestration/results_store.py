@@ -0,0 +1,166 @@
+"""
+플랫폼 공통 결과 저장소 (integrated_results/store/)
+플랫폼마다 컬럼 이름이 다른 CSV 대신 공통 스키마의 컬럼 기반(Parquet) 파일로 저장해
+여러 플랫폼/밈을 한 번에 조회
+
+구조:
+    store/posts/platform=<플랫폼>/meme=<밈>/part-<run_id>.parquet
+    store/daily/platform=<플랫폼>/meme=<밈>/part-<run_id>.parquet
+
+- 실행마다 새 파일을 추가하고, 조회 시에는 (플랫폼, 밈)별 최신 실행만 읽음
+- 파티션별로 최근 KEEP_RUNS개 실행만 보관
+- pyarrow가 필요 (없으면 저장을 건너뛰고 경고만 출력)
+"""
+
+import os
+import glob
+
+import pandas as pd
+
+from orchestration.runs import new_run_id
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STORE_DIR = os.path.join(ROOT_DIR, 'integrated_results', 'store')
+KEEP_RUNS = 3
+
+# 게시물 단위 공통 스키마
+# engagement: 플랫폼에서 수집 가능한 반응 수 합계 (좋아요 + 공유 + 댓글)
+POST_COLUMNS = ['platform', 'meme', 'created_at', 'author', 'text',
+                'likes', 'shares', 'views', 'engagement', 'run_id']
+METRIC_COLUMNS = ['likes', 'shares', 'views', 'engagement']
+
+# 일별 집계 스키마
+DAILY_COLUMNS = ['platform', 'meme', 'date', 'posts',
+                 'likes', 'shares', 'views', 'engagement', 'run_id']
+
+TABLES = ('posts', 'daily')
+
+
+def partition_value(value):
+    """파티션 디렉토리 이름으로 쓸 수 있게 정리"""
+    return str(value).strip().replace(' ', '_').replace('/', '_').lower()
+
+
+def normalize_posts(df, platform, meme_name):
+    """플랫폼 어댑터가 넘긴 DataFrame을 공통 게시물 스키마로 정리 (없는 지표는 NaN)"""
+    posts = pd.DataFrame(index=df.index)
+    posts['platform'] = platform
+    posts['meme'] = meme_name
+    posts['created_at'] = pd.to_datetime(df.get('created_at'), errors='coerce', utc=True)
+    posts['author'] = df['author'].astype('string') if 'author' in df else pd.NA
+    posts['text'] = df['text'].astype('string') if 'text' in df else pd.NA
+
+    for column in METRIC_COLUMNS:
+        if column in df:
+            posts[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+        else:
+            posts[column] = float('nan')
+
+    if 'engagement' not in df:
+        posts['engagement'] = posts[['likes', 'shares']].sum(axis=1, min_count=1)
+
+    posts['run_id'] = None
+    return posts[POST_COLUMNS].reset_index(drop=True)
+
+
+def daily_aggregate(posts):
+    """게시물 → 일별 집계"""
+    if posts.empty:
+        return pd.DataFrame(columns=DAILY_COLUMNS)
+
+    posts = posts.dropna(subset=['created_at']).copy()
+    posts['date'] = posts['created_at'].dt.tz_convert('UTC').dt.normalize().dt.tz_localize(None)
+
+    grouped = posts.groupby(['platform', 'meme', 'date'], sort=True)
+    daily = grouped[METRIC_COLUMNS].sum(min_count=1)
+    daily.insert(0, 'posts', grouped.size())
+    daily = daily.reset_index()
+    daily['run_id'] = posts['run_id'].iloc[0] if len(posts) else None
+    return daily[DAILY_COLUMNS]
+
+
+class ResultsStore:
+    """파티션 구조의 Parquet 저장소"""
+
+    def __init__(self, store_dir=None, keep_runs=KEEP_RUNS):
+        self.store_dir = store_dir or DEFAULT_STORE_DIR
+        self.keep_runs = keep_runs
+
+    def partition_dir(self, table, platform, meme_name):
+        return os.path.join(
+            self.store_dir, table,
+            f"platform={partition_value(platform)}",
+            f"meme={partition_value(meme_name)}"
+        )
+
+    def _write_part(self, table, df, platform, meme_name, run_id):
+        part_dir = self.partition_dir(table, platform, meme_name)
+        os.makedirs(part_dir, exist_ok=True)
+        part_path = os.path.join(part_dir, f"part-{run_id}.parquet")
+        tmp_path = f"{part_path}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, part_path)
+
+        # 오래된 실행 정리
+        parts = sorted(glob.glob(os.path.join(part_dir, 'part-*.parquet')))
+        for old_part in parts[:-self.keep_runs]:
+            os.remove(old_part)
+        return part_path
+
+    def write(self, posts, platform, meme_name, run_id=None):
+        """한 플랫폼 실행 결과(게시물 + 일별 집계) 추가. 저장한 파일 경로 반환"""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("⚠️  pyarrow가 설치되어 있지 않아 통합 결과 저장소 기록을 건너뜁니다. (pip install pyarrow)")
+            return []
+
+        run_id = run_id or new_run_id()
+        posts = normalize_posts(posts, platform, meme_name)
+        posts['run_id'] = run_id
+        daily = daily_aggregate(posts)
+
+        paths = [
+            self._write_part('posts', posts, platform, meme_name, run_id),
+            self._write_part('daily', daily, platform, meme_name, run_id),
+        ]
+        print(f"🗄️  통합 결과 저장소 기록: {platform} / {meme_name} ({len(posts)}건, {len(daily)}일)")
+        return paths
+
+    def latest_parts(self, table, platforms=None, memes=None):
+        """(플랫폼, 밈)별 최신 실행 파일 목록"""
+        platform_filter = {partition_value(p) for p in platforms} if platforms else None
+        meme_filter = {partition_value(m) for m in memes} if memes else None
+
+        parts = []
+        for platform_dir in sorted(glob.glob(os.path.join(self.store_dir, table, 'platform=*'))):
+            if platform_filter and platform_dir.split('platform=', 1)[1] not in platform_filter:
+                continue
+            for meme_dir in sorted(glob.glob(os.path.join(platform_dir, 'meme=*'))):
+                if meme_filter and meme_dir.split('meme=', 1)[1] not in meme_filter:
+                    continue
+                files = sorted(glob.glob(os.path.join(meme_dir, 'part-*.parquet')))
+                if files:
+                    parts.append(files[-1])
+        return parts
+
+    def read(self, table='posts', platforms=None, memes=None, columns=None):
+        """플랫폼/밈 조건에 맞는 최신 결과를 하나의 DataFrame으로 조회"""
+        if table not in TABLES:
+            raise ValueError(f"알 수 없는 테이블: {table}")
+
+        parts = self.latest_parts(table, platforms, memes)
+        if not parts:
+            return pd.DataFrame(columns=columns or (POST_COLUMNS if table == 'posts' else DAILY_COLUMNS))
+
+        import pyarrow.parquet as pq
+        frames = [pq.read_table(path, columns=columns).to_pandas() for path in parts]
+        return pd.concat(frames, ignore_index=True)
+
+
+def load_posts(platforms=None, memes=None, columns=None, store_dir=None):
+    return ResultsStore(store_dir).read('posts', platforms, memes, columns)
+
+
+def load_daily(platforms=None, memes=None, columns=None, store_dir=None):
+    return ResultsStore(store_dir).read('daily', platforms, memes, columns)
@@ -0,0 +1,75 @@
+"""
+실행 단위 정보 (밈 이름, 실행 ID) 전달과 원자적 파일 쓰기
+
+- 밈 이름과 실행 ID는 전역 파일 대신 환경 변수(MEME_NAME, MEME_RUN_ID)나 명령줄로 전달
+  → 같은 체크아웃에서 여러 밈을 동시에 분석해도 서로 덮어쓰지 않음
+- atomic_path(): 임시 파일에 쓴 뒤 os.replace로 교체 (읽는 쪽은 항상 완성된 파일만 봄)
+"""
+
+import os
+import uuid
+import threading
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+
+MEME_ENV = 'MEME_NAME'
+RUN_ID_ENV = 'MEME_RUN_ID'
+
+# 현재 프로세스 환경 변수를 바꾸는 run_environment()는 한 번에 하나만
+_env_lock = threading.RLock()
+
+
+def new_run_id():
+    """시간순 정렬되는 실행 ID"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+def current_run_id():
+    """환경 변수의 실행 ID (없으면 새로 만들어 하위 프로세스도 같은 ID를 쓰도록 등록)"""
+    run_id = os.environ.get(RUN_ID_ENV)
+    if not run_id:
+        run_id = os.environ[RUN_ID_ENV] = new_run_id()
+    return run_id
+
+
+def run_env(meme_name, run_id=None, env=None):
+    """하위 프로세스용 환경 변수"""
+    env = dict(os.environ if env is None else env)
+    env[MEME_ENV] = meme_name
+    env[RUN_ID_ENV] = run_id or new_run_id()
+    return env
+
+
+@contextmanager
+def run_environment(meme_name, run_id=None):
+    """현재 프로세스에서 실행하는 동안 MEME_NAME / MEME_RUN_ID 설정 (종료 후 원래 값 복원)"""
+    with _env_lock:
+        saved = {name: os.environ.get(name) for name in (MEME_ENV, RUN_ID_ENV)}
+        os.environ[MEME_ENV] = meme_name
+        os.environ[RUN_ID_ENV] = run_id or new_run_id()
+        try:
+            yield os.environ[RUN_ID_ENV]
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+@contextmanager
+def atomic_path(path):
+    """
+    path 대신 같은 디렉토리의 임시 경로를 넘겨주고, 블록이 끝나면 path로 교체
+    (확장자는 유지하므로 savefig/to_csv 형식 추론에 영향 없음)
+    """
+    path = Path(path)
+    token = f"{os.environ.get(RUN_ID_ENV, 'run')}.{os.getpid()}.{threading.get_ident()}"
+    tmp_path = path.with_name(f".{path.stem}.{token}.tmp{path.suffix}")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
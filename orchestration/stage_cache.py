@@ -0,0 +1,210 @@
+"""
+내용 기반 단계 캐시
+단계 결과물을 (입력 파일 내용 해시 + 파라미터 + 코드 버전) 키로 저장해 두고
+같은 키로 다시 실행되면 단계를 건너뛰고 결과물만 복원
+
+사용 예시:
+    cache = StageCache()
+    cache.run(
+        "preprocessing", run_preprocessing,
+        inputs=[raw_path], outputs=[processed_path],
+        params={'meme': meme_name}, code=[__file__],
+        platform="twitter", meme=meme_name
+    )
+
+- 저장 위치: 프로젝트 루트의 .stage_cache/ (MEME_STAGE_CACHE_DIR 로 변경 가능)
+- 최근 사용 순서(LRU)로 MEME_STAGE_CACHE_MAX_MB(기본 1024MB)를 넘지 않게 정리
+- MEME_STAGE_CACHE=0 이면 캐시 사용 안 함 (main.py --no-cache)
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import time
+
+from orchestration import trace
+from orchestration.filelock import locked
+from orchestration.runs import atomic_path
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_ENV = 'MEME_STAGE_CACHE'
+CACHE_DIR_ENV = 'MEME_STAGE_CACHE_DIR'
+CACHE_MAX_MB_ENV = 'MEME_STAGE_CACHE_MAX_MB'
+DEFAULT_CACHE_DIR = os.path.join(ROOT_DIR, '.stage_cache')
+DEFAULT_MAX_MB = 1024
+
+# 키 형식이 바뀌면 올려서 이전 캐시 무효화
+CACHE_FORMAT_VERSION = 1
+
+
+def cache_enabled():
+    return os.environ.get(CACHE_ENV, '1') not in ('0', 'false', 'off')
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StageCache:
+    """단계 결과물 캐시 (index.json + entries/<key>/)"""
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(CACHE_MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.entries_dir = os.path.join(self.cache_dir, 'entries')
+        self.index_path = os.path.join(self.cache_dir, 'index.json')
+        self.lock_path = os.path.join(self.cache_dir, 'index.lock')
+        os.makedirs(self.entries_dir, exist_ok=True)
+
+        # 같은 파일을 반복 해시하지 않도록 (경로, 크기, 수정 시각) 기준으로 기억
+        self._file_hashes = {}
+        self.hits = 0
+        self.misses = 0
+
+    # ---------- 키 계산 ----------
+
+    def file_digest(self, path):
+        path = os.path.abspath(str(path))
+        stat = os.stat(path)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = self._file_hashes.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        digest = _hash_file(path)
+        self._file_hashes[path] = (signature, digest)
+        return digest
+
+    def key(self, stage, inputs=(), params=None, code=()):
+        """입력 파일 내용, 파라미터, 코드 파일 내용으로 캐시 키 계산 (입력이 없으면 None)"""
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_FORMAT_VERSION}:{stage}".encode('utf-8'))
+
+        for path in inputs:
+            if not os.path.exists(path):
+                return None
+            digest.update(b'input:' + self.file_digest(path).encode('ascii'))
+
+        for path in code:
+            digest.update(b'code:' + self.file_digest(path).encode('ascii'))
+
+        params_json = json.dumps(params or {}, sort_keys=True, ensure_ascii=False, default=str)
+        digest.update(b'params:' + params_json.encode('utf-8'))
+        return digest.hexdigest()
+
+    # ---------- 인덱스 ----------
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index):
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    # ---------- 조회 / 저장 ----------
+
+    def restore(self, key, outputs):
+        """캐시에 있으면 결과물을 원래 경로로 복사 후 True"""
+        with locked(self.lock_path):
+            index = self._load_index()
+            entry = index.get(key)
+            entry_dir = os.path.join(self.entries_dir, key)
+            if not entry or not os.path.isdir(entry_dir):
+                return False
+
+            stored = [os.path.join(entry_dir, name) for name in entry['files']]
+            if len(stored) != len(outputs) or not all(os.path.exists(p) for p in stored):
+                return False
+
+            for src, dst in zip(stored, outputs):
+                os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+                # 동시에 같은 결과 파일을 읽는 실행이 반쯤 복사된 파일을 보지 않도록 교체 방식으로 복원
+                with atomic_path(dst) as tmp_path:
+                    shutil.copyfile(src, tmp_path)
+
+            entry['last_used'] = time.time()
+            self._save_index(index)
+        return True
+
+    def store(self, key, stage, outputs):
+        """단계 결과물을 캐시에 저장 (결과물이 하나라도 없으면 저장하지 않음)"""
+        if not all(os.path.exists(p) for p in outputs):
+            return False
+
+        entry_dir = os.path.join(self.entries_dir, key)
+        tmp_dir = f"{entry_dir}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        files = []
+        size = 0
+        for i, path in enumerate(outputs):
+            name = f"{i:02d}_{os.path.basename(str(path))}"
+            shutil.copyfile(path, os.path.join(tmp_dir, name))
+            files.append(name)
+            size += os.path.getsize(path)
+
+        with locked(self.lock_path):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+
+            index = self._load_index()
+            index[key] = {
+                'stage': stage,
+                'files': files,
+                'size': size,
+                'created_at': time.time(),
+                'last_used': time.time(),
+            }
+            self._evict(index)
+            self._save_index(index)
+        return True
+
+    def _evict(self, index):
+        """최근에 사용하지 않은 항목부터 삭제해 용량 제한 유지"""
+        total = sum(entry['size'] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= index[key]['size']
+            shutil.rmtree(os.path.join(self.entries_dir, key), ignore_errors=True)
+            del index[key]
+
+    # ---------- 단계 실행 ----------
+
+    def run(self, stage, func, inputs=(), outputs=(), params=None, code=(), platform=None, meme=None):
+        """
+        캐시 키가 같으면 결과물만 복원하고 func 실행 생략
+        func는 성공 시 None/False 이외의 값을 반환해야 결과물이 저장됨
+        반환값: (func 반환값 또는 None, 캐시 적중 여부)
+        """
+        outputs = [str(p) for p in outputs]
+        key = self.key(stage, [str(p) for p in inputs], params, [str(p) for p in code]) if cache_enabled() else None
+
+        if key and self.restore(key, outputs):
+            self.hits += 1
+            with trace.stage(stage, platform=platform, meme=meme) as t:
+                t.set(cache='hit')
+                t.output(*outputs)
+            print(f"♻️  캐시 사용: {stage} (입력 변경 없음)")
+            return None, True
+
+        result = func()
+        if key:
+            self.misses += 1
+            # 실패(None/False 반환)한 단계는 이전 결과물이 남아 있을 수 있으므로 저장하지 않음
+            if result is not None and result is not False:
+                self.store(key, stage, outputs)
+        return result, False
@@ -0,0 +1,204 @@
+"""
+단계별 성능 추적
+수집/전처리/분석 모듈/그림 단위로 실행 시간, CPU 시간, 메모리 최고치, 입출력 행 수, 기록 바이트를 남김
+
+사용 예시:
+    with trace.stage("preprocessing", platform="twitter", meme=meme_name, rows_in=len(df)) as t:
+        ...
+        t.set(rows_out=len(result))
+        t.output(output_path)
+
+- 같은 프로세스에서 실행된 기록은 메모리에 모였다가 drain()으로 수집
+- 환경 변수 MEME_TRACE_FILE이 설정되어 있으면 JSON Lines로도 추가 기록 (하위 프로세스 → 부모 전달용)
+- MEME_TRACE_TRACEMALLOC=1 이면 tracemalloc으로 단계별 Python 메모리 최고치 측정 (실행 속도 저하 있음)
+- cpu_time은 단계 구간의 프로세스 전체 CPU 시간 (torch/BLAS 등 단계가 쓰는 작업 스레드 포함,
+  같은 프로세스에서 동시에 실행 중인 다른 단계가 있으면 그 CPU 시간도 포함)
+  thread_cpu_time은 단계를 실행한 스레드만의 CPU 시간
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import tracemalloc
+from datetime import datetime
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRACE_FILE_ENV = 'MEME_TRACE_FILE'
+TRACEMALLOC_ENV = 'MEME_TRACE_TRACEMALLOC'
+
+_records = []
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _peak_rss_kb():
+    """프로세스 최대 RSS (KB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _tracemalloc_enabled():
+    return os.environ.get(TRACEMALLOC_ENV, '') not in ('', '0', 'false')
+
+
+class StageTrace:
+    """실행 중인 단계의 기록"""
+
+    def __init__(self, name, platform=None, meme=None, rows_in=None, parent=None):
+        self.fields = {
+            'stage': name,
+            'platform': platform,
+            'meme': meme,
+            'parent': parent.fields['stage'] if parent else None,
+            'started_at': datetime.now().isoformat(),
+            'rows_in': rows_in,
+            'rows_out': None,
+        }
+        self.outputs = []
+        self.child_tracemalloc_peak = 0
+
+    def set(self, **fields):
+        """행 수 등 추가 정보 기록"""
+        self.fields.update(fields)
+
+    def output(self, *paths):
+        """단계가 기록한 파일 등록 (종료 시 크기 합산)"""
+        self.outputs.extend(str(p) for p in paths)
+
+    def as_dict(self):
+        return dict(self.fields)
+
+
+@contextmanager
+def stage(name, platform=None, meme=None, rows_in=None):
+    """단계 추적 컨텍스트"""
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    parent = stack[-1] if stack else None
+
+    # 상위 단계에서 상속
+    if parent:
+        platform = platform or parent.fields['platform']
+        meme = meme or parent.fields['meme']
+
+    record = StageTrace(name, platform, meme, rows_in, parent)
+
+    use_tracemalloc = _tracemalloc_enabled()
+    if use_tracemalloc:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if parent:
+            parent.child_tracemalloc_peak = max(
+                parent.child_tracemalloc_peak, tracemalloc.get_traced_memory()[1]
+            )
+        tracemalloc.reset_peak()
+
+    stack.append(record)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    thread_cpu_start = time.thread_time()
+    status = 'ok'
+    try:
+        yield record
+    except BaseException as e:
+        status = f"error: {type(e).__name__}"
+        raise
+    finally:
+        stack.pop()
+        record.fields['wall_time'] = round(time.perf_counter() - wall_start, 4)
+        record.fields['cpu_time'] = round(time.process_time() - cpu_start, 4)
+        record.fields['thread_cpu_time'] = round(time.thread_time() - thread_cpu_start, 4)
+        record.fields['peak_rss_kb'] = _peak_rss_kb()
+        record.fields['status'] = status
+
+        if use_tracemalloc:
+            peak = max(tracemalloc.get_traced_memory()[1], record.child_tracemalloc_peak)
+            record.fields['tracemalloc_peak_kb'] = peak // 1024
+            if parent:
+                parent.child_tracemalloc_peak = max(parent.child_tracemalloc_peak, peak)
+
+        bytes_written = 0
+        for path in record.outputs:
+            if os.path.exists(path):
+                bytes_written += os.path.getsize(path)
+        record.fields['outputs'] = record.outputs
+        record.fields['bytes_written'] = bytes_written
+
+        _emit(record.as_dict())
+
+
+def _emit(record):
+    with _lock:
+        _records.append(record)
+        trace_file = os.environ.get(TRACE_FILE_ENV)
+        if trace_file:
+            with open(trace_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+
+def drain():
+    """현재 프로세스에서 쌓인 기록 반환 후 비우기"""
+    with _lock:
+        records = list(_records)
+        _records.clear()
+    return records
+
+
+def read_trace_file(path):
+    """하위 프로세스가 남긴 JSON Lines 기록 읽기"""
+    records = []
+    if not path or not os.path.exists(path):
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return records
+
+
+def summarize(records):
+    """플랫폼 → 단계별 실행 시간 요약 (최상위 단계만)"""
+    summary = {}
+    for record in records:
+        if record.get('parent'):
+            continue
+        platform = record.get('platform') or 'unknown'
+        summary.setdefault(platform, {})[record['stage']] = record.get('wall_time')
+    return summary
+
+
+def save_run_trace(results_dir, meme_name, records, run_info=None):
+    """실행 단위 추적 기록을 integrated_results/traces/에 저장"""
+    trace_dir = os.path.join(results_dir, 'traces')
+    os.makedirs(trace_dir, exist_ok=True)
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    trace_path = os.path.join(
+        trace_dir, f"{meme_name.replace(' ', '_').lower()}_{timestamp}_trace.json"
+    )
+
+    payload = {
+        'meme_name': meme_name,
+        'created_at': datetime.now().isoformat(),
+        'run': run_info or {},
+        'stage_summary': summarize(records),
+        'records': records,
+    }
+    with open(trace_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, default=str)
+    return trace_path
@@ -0,0 +1,135 @@
+"""
+원시 데이터 감시 모드
+플랫폼별 data/raw/ 디렉토리를 주기적으로 확인하다가 새 수집 파일이 생기면
+해당 (밈, 플랫폼)만 수집 이후 단계를 다시 실행
+
+- 짧은 시간 안에 여러 파일이 들어오면 마지막 변경 후 window초 동안 조용할 때 한 번만 실행
+- 쓰는 중인 파일(크기가 계속 바뀌는 파일, .tmp/.part)은 기다렸다가 처리
+- 바뀌지 않은 단계는 단계 캐시(orchestration.stage_cache)가 건너뜀
+- 생명주기 분석은 증분 갱신 (Instagram analysis/lifecycle.py update_lifecycle(): 새 게시물만 감지기에 추가)
+"""
+
+import os
+import re
+import time
+
+# 플랫폼별 원시 파일 이름 → 밈 이름
+RAW_FILE_PATTERNS = {
+    # twitter_{밈}_{YYYYmmdd_HHMMSS}.csv (공백은 '_'로 저장됨)
+    'twitter': re.compile(r'^twitter_(?P<meme>.+)_\d{8}_\d{6}\.csv$'),
+    # {밈}_instagram.jsonl (예전 형식 {밈}_instagram.json)
+    'instagram': re.compile(r'^(?P<meme>.+)_instagram\.jsonl?$'),
+}
+IGNORED_SUFFIXES = ('.tmp', '.part', '.crdownload')
+
+
+def meme_from_filename(platform, filename):
+    """원시 파일 이름에서 밈 이름 추출 (알 수 없는 파일이면 None)"""
+    if filename.endswith(IGNORED_SUFFIXES):
+        return None
+    pattern = RAW_FILE_PATTERNS.get(platform)
+    match = pattern.match(filename) if pattern else None
+    if not match:
+        return None
+    meme = match.group('meme')
+    if platform == 'twitter':
+        meme = meme.replace('_', ' ')
+    return meme
+
+
+def _snapshot(directory):
+    """디렉토리 파일별 (크기, 수정 시각)"""
+    files = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return files
+
+
+class RawDataWatcher:
+    """원시 데이터 디렉토리 감시 후 영향받은 밈만 재분석"""
+
+    def __init__(self, analyzer, platforms=None, interval=2.0, window=10.0):
+        self.analyzer = analyzer
+        self.interval = interval
+        self.window = window
+
+        available_platforms = analyzer.check_platform_availability()
+        self.raw_dirs = {}
+        for platform, info in available_platforms.items():
+            if platforms and platform not in platforms:
+                continue
+            if not info['available'] or platform not in RAW_FILE_PATTERNS:
+                continue
+            raw_dir = os.path.join(info['dir'], analyzer.platforms[platform].get('raw_dir', 'data/raw'))
+            self.raw_dirs[platform] = raw_dir
+
+        self._snapshots = {}
+        # (플랫폼, 밈) → 마지막 변경 감지 시각
+        self._pending = {}
+
+    def poll(self):
+        """변경된 파일을 찾아 대기 목록에 추가"""
+        now = time.time()
+        for platform, raw_dir in self.raw_dirs.items():
+            current = _snapshot(raw_dir)
+            previous = self._snapshots.get(platform, {})
+            self._snapshots[platform] = current
+
+            for filename, signature in current.items():
+                if previous.get(filename) == signature:
+                    continue
+                meme = meme_from_filename(platform, filename)
+                if meme is None:
+                    continue
+                if (platform, meme) not in self._pending:
+                    print(f"📥 새 원시 데이터: {platform}/{filename} → '{meme}'")
+                self._pending[(platform, meme)] = now
+
+    def ready(self):
+        """window초 동안 추가 변경이 없는 대기 항목 꺼내기 (밈 → 플랫폼 목록)"""
+        now = time.time()
+        ready = {}
+        for (platform, meme), changed_at in list(self._pending.items()):
+            if now - changed_at >= self.window:
+                ready.setdefault(meme, []).append(platform)
+                del self._pending[(platform, meme)]
+        return ready
+
+    def rerun(self, meme, platforms):
+        """수집 이후 단계만 다시 실행"""
+        print(f"\n🔁 재분석: '{meme}' ({', '.join(p.title() for p in platforms)})")
+        # 장시간 실행되므로 실행 단위로 추적 기록 초기화
+        self.analyzer.trace_records = []
+        return self.analyzer.run_multi_platform_analysis(platforms, meme, ['--skip-collection'])
+
+    def run(self):
+        """Ctrl-C까지 감시"""
+        # 시작 시점의 파일은 이미 분석된 것으로 간주
+        for platform, raw_dir in self.raw_dirs.items():
+            self._snapshots[platform] = _snapshot(raw_dir)
+
+        if not self.raw_dirs:
+            print("❌ 감시할 원시 데이터 디렉토리가 없습니다.")
+            return
+
+        print(f"\n👀 원시 데이터 감시 시작 (확인 간격 {self.interval}초, 묶음 대기 {self.window}초)")
+        for platform, raw_dir in self.raw_dirs.items():
+            print(f"  • {platform.title()}: {raw_dir}")
+
+        try:
+            while True:
+                self.poll()
+                for meme, platforms in self.ready().items():
+                    try:
+                        self.rerun(meme, platforms)
+                    except Exception as e:
+                        print(f"❌ 재분석 실패 ('{meme}'): {e}")
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            print("\n⛔ 감시 종료")
@@ -0,0 +1,132 @@
+"""
+플랫폼 파이프라인 워커 실행 유틸리티
+각 파이프라인을 별도 프로세스로 실행하고, 출력 줄마다 플랫폼 접두사를 붙여 중계
+"""
+
+import os
+import sys
+import signal
+import subprocess
+import threading
+import time
+
+# 여러 워커가 동시에 출력할 때 줄이 섞이지 않도록 보호
+_print_lock = threading.Lock()
+
+
+def prefixed_print(prefix, message):
+    """접두사를 붙여 한 줄씩 출력"""
+    with _print_lock:
+        for line in str(message).splitlines() or [""]:
+            print(f"[{prefix}] {line}" if prefix else line, flush=True)
+
+
+class WorkerGroup:
+    """동시에 실행 중인 워커 프로세스 관리 (Ctrl-C 시 일괄 종료)"""
+
+    def __init__(self, grace_period=5):
+        self.grace_period = grace_period
+        self.cancel_event = threading.Event()
+        self._processes = set()
+        self._lock = threading.Lock()
+
+    def run(self, cmd, cwd, prefix, env=None, timeout=None, stdin_devnull=False):
+        """
+        워커 프로세스 실행 후 결과 반환
+        stdin_devnull: 무인 실행 시 input() 대기로 멈추지 않도록 표준 입력 차단
+        반환값: {'returncode', 'wall_time', 'timed_out', 'cancelled'}
+        """
+        result = {'returncode': None, 'wall_time': 0.0, 'timed_out': False, 'cancelled': False}
+
+        if self.cancel_event.is_set():
+            result['cancelled'] = True
+            return result
+
+        # 자식 프로세스 출력이 버퍼링되지 않도록 설정
+        worker_env = dict(os.environ if env is None else env)
+        worker_env.setdefault('PYTHONUNBUFFERED', '1')
+
+        start_time = time.time()
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=worker_env,
+            stdin=subprocess.DEVNULL if stdin_devnull else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            **_new_process_group_kwargs()
+        )
+
+        with self._lock:
+            self._processes.add(process)
+
+        # 타임아웃 감시 (Selenium 등이 멈춘 경우 대비)
+        timer = None
+        if timeout:
+            def _on_timeout():
+                result['timed_out'] = True
+                prefixed_print(prefix, f"⏰ 제한 시간 초과 ({timeout}초) - 워커 종료")
+                self._terminate(process)
+            timer = threading.Timer(timeout, _on_timeout)
+            timer.daemon = True
+            timer.start()
+
+        try:
+            for line in process.stdout:
+                prefixed_print(prefix, line.rstrip('\n'))
+            process.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            with self._lock:
+                self._processes.discard(process)
+
+        result['returncode'] = process.returncode
+        result['wall_time'] = time.time() - start_time
+        result['cancelled'] = self.cancel_event.is_set()
+        return result
+
+    def cancel_all(self):
+        """실행 중인 모든 워커 종료"""
+        self.cancel_event.set()
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            self._terminate(process)
+
+    def _terminate(self, process):
+        """프로세스 그룹 전체 종료 (브라우저 등 손자 프로세스 포함)"""
+        if process.poll() is not None:
+            return
+        try:
+            if os.name == 'posix':
+                os.killpg(process.pid, signal.SIGTERM)
+            else:
+                process.terminate()
+            process.wait(timeout=self.grace_period)
+        except subprocess.TimeoutExpired:
+            if os.name == 'posix':
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except (ProcessLookupError, OSError):
+            pass
+
+
+def _new_process_group_kwargs():
+    """
+    워커를 별도 프로세스 그룹으로 실행
+    터미널의 Ctrl-C는 부모만 받고, 자식 종료는 WorkerGroup이 일괄 처리
+    """
+    if os.name == 'posix':
+        return {'start_new_session': True}
+    return {'creationflags': getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)}
+
+
+def python_command(script_path, *args):
+    """현재 인터프리터로 스크립트를 실행하는 명령어 구성"""
+    return [sys.executable, str(script_path), *args]
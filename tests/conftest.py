@@ -0,0 +1,17 @@
+"""
+pytest 공용 설정: 모듈들이 쓰는 import 경로 추가
+- 루트 (orchestration 패키지)
+- instagram_meme_lifecycle_analysis (config, src 패키지), instagram_meme_lifecycle_analysis/src (utils.*)
+"""
+from pathlib import Path
+import os, sys
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+INSTAGRAM_DIR = ROOT_DIR / "instagram_meme_lifecycle_analysis"
+
+for path in (ROOT_DIR, INSTAGRAM_DIR, INSTAGRAM_DIR / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# 시각화 모듈을 거쳐 import되는 matplotlib이 화면 없이 동작하도록
+os.environ.setdefault("MPLBACKEND", "Agg")
@@ -0,0 +1,73 @@
+import os
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from orchestration import daemon as D
+from orchestration.governor import ResourceGovernor
+from orchestration.stage_cache import CACHE_ENV
+
+
+class FakeAnalyzer:
+    platforms = {"instagram": {}}
+
+    def __init__(self, results_dir):
+        self.results_dir = str(results_dir)
+        self.governor = ResourceGovernor(2)
+        self.seen = []
+
+    def start_run(self):
+        pass
+
+    def run_platform_analysis(self, platform, meme_name, additional_args=None):
+        self.seen.append((os.environ.get(CACHE_ENV), self.governor.core_budget, additional_args))
+        return True
+
+    def save_analysis_summary(self, meme_name, platforms, results, **kwargs):
+        return {"results": results, "platform_timings": {}, "summary_file": "s", "trace_file": "t"}
+
+
+@pytest.fixture
+def service(tmp_path):
+    analyzer = FakeAnalyzer(tmp_path)
+    service = D.AnalysisDaemon(analyzer, port=0)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), D._make_handler(service))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield service, {"host": "127.0.0.1", "port": server.server_address[1]}
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_options_apply_to_that_request_only(service, monkeypatch):
+    service, info = service
+    monkeypatch.delenv(CACHE_ENV, raising=False)
+    service.code_hash = D.code_hash()
+
+    response = D.request_analysis(info, "m", ["instagram"], ["--skip-collection"], no_cache=True, cores=1)
+    assert response["results"] == {"instagram": True}
+    D.request_analysis(info, "m", ["instagram"])
+
+    assert service.analyzer.seen == [("0", 1, ["--skip-collection"]), (None, 2, [])]
+    assert CACHE_ENV not in os.environ
+    assert service.analyzer.governor.core_budget == 2
+
+
+def test_stale_code_is_refused(service):
+    service, info = service
+    service.code_hash = "0" * 64
+
+    response = D.request_analysis(info, "m", ["instagram"])
+    assert response["stale_code"] is True
+    assert service.analyzer.seen == []
+
+
+def test_code_hash_follows_source_files(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "notes.txt").write_text("ignored\n")
+    before = D.code_hash(tmp_path)
+    (tmp_path / "notes.txt").write_text("still ignored\n")
+    assert D.code_hash(tmp_path) == before
+    (tmp_path / "a.py").write_text("x = 2\n")
+    assert D.code_hash(tmp_path) != before
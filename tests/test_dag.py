@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from orchestration.dag import DagRunner, STATUS_DONE, STATUS_FAILED, STATUS_SKIPPED
+
+
+def _pipeline(funcs):
+    # pipeline.py와 같은 모양: 전처리 → 분석 3개 → 각 대시보드
+    dag = DagRunner(max_workers=3)
+    dag.add("preprocessing", funcs.get("preprocessing", lambda: True))
+    for branch in ["engagement", "keywords", "lifecycle"]:
+        dag.add(f"analysis:{branch}", funcs.get(f"analysis:{branch}", lambda: True), deps=["preprocessing"])
+        dag.add(f"visualization:{branch}", funcs.get(f"visualization:{branch}", lambda: True),
+                deps=[f"analysis:{branch}"])
+    return dag
+
+
+def _statuses(report):
+    return {name: result["status"] for name, result in report["nodes"].items()}
+
+
+def test_failure_skips_only_dependants():
+    def broken():
+        raise RuntimeError("boom")
+
+    report = _pipeline({"analysis:keywords": lambda: False, "analysis:lifecycle": broken}).run()
+    statuses = _statuses(report)
+    assert statuses["analysis:keywords"] == STATUS_FAILED
+    assert statuses["analysis:lifecycle"] == STATUS_FAILED
+    assert report["nodes"]["analysis:lifecycle"]["error"] == "RuntimeError: boom"
+    assert statuses["visualization:keywords"] == STATUS_SKIPPED
+    assert statuses["visualization:lifecycle"] == STATUS_SKIPPED
+    assert statuses["visualization:engagement"] == STATUS_DONE
+
+
+def test_failed_root_skips_everything_downstream():
+    report = _pipeline({"preprocessing": lambda: False}).run()
+    statuses = _statuses(report)
+    assert statuses.pop("preprocessing") == STATUS_FAILED
+    assert set(statuses.values()) == {STATUS_SKIPPED}
+    assert report["critical_path"] == ["preprocessing"]
+
+
+def test_independent_branches_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+    funcs = {f"analysis:{branch}": lambda: barrier.wait() >= 0
+             for branch in ["engagement", "keywords", "lifecycle"]}
+    # 세 분석이 동시에 실행되지 않으면 barrier가 시간 초과로 실패
+    assert set(_statuses(_pipeline(funcs).run()).values()) == {STATUS_DONE}
+
+
+def test_critical_path_follows_longest_chain():
+    dag = _pipeline({})
+    durations = {
+        "preprocessing": 2.0,
+        "analysis:engagement": 1.0, "visualization:engagement": 5.0,
+        "analysis:keywords": 4.0, "visualization:keywords": 1.0,
+        "analysis:lifecycle": 0.5,
+    }
+    results = {name: {"deps": dag.nodes[name][1], "duration": duration} for name, duration in durations.items()}
+    results["visualization:lifecycle"] = {"deps": ["analysis:lifecycle"], "status": STATUS_SKIPPED}
+
+    path, total = dag.critical_path(results)
+    assert path == ["preprocessing", "analysis:engagement", "visualization:engagement"]
+    assert total == pytest.approx(8.0)
+
+
+def test_unknown_or_duplicate_nodes_are_rejected():
+    dag = DagRunner()
+    dag.add("a", lambda: True)
+    with pytest.raises(ValueError):
+        dag.add("a", lambda: True)
+    with pytest.raises(ValueError):
+        dag.add("b", lambda: True, deps=["missing"])
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from orchestration import governor as G
+
+threadpoolctl = pytest.importorskip("threadpoolctl")
+
+
+def _blas_threads():
+    return [pool["num_threads"] for pool in threadpoolctl.threadpool_info()]
+
+
+def test_thread_limits_apply_inside_block_only(monkeypatch):
+    import numpy  # noqa: F401  (BLAS 스레드 풀 로딩)
+
+    monkeypatch.setenv("OMP_NUM_THREADS", "8")
+    monkeypatch.delenv(G.WORKER_THREADS_ENV, raising=False)
+    before = _blas_threads()
+
+    with G.thread_limits(1):
+        assert os.environ["OMP_NUM_THREADS"] == "1"
+        assert os.environ[G.WORKER_THREADS_ENV] == "1"
+        assert all(n == 1 for n in _blas_threads())
+
+    assert os.environ["OMP_NUM_THREADS"] == "8"
+    assert G.WORKER_THREADS_ENV not in os.environ
+    assert _blas_threads() == before
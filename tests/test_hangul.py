@@ -0,0 +1,129 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from utils import hangul, token_store
+from utils.token_store import flatten
+from preprocessing.instagram import compress_decompose, clean_text
+from analysis.keywords import combine_units, token_to_word, extract_keywords
+
+ARRAY_NAMES = ["chars", "unit_kinds", "unit_ends", "token_ends", "post_ends"]
+
+# 완성형 한글 / 호환 자음·모음 / 영문 / 숫자 / 구두점·이모지 / 여러 종류의 공백
+ALPHABET = (
+    [chr(c) for c in range(hangul.SYLLABLE_BASE, hangul.SYLLABLE_LAST + 1, 97)]
+    + list("킹받네진짜ㅋㅋㅎㅎ")
+    + [chr(c) for c in range(0x3131, 0x3164)]
+    + list("abcXYZ0189")
+    + list("!?#@._~♥😂ㆍ")
+    + [" ", " ", "\t", "\n", "　", "\xa0", " "]
+)
+
+
+def _captions(seed, n=300):
+    rng = random.Random(seed)
+    captions = ["", " ", "킹받네", "ㅋㅋㅋ 킹받네", "abc킹받네def", "킹ㅋ받", "#킹받네 #kingbatne"]
+    captions += ["".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 40))) for _ in range(n)]
+    # 중복 caption (리포스트)
+    return captions + rng.sample(captions, 50)
+
+
+def _reference_words(captions):
+    return [token_to_word(token) for caption in captions for token in compress_decompose(caption)]
+
+
+def _words(arrays):
+    word_chars, word_ends = hangul.recompose(arrays)
+    data = word_chars.tobytes()
+    starts = np.concatenate([[0], word_ends[:-1]])
+    return [data[s * 4:e * 4].decode("utf-32-le", "surrogatepass") for s, e in zip(starts, word_ends)]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_decompose_matches_compress_decompose(seed):
+    captions = _captions(seed)
+    expected = flatten([compress_decompose(caption) for caption in captions])
+    arrays = hangul.decompose_captions(captions)
+    for name in ARRAY_NAMES:
+        assert np.array_equal(arrays[name], expected[name]), name
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_recompose_matches_combine_units(seed):
+    captions = _captions(seed)
+    tokens = [token for caption in captions for token in compress_decompose(caption)]
+    assert _words(flatten([tokens])) == [combine_units(token) for token in tokens]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_count_words_matches_reference(seed):
+    captions = _captions(seed)
+    counts = hangul.count_words(hangul.decompose_captions(captions))
+    expected = Counter(_reference_words(captions))
+    assert counts == expected
+    # 단어가 처음 나온 순서 유지
+    assert list(counts) == list(expected)
+
+
+def test_hangul_words_round_trip():
+    # 완성형 한글만 있는 단어는 분해 → 조합하면 원래 단어
+    rng = random.Random(3)
+    words = ["".join(chr(rng.randrange(hangul.SYLLABLE_BASE, hangul.SYLLABLE_LAST + 1))
+                     for _ in range(rng.randrange(1, 8))) for _ in range(500)]
+    assert _words(hangul.decompose_captions([" ".join(words)])) == words
+
+
+def _batches(seed):
+    captions = _captions(seed)
+    return [captions[i:i + 70] for i in range(0, len(captions), 70)]
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_word_ids_match_count_words(seed):
+    # 배치마다 같은 vocabulary → 번호 순서 = 전체에서 단어가 처음 나온 순서
+    vocabulary = {}
+    ids = []
+    for captions in _batches(seed):
+        batch_ids, added = hangul.assign_word_ids(hangul.decompose_captions(captions), vocabulary)
+        assert added == list(vocabulary)[len(vocabulary) - len(added):]
+        ids.append(batch_ids)
+    words = list(vocabulary)
+    counts = np.bincount(np.concatenate(ids), minlength=len(words))
+    expected = hangul.count_words(hangul.decompose_captions(_captions(seed)))
+    assert list(zip(words, counts.tolist())) == list(expected.items())
+
+
+@pytest.mark.parametrize("top_k", [None, 20])
+def test_keywords_from_word_ids_match_recomposed(tmp_path, top_k):
+    vocabulary = {}
+    with_ids, without_ids = tmp_path / "ids", tmp_path / "plain"
+    for i, captions in enumerate(_batches(6)):
+        arrays = hangul.decompose_captions(captions)
+        token_store.write_arrays(without_ids, arrays, append=i > 0)
+        arrays["word_ids"], added = hangul.assign_word_ids(arrays, vocabulary)
+        token_store.write_arrays(with_ids, arrays, append=i > 0, words=added)
+
+    store = token_store.TokenStore(with_ids)
+    assert store.words() == list(vocabulary)
+    assert token_store.TokenStore(without_ids).word_ids is None
+    expected = extract_keywords(token_store.TokenStore(without_ids), chunk_posts=50, workers=1, top_k=top_k)
+    assert extract_keywords(store, chunk_posts=50, top_k=top_k) == expected
+
+
+def test_replacing_store_drops_stale_word_ids(tmp_path):
+    arrays = hangul.decompose_captions(["킹받네 ㅋㅋ"])
+    arrays["word_ids"], added = hangul.assign_word_ids(arrays, {})
+    token_store.write_arrays(tmp_path, arrays, words=added)
+    del arrays["word_ids"]
+    token_store.write_arrays(tmp_path, arrays)
+    assert token_store.TokenStore(tmp_path).word_ids is None
+    assert not (tmp_path / token_store.WORDS_FILE).exists()
+
+
+def test_clean_text_whitespace_matches_engine():
+    # clean_text()가 남기는 공백 문자 = 엔진의 WHITESPACE
+    text = "".join(chr(c) for c in range(0x3001))
+    kept = {ord(c) for c in clean_text(text) if c.isspace()}
+    assert kept == set(hangul.WHITESPACE.tolist())
@@ -0,0 +1,39 @@
+import shutil
+
+import pytest
+
+import adapter
+from config.settings import DATA_DIR
+from orchestration import trace
+from src.utils import cached_stages
+
+MEME = "pytest_adapter"
+
+
+@pytest.fixture
+def raw_meme(tmp_path, monkeypatch):
+    # 수집 원본을 시험용 밈 이름으로 복사 (끝나면 전처리 결과까지 삭제)
+    monkeypatch.setenv("MEME_STAGE_CACHE_DIR", str(tmp_path / "stage_cache"))
+    monkeypatch.delenv("MEME_STAGE_CACHE", raising=False)
+    monkeypatch.setattr(cached_stages, "_cache", None)
+    raw_path = DATA_DIR / "raw" / f"{MEME}_instagram.json"
+    shutil.copyfile(DATA_DIR / "raw" / "test_instagram.json", raw_path)
+    yield MEME
+    raw_path.unlink()
+    (DATA_DIR / "preprocessed" / f"{MEME}_instagram.csv").unlink(missing_ok=True)
+    shutil.rmtree(DATA_DIR / "preprocessed" / f"{MEME}_instagram_tokens", ignore_errors=True)
+
+
+def _preprocessing_records():
+    return [record for record in trace.drain() if record["stage"] == "preprocessing"]
+
+
+def test_second_preprocess_hits_stage_cache(raw_meme):
+    trace.drain()
+    adapter.preprocess(raw_meme)
+    first, = _preprocessing_records()
+    assert first.get("cache") is None
+
+    adapter.preprocess(raw_meme)
+    second, = _preprocessing_records()
+    assert second.get("cache") == "hit"
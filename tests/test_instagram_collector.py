@@ -0,0 +1,101 @@
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("selenium")
+from selenium.common.exceptions import NoSuchElementException
+
+from data_collection import instagram, mock_site
+from utils import raw_posts
+
+MEME = "킹받네"
+POSTS = 20
+
+
+class FakeDriver:
+    """브라우저 대신 mock_site의 게시물 창 HTML을 돌려주는 드라이버 (get/page_source/find_element만)"""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.page_source = ""
+        self.visited = []
+
+    def get(self, url):
+        code = url.rstrip("/").rsplit("/", 1)[-1]
+        self.visited.append(code)
+        if code in self.broken:
+            raise RuntimeError(f"{code} 로딩 실패")
+        self.page_source = mock_site.post_page(int(code[len("mock"):]), POSTS)
+
+    def find_element(self, by, value):
+        if "<time" not in self.page_source:
+            raise NoSuchElementException(value)
+        return object()
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.acquired = 0
+
+    def acquire(self):
+        with self.lock:
+            self.acquired += 1
+        return 0
+
+
+@pytest.fixture
+def collection(tmp_path, monkeypatch):
+    monkeypatch.setattr(raw_posts, "DATA_DIR", tmp_path)
+    collection = instagram.Collection(MEME)
+    collection.add_to_queue([mock_site.shortcode_for(i) for i in range(POSTS)])
+    return collection
+
+
+def _saved_posts(collection):
+    with open(collection.output_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _key(post):
+    return post["username"], post["upload_time"]
+
+
+def test_workers_collect_each_post_once(collection):
+    drivers = [FakeDriver() for _ in range(3)]
+    limiter = CountingLimiter()
+
+    assert instagram.fetch_posts(drivers, limiter, collection) == []
+    # 요청마다 토큰 하나, 게시물마다 요청 하나
+    assert limiter.acquired == POSTS
+    assert sorted(code for driver in drivers for code in driver.visited) == sorted(collection.checkpoint["queue"])
+
+    saved = _saved_posts(collection)
+    assert sorted(map(_key, saved)) == sorted(_key(mock_site.post_data(i)) for i in range(POSTS))
+    assert collection.pending() == []
+    assert collection.checkpoint["collected"] == POSTS
+    assert collection.checkpoint["offset"] == collection.output_path.stat().st_size
+
+
+def test_failed_post_stays_pending_for_next_run(collection):
+    broken = mock_site.shortcode_for(7)
+    failed = instagram.fetch_posts([FakeDriver(broken=[broken]), FakeDriver(broken=[broken])],
+                                   CountingLimiter(), collection)
+    assert failed == [broken]
+    assert collection.pending() == [broken]
+    assert len(_saved_posts(collection)) == POSTS - 1
+
+    # 다음 실행: 체크포인트에서 이어서, 실패한 게시물만 다시 요청
+    resumed = instagram.Collection(MEME)
+    driver = FakeDriver()
+    assert instagram.fetch_posts([driver], CountingLimiter(), resumed) == []
+    assert driver.visited == [broken]
+    assert len(_saved_posts(resumed)) == POSTS
+
+
+def test_workers_stop_at_target(collection):
+    collection.target = 5
+    instagram.fetch_posts([FakeDriver() for _ in range(3)], CountingLimiter(), collection)
+    assert collection.checkpoint["collected"] == 5
+    assert len(_saved_posts(collection)) == 5
@@ -0,0 +1,105 @@
+import pytest
+
+import main
+from orchestration.jobs import BatchRunner, expand_jobs
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    analyzer = main.TotalMemeAnalyzer()
+    analyzer.results_dir = str(tmp_path)
+    return analyzer
+
+
+def _job(platform, stage, meme="킹받네"):
+    return next(job for job in expand_jobs([meme], [platform], [stage]))
+
+
+def test_instagram_batch_collection_runs_unattended(analyzer):
+    runner = BatchRunner(analyzer, ["킹받네"], ["instagram"], job_timeout=600)
+    cmd = runner.build_command(_job("instagram", "collection"), analyzer.platforms["instagram"])
+    # 배치 작업은 stdin이 /dev/null이므로 로그인 확인 input()을 거치면 안 됨
+    assert "--unattended" in cmd
+    assert cmd[cmd.index("--time-budget") + 1] == "540"
+
+
+def test_time_budget_without_job_timeout(analyzer):
+    runner = BatchRunner(analyzer, ["킹받네"], ["instagram"])
+    cmd = runner.build_command(_job("instagram", "collection"), analyzer.platforms["instagram"])
+    assert int(cmd[cmd.index("--time-budget") + 1]) > 0
+
+
+def test_default_batch_id_does_not_depend_on_date(monkeypatch):
+    from orchestration import jobs
+
+    first = jobs.default_batch_id(["킹받네"], ["twitter", "instagram"], ["analysis"])
+
+    class NextDay(jobs.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return jobs.datetime(2099, 1, 2)
+
+    monkeypatch.setattr(jobs, "datetime", NextDay)
+    assert jobs.default_batch_id(["킹받네"], ["instagram", "twitter"], ["analysis"]) == first
+    assert jobs.default_batch_id(["킹받네"], ["instagram"], ["analysis"]) != first
+
+
+def test_journal_replays_last_status_and_ignores_torn_line(tmp_path):
+    from orchestration.jobs import JobJournal, STATUS_DONE, STATUS_FAILED, STATUS_RUNNING
+
+    journal = JobJournal(str(tmp_path / "batches" / "b.jsonl"))
+    job = _job("instagram", "analysis")
+    journal.record(job, STATUS_RUNNING)
+    journal.record(job, STATUS_FAILED, returncode=1)
+    journal.record(job, STATUS_DONE, returncode=0)
+    # 강제 종료로 잘린 마지막 줄
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"id": "' + job["id"] + '", "status": "runn')
+
+    states = journal.load()
+    assert states[job["id"]]["status"] == STATUS_DONE
+    assert states[job["id"]]["returncode"] == 0
+
+
+def _fake_run_job(runner, outcomes, calls):
+    # 스크립트 대신 정해진 상태를 저널에 기록
+    def run_job(job, platform_info):
+        calls.append(job["id"])
+        status = outcomes.get(job["id"], "done")
+        runner.journal.record(job, status)
+        return status
+    return run_job
+
+
+def test_resume_skips_done_jobs_and_blocks_after_failure(analyzer, monkeypatch):
+    memes, platforms = ["킹받네", "chill guy"], ["instagram"]
+    done = _job("instagram", "collection", meme="킹받네")
+    failing = _job("instagram", "collection", meme="chill guy")
+    blocked = _job("instagram", "analysis", meme="chill guy")
+
+    runner = BatchRunner(analyzer, memes, platforms, batch_id="b")
+    runner.journal.record(done, "done")
+    calls = []
+    monkeypatch.setattr(runner, "run_job", _fake_run_job(runner, {failing["id"]: "failed"}, calls))
+    statuses = runner.run()
+
+    # 이미 끝난 작업은 다시 실행하지 않음, 앞 단계가 실패하면 뒤 단계는 건너뜀
+    assert done["id"] not in calls
+    assert sorted(calls) == sorted([_job("instagram", "analysis", meme="킹받네")["id"], failing["id"]])
+    assert statuses[done["id"]] == "done"
+    assert statuses[failing["id"]] == "failed"
+    assert statuses[blocked["id"]] == "skipped"
+    assert runner.journal.load()[blocked["id"]]["reason"] == "previous stage failed"
+
+    # 같은 ID로 다시 실행하면 실패한 사슬만 다시 실행 (--restart면 전부)
+    calls.clear()
+    resumed = BatchRunner(analyzer, memes, platforms, batch_id="b")
+    monkeypatch.setattr(resumed, "run_job", _fake_run_job(resumed, {}, calls))
+    resumed.run()
+    assert calls == [failing["id"], blocked["id"]]
+
+    calls.clear()
+    restarted = BatchRunner(analyzer, memes, platforms, batch_id="b", restart=True)
+    monkeypatch.setattr(restarted, "run_job", _fake_run_job(restarted, {}, calls))
+    restarted.run()
+    assert len(calls) == 4
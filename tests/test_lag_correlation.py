@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from orchestration.lag_correlation import cross_correlate, lead_lag_table
+
+
+def _posts(counts, platform, meme="m", start="2025-04-01"):
+    days = pd.date_range(start, periods=len(counts), freq="D", tz="UTC")
+    return pd.DataFrame({
+        "meme": meme,
+        "platform": platform,
+        "created_at": np.repeat(days, counts),
+    })
+
+
+def test_known_shift_short_series_default_max_lag():
+    # 7일 격자, instagram이 2일 먼저 정점 (max_lag 기본값 14 > 격자 길이)
+    instagram = [1, 9, 2, 1, 1, 1, 1]
+    twitter = [1, 1, 1, 9, 2, 1, 1]
+    posts = pd.concat([_posts(instagram, "instagram"), _posts(twitter, "twitter")], ignore_index=True)
+
+    table = lead_lag_table(posts)
+    row = table.iloc[0]
+    assert row["platform_a"] == "instagram" and row["platform_b"] == "twitter"
+    assert row["leader"] == "instagram"
+    assert row["lag_steps"] == 2
+    assert row["grid_length"] == 7
+
+    # 작은 max_lag와 같은 결과
+    small = lead_lag_table(posts, max_lag=3).iloc[0]
+    assert small["lag_steps"] == 2
+    assert small["peak_corr"] == row["peak_corr"]
+
+
+def test_lags_beyond_grid_are_nan():
+    rng = np.random.default_rng(0)
+    values = rng.random((2, 2, 10))
+    lengths = np.array([10, 4])
+    values[1, :, 4:] = 0.0
+    _, corr = cross_correlate(values, lengths, max_lag=14)
+
+    lags = np.arange(-14, 15)
+    assert np.isnan(corr[0, 0, np.abs(lags) > 9]).all()
+    assert not np.isnan(corr[0, 0, np.abs(lags) <= 9]).any()
+    assert np.isnan(corr[1, 0, np.abs(lags) > 3]).all()
+
+
+def test_matches_direct_correlation():
+    # FFT 결과 = 평균 제거 후 직접 계산한 교차 상관
+    rng = np.random.default_rng(1)
+    n = 9
+    values = rng.random((1, 2, n))
+    _, corr = cross_correlate(values, np.array([n]), max_lag=12)
+
+    a = values[0, 0] - values[0, 0].mean()
+    b = values[0, 1] - values[0, 1].mean()
+    norm = np.sqrt((a ** 2).sum() * (b ** 2).sum())
+    for lag in range(-(n - 1), n):
+        expected = sum(a[t] * b[t + lag] for t in range(n) if 0 <= t + lag < n) / norm
+        assert np.isclose(corr[0, 0, lag + 12], expected)
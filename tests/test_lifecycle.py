@@ -0,0 +1,142 @@
+import math
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis import lifecycle as L
+
+NAN = float("nan")
+
+
+def _baseline_phase(delta):
+    # 히스테리시스 도입 전 규칙
+    if delta > -10.5:
+        return L.PHASE_GROWTH
+    elif delta < -10.3:
+        return L.PHASE_DECLINE
+    return L.PHASE_STAGNANT
+
+
+@pytest.mark.parametrize("previous, delta, expected", [
+    (L.PHASE_GROWTH, NAN, L.PHASE_STAGNANT),
+    (L.PHASE_DECLINE, None, L.PHASE_STAGNANT),
+    (L.PHASE_STAGNANT, 0.0, L.PHASE_GROWTH),
+    (L.PHASE_GROWTH, -10.6, L.PHASE_DECLINE),
+    (L.PHASE_DECLINE, -10.2, L.PHASE_GROWTH),
+    # 경계 구간 [-10.5, -10.3]: 직전 구간 유지
+    (L.PHASE_GROWTH, -10.4, L.PHASE_GROWTH),
+    (L.PHASE_DECLINE, -10.4, L.PHASE_DECLINE),
+    (L.PHASE_GROWTH, -10.5, L.PHASE_GROWTH),
+    (L.PHASE_DECLINE, -10.3, L.PHASE_DECLINE),
+    (L.PHASE_STAGNANT, -10.4, L.PHASE_STAGNANT),
+])
+def test_next_phase_transitions(previous, delta, expected):
+    assert L.next_phase(previous, delta) == expected
+
+
+def test_classify_phases_sequence():
+    deltas = [NAN, 0.0, -10.4, -11.0, -10.4, -10.35, -10.2, -10.45, NAN, -10.4]
+    assert L.classify_phases(deltas) == [
+        L.PHASE_STAGNANT, L.PHASE_GROWTH, L.PHASE_GROWTH, L.PHASE_DECLINE, L.PHASE_DECLINE,
+        L.PHASE_DECLINE, L.PHASE_GROWTH, L.PHASE_GROWTH, L.PHASE_STAGNANT, L.PHASE_STAGNANT,
+    ]
+
+
+def test_outside_band_matches_baseline_rule():
+    rng = random.Random(0)
+    deltas = [rng.uniform(-30, 10) for _ in range(500)] + [NAN]
+    for delta, phase in zip(deltas, L.classify_phases(deltas)):
+        if math.isnan(delta) or not -10.5 <= delta <= -10.3:
+            assert phase == _baseline_phase(delta)
+
+
+def test_detector_matches_full_analysis():
+    rng = random.Random(1)
+    days = pd.date_range("2020-01-01", periods=400, freq="D")
+    counts = [max(0, int(60 + 50 * np.sin(i / 20) + rng.gauss(0, 10))) for i in range(400)]
+    reference = L.analyze_lifecycle(pd.DataFrame({"upload_time": np.repeat(days, counts)}))
+
+    detector = L.LifecycleDetector()
+    rows = pd.DataFrame([detector.update(day, count) for day, count in zip(days, counts) if count])
+    for column in ["count", "moving_avg", "cumulative", "phase", "weekday"]:
+        assert (reference[column].values == rows[column].values).all(), column
+    assert np.array_equal(reference["delta"].values, rows["delta"].values, equal_nan=True)
+
+
+@pytest.fixture
+def meme_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(L, "input_path_for", lambda meme: tmp_path / f"{meme}_instagram.csv")
+    monkeypatch.setattr(L, "output_path_for", lambda meme: tmp_path / "out" / f"{meme}_lifecycle.csv")
+    monkeypatch.setattr(L, "state_path_for", lambda meme: tmp_path / "out" / f"{meme}_lifecycle_state.json")
+    return tmp_path
+
+
+def _posts(rng, start, days):
+    times = [pd.Timestamp(start) + pd.Timedelta(days=d, minutes=rng.randrange(1440))
+             for d in range(days) for _ in range(rng.randrange(1, 6))]
+    return pd.DataFrame({"username": "u", "upload_time": times, "likes": 1})
+
+
+def test_incremental_without_new_data_keeps_counts(meme_dir):
+    posts = _posts(random.Random(2), "2025-04-01", 20)
+    posts.to_csv(L.input_path_for("m"), index=False, encoding="utf-8-sig")
+    L.run_lifecycle_analysis("m")
+    before = L.output_path_for("m").read_bytes()
+
+    L.update_lifecycle("m")
+    L.update_lifecycle("m")
+    assert L.output_path_for("m").read_bytes() == before
+
+
+def test_incremental_appended_rows_match_full_run(meme_dir, tmp_path):
+    rng = random.Random(3)
+    posts = _posts(rng, "2025-04-01", 20)
+    input_path = L.input_path_for("m")
+    posts.to_csv(input_path, index=False, encoding="utf-8-sig")
+    L.run_lifecycle_analysis("m")
+
+    # 같은 마지막 날짜의 게시물 + 이후 날짜 게시물이 CSV 뒤에 추가됨
+    more = _posts(rng, "2025-04-20", 10)
+    more.to_csv(input_path, index=False, header=False, mode="a")
+    L.update_lifecycle("m")
+    L.update_lifecycle("m")
+
+    expected = L.analyze_lifecycle(pd.read_csv(input_path, parse_dates=["upload_time"]))
+    full_path = tmp_path / "full.csv"
+    expected.to_csv(full_path, index=False, encoding="utf-8-sig")
+    assert L.output_path_for("m").read_bytes() == full_path.read_bytes()
+
+
+def test_rewritten_input_falls_back_to_full_run(meme_dir):
+    rng = random.Random(4)
+    input_path = L.input_path_for("m")
+    _posts(rng, "2025-04-01", 20).to_csv(input_path, index=False, encoding="utf-8-sig")
+    L.run_lifecycle_analysis("m")
+
+    # 원본을 새로 수집해 전처리 CSV가 다른 내용으로 다시 만들어짐
+    rewritten = _posts(rng, "2025-03-01", 40)
+    rewritten.to_csv(input_path, index=False, encoding="utf-8-sig")
+    daily = L.update_lifecycle("m")
+    assert daily["cumulative"].iloc[-1] == len(rewritten)
+
+
+def test_incremental_update_replaces_output_atomically(meme_dir, monkeypatch):
+    rng = random.Random(5)
+    input_path = L.input_path_for("m")
+    _posts(rng, "2025-04-01", 20).to_csv(input_path, index=False, encoding="utf-8-sig")
+    L.run_lifecycle_analysis("m")
+    before = L.output_path_for("m").read_bytes()
+
+    # 새 행을 쓰는 도중 중단돼도 결과 CSV는 이전 내용 그대로
+    _posts(rng, "2025-04-21", 5).to_csv(input_path, index=False, header=False, mode="a")
+    with monkeypatch.context() as patch:
+        patch.setattr(L, "_csv_rows", lambda daily_df: [b"2025-04-21,1\n", None])
+        with pytest.raises(TypeError):
+            L.update_lifecycle("m")
+    assert L.output_path_for("m").read_bytes() == before
+    assert list(L.output_path_for("m").parent.glob(".*.tmp*")) == []
+
+    L.update_lifecycle("m")
+    assert len(L.load_lifecycle("m")) == 25
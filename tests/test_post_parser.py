@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from data_collection import post_parser
+from data_collection.benchmark_parser import FIXTURES_DIR
+
+PAGES = sorted(Path(FIXTURES_DIR).glob("*.html"))
+
+
+def _fixture(page):
+    with open(page.with_suffix(".json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_fixtures_exist():
+    assert PAGES
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda page: page.stem)
+def test_parse_post_matches_fixture(page):
+    expected = _fixture(page)
+    source = page.read_text(encoding="utf-8")
+    assert post_parser.parse_post(source, expected["shortcode"]) == expected["post"]
+
+
+def test_shortcode_selects_post_among_embedded_posts():
+    # 포함된 JSON에 추천 게시물 등 여러 게시물이 있으면 현재 URL의 shortcode로 구분
+    page = Path(FIXTURES_DIR) / "post_embedded_json.html"
+    source = page.read_text(encoding="utf-8")
+    expected = _fixture(page)
+    assert post_parser.parse_post(source) != expected["post"]
+    assert post_parser.parse_post(source, expected["shortcode"]) == expected["post"]
+
+
+def test_dom_fixture_matches_previous_parser():
+    pytest.importorskip("bs4")
+    from data_collection.benchmark_parser import parse_post_bs4
+
+    page = Path(FIXTURES_DIR) / "post_dom.html"
+    source = page.read_text(encoding="utf-8")
+    assert post_parser.parse_post(source) == parse_post_bs4(source)
+
+
+def test_embedded_json_fills_missing_fields():
+    page = Path(FIXTURES_DIR) / "post_hidden_likes.html"
+    source = page.read_text(encoding="utf-8")
+    root = post_parser.lxml_html.fromstring(source)
+    # 화면에 좋아요 수가 없어도 포함된 JSON의 like_count 사용
+    assert "likes" not in post_parser.parse_dom(root)
+    assert post_parser.parse_post(source)["likes"] == _fixture(page)["post"]["likes"]
+
+
+def test_unknown_shortcode_leaves_missing_fields_empty():
+    page = Path(FIXTURES_DIR) / "post_embedded_json.html"
+    post = post_parser.parse_post(page.read_text(encoding="utf-8"), shortcode="missing")
+    dom = post_parser.parse_dom(post_parser.lxml_html.fromstring(page.read_text(encoding="utf-8")))
+    for field in post_parser.FIELDS:
+        if field not in dom:
+            assert post[field] in ("", 0)
+
+
+def test_empty_page():
+    assert post_parser.parse_post("<html><body></body></html>") == {
+        "username": "", "upload_time": "", "likes": 0, "caption": "",
+    }
+
+
+@pytest.mark.parametrize("url, shortcode", [
+    ("https://www.instagram.com/p/DIq3kZ1vX_a/", "DIq3kZ1vX_a"),
+    ("https://www.instagram.com/reel/DJa7mQ2sLkP/?igsh=x", "DJa7mQ2sLkP"),
+    ("/explore/tags/킹받네/", None),
+])
+def test_shortcode_from_url(url, shortcode):
+    assert post_parser.shortcode_from_url(url) == shortcode
+
+
+def test_parse_permalinks_keeps_order_without_duplicates():
+    source = """<html><body>
+        <a href="/p/B/">b</a><a href="/explore/">x</a><a href="/reel/A/">a</a><a href="/p/B/?x=1">b</a>
+    </body></html>"""
+    assert post_parser.parse_permalinks(source) == ["B", "A"]
@@ -0,0 +1,75 @@
+import pytest
+
+from orchestration import ratelimit as R
+
+
+class FakeClock:
+    """time.time() / time.sleep() 대체 (sleep은 시계만 앞으로)"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(R, "time", clock)
+    return clock
+
+
+def _limiter(tmp_path, rate=1.0, burst=2):
+    return R.RateLimiter("test", rate=rate, burst=burst, state_dir=str(tmp_path))
+
+
+def test_burst_then_refill_at_rate(tmp_path, clock):
+    limiter = _limiter(tmp_path)
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == pytest.approx(1.0)
+
+    clock.now += 0.5
+    assert limiter.try_acquire() == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limiter.try_acquire() == 0
+
+
+def test_idle_time_refills_only_up_to_burst(tmp_path, clock):
+    limiter = _limiter(tmp_path)
+    limiter.try_acquire()
+    clock.now += 100
+    assert [limiter.try_acquire() for _ in range(2)] == [0, 0]
+    assert limiter.try_acquire() == pytest.approx(1.0)
+
+
+def test_acquire_waits_and_counts(tmp_path, clock):
+    limiter = _limiter(tmp_path, rate=0.5, burst=1)
+    waits = [limiter.acquire() for _ in range(3)]
+    assert waits == [0, pytest.approx(2.0), pytest.approx(2.0)]
+    assert clock.slept == [pytest.approx(2.0), pytest.approx(2.0)]
+    stats = limiter.stats()
+    assert stats["acquired"] == 3
+    assert stats["total_wait"] == pytest.approx(4.0)
+
+
+def test_processes_share_one_bucket(tmp_path, clock):
+    # 같은 상태 파일을 쓰는 다른 수집기 프로세스의 사용량도 반영
+    first, second = _limiter(tmp_path), _limiter(tmp_path)
+    assert first.try_acquire() == 0
+    assert second.try_acquire() == 0
+    assert first.try_acquire() == pytest.approx(1.0)
+    assert second.try_acquire() == pytest.approx(1.0)
+
+
+def test_env_override(monkeypatch):
+    monkeypatch.setenv("MEME_RATE_TWITTER", "2,10")
+    assert R.limit_for("twitter") == {"rate": 2.0, "burst": 10.0}
+    monkeypatch.setenv("MEME_RATE_TWITTER", "fast")
+    assert R.limit_for("twitter") == R.RATE_LIMITS["twitter"]
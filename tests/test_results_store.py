@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+import pytest
+
+from orchestration.results_store import ResultsStore, POST_COLUMNS, DAILY_COLUMNS
+
+pytest.importorskip("pyarrow")
+
+
+def _posts(n, likes=1):
+    return pd.DataFrame({
+        "created_at": pd.date_range("2025-04-01", periods=n, freq="12h"),
+        "author": [f"u{i}" for i in range(n)],
+        "text": "킹받네",
+        "likes": likes,
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultsStore(str(tmp_path / "store"), keep_runs=2)
+
+
+def test_partition_keeps_latest_runs(store):
+    for i, run_id in enumerate(["20250101_000000_a", "20250102_000000_b", "20250103_000000_c"]):
+        store.write(_posts(4, likes=i), "instagram", "Chill Guy", run_id=run_id)
+
+    for table in ["posts", "daily"]:
+        part_dir = store.partition_dir(table, "instagram", "Chill Guy")
+        assert part_dir.endswith(os.path.join("platform=instagram", "meme=chill_guy"))
+        assert sorted(os.listdir(part_dir)) == ["part-20250102_000000_b.parquet", "part-20250103_000000_c.parquet"]
+
+    # 조회는 (플랫폼, 밈)별 최신 실행만
+    posts = store.read("posts")
+    assert list(posts.columns) == POST_COLUMNS
+    assert set(posts["run_id"]) == {"20250103_000000_c"}
+    assert posts["likes"].tolist() == [2.0] * 4
+
+
+def test_partitions_are_independent(store):
+    store.write(_posts(4), "instagram", "킹받네", run_id="20250101_000000_a")
+    store.write(_posts(2), "twitter", "킹받네", run_id="20250101_000000_b")
+    store.write(_posts(3), "twitter", "chill guy", run_id="20250101_000000_c")
+    for run_id in ["20250102_000000_d", "20250103_000000_e"]:
+        store.write(_posts(1), "twitter", "chill guy", run_id=run_id)
+
+    assert len(store.read("posts", platforms=["instagram"])) == 4
+    assert len(store.read("posts", memes=["킹받네"])) == 6
+    assert len(store.read("posts", platforms=["twitter"], memes=["chill guy"])) == 1
+
+    daily = store.read("daily", memes=["킹받네"])
+    assert list(daily.columns) == DAILY_COLUMNS
+    assert daily.groupby("platform")["posts"].sum().to_dict() == {"instagram": 4, "twitter": 2}
+
+
+def test_empty_store_returns_schema(store):
+    assert list(store.read("daily").columns) == DAILY_COLUMNS
+    with pytest.raises(ValueError):
+        store.read("comments")
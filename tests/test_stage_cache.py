@@ -0,0 +1,93 @@
+import pytest
+
+from orchestration import stage_cache as SC
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv(SC.CACHE_ENV, raising=False)
+    return SC.StageCache(cache_dir=str(tmp_path / "cache"), max_bytes=25)
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = {name: tmp_path / name for name in ["input.csv", "code.py", "output.csv"]}
+    paths["input.csv"].write_text("a,b\n1,2\n")
+    paths["code.py"].write_text("x = 1\n")
+    return paths
+
+
+def _key(cache, files, **params):
+    return cache.key("stage", [str(files["input.csv"])], params, [str(files["code.py"])])
+
+
+def test_key_changes_with_input_code_and_params(cache, files):
+    base = _key(cache, files)
+    assert _key(cache, files) == base
+    assert _key(cache, files, top_k=10) != base
+
+    files["input.csv"].write_text("a,b\n1,23\n")
+    changed_input = _key(cache, files)
+    assert changed_input != base
+
+    files["code.py"].write_text("x = 22\n")
+    assert _key(cache, files) not in (base, changed_input)
+
+    # 입력이 없으면 캐시하지 않음
+    files["input.csv"].unlink()
+    assert _key(cache, files) is None
+
+
+def test_run_restores_outputs_on_hit(cache, files):
+    output = files["output.csv"]
+    calls = []
+
+    def stage():
+        calls.append(1)
+        output.write_text("result\n")
+        return True
+
+    kwargs = dict(inputs=[files["input.csv"]], outputs=[output], code=[files["code.py"]])
+    assert cache.run("stage", stage, **kwargs) == (True, False)
+    output.unlink()
+    assert cache.run("stage", stage, **kwargs) == (None, True)
+    assert output.read_text() == "result\n"
+    assert calls == [1]
+
+    # 실패(None 반환)한 실행은 저장하지 않음
+    files["input.csv"].write_text("changed\n")
+    assert cache.run("stage", lambda: None, **kwargs) == (None, False)
+    assert cache.run("stage", stage, **kwargs) == (True, False)
+    assert calls == [1, 1]
+
+
+def test_lru_eviction_keeps_recently_used(cache, tmp_path):
+    outputs = {}
+    for name in ["a", "b", "c"]:
+        outputs[name] = tmp_path / f"{name}.bin"
+        outputs[name].write_bytes(b"x" * 10)
+
+    cache.store("key-a", "stage", [str(outputs["a"])])
+    cache.store("key-b", "stage", [str(outputs["b"])])
+    # a를 최근에 사용 → 용량(25바이트)을 넘기면 b부터 삭제
+    assert cache.restore("key-a", [str(outputs["a"])])
+    cache.store("key-c", "stage", [str(outputs["c"])])
+
+    index = cache._load_index()
+    assert sorted(index) == ["key-a", "key-c"]
+    assert not (tmp_path / "cache" / "entries" / "key-b").exists()
+    assert not cache.restore("key-b", [str(outputs["b"])])
+
+
+def test_disabled_cache_always_runs(cache, files, monkeypatch):
+    monkeypatch.setenv(SC.CACHE_ENV, "0")
+    output = files["output.csv"]
+
+    def stage():
+        output.write_text("result\n")
+        return True
+
+    kwargs = dict(inputs=[files["input.csv"]], outputs=[output])
+    assert cache.run("stage", stage, **kwargs) == (True, False)
+    assert cache.run("stage", stage, **kwargs) == (True, False)
+    assert cache._load_index() == {}
@@ -0,0 +1,57 @@
+import random
+from collections import Counter
+
+import pytest
+
+from utils.topk import SpaceSaving
+
+
+def _stream(seed, n=20000, vocabulary=3000):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return rng.choices([f"w{i}" for i in range(vocabulary)], weights=weights, k=n)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 37, 1000, 20000])
+def test_bounds_hold_for_any_chunk_size(chunk_size):
+    words = _stream(chunk_size)
+    exact = Counter(words)
+    summary = SpaceSaving(50)
+    for start in range(0, len(words), chunk_size):
+        summary.update(Counter(words[start:start + chunk_size]))
+
+    assert summary.total == len(words)
+    listed = {word: (count, error) for word, count, error in summary.most_common()}
+    for word, (count, error) in listed.items():
+        assert count - error <= exact[word] <= count
+    floor = summary.min_count()
+    assert all(n <= floor for word, n in exact.items() if word not in listed)
+
+
+def test_whole_stream_in_one_chunk_is_exact():
+    words = _stream(0)
+    summary = SpaceSaving(50).update(Counter(words))
+    assert [(word, count) for word, count, _ in summary.most_common()] == Counter(words).most_common(50)
+
+
+def test_topk_chunk_size_follows_k(monkeypatch):
+    from analysis import keywords
+
+    monkeypatch.delenv(keywords.CHUNK_POSTS_ENV, raising=False)
+    assert keywords.chunk_posts_default() == keywords.DEFAULT_CHUNK_POSTS
+    # 근사 집계는 구간 하나의 단어 수도 K에 비례하도록 게시물 K개씩
+    assert keywords.chunk_posts_default(top_k=500) == 500
+    monkeypatch.setenv(keywords.CHUNK_POSTS_ENV, "7000")
+    assert keywords.chunk_posts_default(top_k=500) == 7000
+
+
+def test_single_chunk_is_counted_inline(monkeypatch):
+    from analysis import keywords
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("구간이 하나면 작업 프로세스를 만들지 않음")
+
+    monkeypatch.setattr(keywords, "ProcessPoolExecutor", no_pool)
+    chunks = (words for words in [_stream(1, n=500)])
+    assert keywords.count_chunks(chunks, Counter, workers=4) == Counter(_stream(1, n=500))
+    assert keywords.count_chunks([], Counter, workers=4) == Counter()
@@ -0,0 +1,23 @@
+import threading
+import time
+
+from orchestration import trace
+
+
+def _spin(seconds):
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+def test_cpu_time_includes_worker_threads():
+    trace.drain()
+    worker = threading.Thread(target=_spin, args=(0.3,))
+    with trace.stage("threaded", platform="test"):
+        worker.start()
+        worker.join()
+    record, = trace.drain()
+
+    # 단계가 띄운 작업 스레드의 CPU 시간은 cpu_time(프로세스 전체)에 포함, thread_cpu_time에는 제외
+    assert record["cpu_time"] >= 0.25
+    assert record["thread_cpu_time"] < 0.1
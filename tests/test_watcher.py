@@ -0,0 +1,108 @@
+import pytest
+
+from orchestration import watcher as W
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class FakeAnalyzer:
+    def __init__(self, base_dir):
+        self.platforms = {"instagram": {"raw_dir": "data/raw"}, "twitter": {"raw_dir": "data/raw"}}
+        self.dirs = {platform: base_dir / platform for platform in self.platforms}
+        for path in self.dirs.values():
+            (path / "data" / "raw").mkdir(parents=True)
+        self.runs = []
+
+    def check_platform_availability(self):
+        return {platform: {"available": True, "dir": str(path)} for platform, path in self.dirs.items()}
+
+    def run_multi_platform_analysis(self, platforms, meme, additional_args):
+        self.runs.append((meme, sorted(platforms), additional_args))
+        return {platform: True for platform in platforms}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(W, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def setup(tmp_path, clock):
+    analyzer = FakeAnalyzer(tmp_path)
+    watcher = W.RawDataWatcher(analyzer, window=10.0)
+    # run()과 같이 시작 시점의 파일은 이미 분석된 것으로 간주
+    for platform, raw_dir in watcher.raw_dirs.items():
+        watcher._snapshots[platform] = W._snapshot(raw_dir)
+    return analyzer, watcher
+
+
+def _write(analyzer, platform, name, data="x"):
+    (analyzer.dirs[platform] / "data" / "raw" / name).write_text(data)
+
+
+@pytest.mark.parametrize("platform, filename, meme", [
+    ("twitter", "twitter_chill_guy_20250101_120000.csv", "chill guy"),
+    ("instagram", "킹받네_instagram.jsonl", "킹받네"),
+    ("instagram", "킹받네_instagram.json", "킹받네"),
+    ("instagram", "킹받네_instagram.jsonl.tmp", None),
+    ("twitter", "notes.txt", None),
+])
+def test_meme_from_filename(platform, filename, meme):
+    assert W.meme_from_filename(platform, filename) == meme
+
+
+def test_burst_of_files_triggers_one_rerun_after_quiet_window(setup, clock):
+    analyzer, watcher = setup
+    _write(analyzer, "twitter", "twitter_chill_guy_20250101_120000.csv")
+    watcher.poll()
+    clock.now += 6
+    _write(analyzer, "twitter", "twitter_chill_guy_20250101_120500.csv")
+    _write(analyzer, "instagram", "chill guy_instagram.jsonl")
+    watcher.poll()
+
+    # 마지막 변경 후 window초가 지나기 전에는 실행하지 않음
+    clock.now += 6
+    assert watcher.ready() == {}
+
+    clock.now += 5
+    ready = watcher.ready()
+    assert {meme: sorted(platforms) for meme, platforms in ready.items()} == {"chill guy": ["instagram", "twitter"]}
+    assert watcher.ready() == {}
+
+
+def test_growing_file_postpones_rerun(setup, clock):
+    analyzer, watcher = setup
+    _write(analyzer, "instagram", "킹받네_instagram.jsonl", "a")
+    watcher.poll()
+    for size in range(2, 5):
+        clock.now += 8
+        _write(analyzer, "instagram", "킹받네_instagram.jsonl", "a" * size)
+        watcher.poll()
+        assert watcher.ready() == {}
+
+    clock.now += 10
+    watcher.poll()
+    assert watcher.ready() == {"킹받네": ["instagram"]}
+
+
+def test_existing_and_unknown_files_are_ignored(setup, clock):
+    analyzer, watcher = setup
+    _write(analyzer, "twitter", "readme.md")
+    _write(analyzer, "instagram", "킹받네_instagram.jsonl.part")
+    watcher.poll()
+    clock.now += 60
+    assert watcher.ready() == {}
+
+
+def test_rerun_skips_collection(setup):
+    analyzer, watcher = setup
+    watcher.rerun("킹받네", ["instagram"])
+    assert analyzer.runs == [("킹받네", ["instagram"], ["--skip-collection"])]
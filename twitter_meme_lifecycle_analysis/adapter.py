@@ -0,0 +1,62 @@
+"""
+Twitter 플랫폼 어댑터
+main.py가 하나의 프로세스 안에서 Twitter 파이프라인 단계를 직접 호출하기 위한 진입점
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import run_pipeline_twitter as pipeline
+from config.config import PROCESSED_DATA_DIR
+
+DEFAULT_STAGES = ['collect', 'preprocess', 'analyze', 'visualize']
+
+
+def warm_up():
+    """상주 분석 서비스용: 임베딩 모델과 시각화 라이브러리 미리 로딩"""
+    from src.preprocessors.selenium_twitter_preprocessor import get_embedder
+    import wordcloud
+    get_embedder()
+
+
+def collect(meme_name):
+    """Twitter 데이터 수집"""
+    if not pipeline.run_collection(meme_name):
+        raise RuntimeError(f"Twitter 수집 실패: {meme_name}")
+
+
+def preprocess(meme_name):
+    """최신 원시 데이터 전처리"""
+    processed = pipeline.run_preprocessing(meme_name)
+    if not processed:
+        raise RuntimeError(f"전처리할 Twitter 데이터가 없습니다: {meme_name}")
+    return processed
+
+
+def analyze(meme_name):
+    """수명 주기 분석 및 보고서 생성"""
+    return pipeline.run_analysis(pipeline.processed_filename_for(meme_name), meme_name)
+
+
+def visualize(meme_name):
+    """시각화 생성"""
+    return pipeline.run_visualization(pipeline.processed_filename_for(meme_name), meme_name)
+
+
+def posts(meme_name):
+    """통합 결과 저장소용 게시물 (공통 스키마 컬럼 이름으로 변환)"""
+    path = os.path.join(PROCESSED_DATA_DIR, pipeline.processed_filename_for(meme_name))
+    if not os.path.exists(path):
+        return None
+
+    df = pd.read_csv(path)
+    df = df.rename(columns={'retweets': 'shares'})
+    # 공통 참여 지표: 좋아요 + 리트윗 + 답글
+    df['engagement'] = df[['likes', 'shares', 'replies']].apply(pd.to_numeric, errors='coerce').sum(axis=1)
+    return df[['created_at', 'author', 'text', 'likes', 'shares', 'views', 'engagement']]
@@ -16,8 +16,11 @@ RAW_DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'raw')
 PROCESSED_DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'processed')
 
 # 결과물 경로
-FIGURES_DIR = os.path.join("results", "figures")
-REPORTS_DIR = os.path.join("results", "reports")
+FIGURES_DIR = os.path.join(PROJECT_ROOT, 'results', 'figures')
+REPORTS_DIR = os.path.join(PROJECT_ROOT, 'results', 'reports')
+
+# 로그인 쿠키 경로
+COOKIE_PATH = os.path.join(PROJECT_ROOT, 'config', 'twitter_cookies.pkl')
 
 # 밈 목록
 TARGET_MEMES = [
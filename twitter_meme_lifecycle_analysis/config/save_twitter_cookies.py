@@ -6,8 +6,8 @@ import time
 import pickle
 import os
 
-# 저장할 경로
-COOKIE_PATH = "config/twitter_cookies.pkl"
+# 저장할 경로 (실행 위치와 무관하게 config 폴더에 저장)
+COOKIE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "twitter_cookies.pkl")
 
 options = Options()
 options.add_experimental_option("detach", True)  # 창 자동 종료 막기
@@ -23,7 +23,7 @@ time.sleep(30)
 
 # 쿠키 저장
 cookies = driver.get_cookies()
-with open("config/twitter_cookies.pkl", "wb") as f:
+with open(COOKIE_PATH, "wb") as f:
     pickle.dump(driver.get_cookies(), f)
 print(f"✅ 쿠키 저장 완료: {COOKIE_PATH}")
 driver.quit()
@@ -1,4 +1,5 @@
 import argparse
+import inspect
 import sys
 import time
 import glob
@@ -10,7 +11,33 @@ from src.collectors.selenium_twitter_collector import SeleniumTwitterCollector
 from src.preprocessors.selenium_twitter_preprocessor import SeleniumTwitterPreprocessor
 from src.visualizers.selenium_twitter_visualizer import SeleniumTwitterVisualizer
 from src.analyzers.selenium_twitter_lifecycle_analyzer import SeleniumTwitterLifecycleAnalyzer
-from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, FIGURES_DIR
+from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, FIGURES_DIR, REPORTS_DIR
+
+# 통합 프로젝트 공용 모듈 (단계별 성능 추적)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from orchestration import trace
+from orchestration.stage_cache import StageCache
+
+# 입력 파일/코드가 바뀌지 않은 단계는 이전 결과물을 복원하고 건너뜀
+stage_cache = StageCache()
+
+# (시각화 메서드, 저장 파일명)
+FIGURES = [
+    ('plot_daily_post_trend', 'daily_post_trend.png'),
+    ('plot_engagement_distribution', 'engagement_distribution.png'),
+    ('plot_heatmap_by_day_hour', 'heatmap_day_hour.png'),
+    ('plot_wordcloud', 'wordcloud.png'),
+    ('plot_top_hashtags', 'top_hashtags.png'),
+    ('plot_likes_vs_views', 'likes_vs_views.png'),
+    ('plot_likes_vs_retweets', 'likes_vs_retweets.png'),
+    ('plot_likes_views_trend', 'likes_views_trend.png'),
+    ('plot_retweet_trend', 'retweet_trend.png'),
+    ('plot_like_rate_distribution', 'like_rate_distribution.png'),
+    ('plot_survival_curve', 'survival_curve.png'),
+]
+
+def processed_filename_for(meme_name):
+    return f"processed_twitter_{meme_name.replace(' ', '_').lower()}.csv"
 
 def run_collection(meme_name):
     print(f"\n{'='*50}")
@@ -18,18 +45,23 @@ def run_collection(meme_name):
     print(f"{'='*50}")
 
     try:
-        collector = SeleniumTwitterCollector(save_dir=RAW_DATA_DIR)
-        posts = collector.search_posts(meme_name, max_posts=1000)
-
-        if not posts:
-            print("⚠ 게시물 수집 실패 또는 0건")
-            return
-
-        collector.save_posts(posts, meme_name.replace(" ", "_"))
-        collector.close()
+        with trace.stage("collection", platform="twitter", meme=meme_name) as t:
+            collector = SeleniumTwitterCollector(save_dir=RAW_DATA_DIR)
+            posts = collector.search_posts(meme_name, max_posts=1000)
+            t.set(rows_out=len(posts))
+
+            if not posts:
+                print("⚠ 게시물 수집 실패 또는 0건")
+                return False
+
+            saved_path = collector.save_posts(posts, meme_name.replace(" ", "_"))
+            t.output(saved_path)
+            collector.close()
         print("✓ 수집 완료!")
+        return True
     except Exception as e:
         print(f"Twitter 수집 실패: {e}")
+        return False
 
 def run_preprocessing(meme_name):
     print(f"\n{'='*50}")
@@ -43,17 +75,35 @@ def run_preprocessing(meme_name):
         return None
 
     latest_file = max(files, key=os.path.getctime)
-    df_raw = pd.read_csv(latest_file)
-
-    if df_raw.empty:
-        print("⚠ CSV 파일이 비어 있음. 전처리 중단.")
+    processed_filename = processed_filename_for(meme_name)
+    processed_path = os.path.join(PROCESSED_DATA_DIR, processed_filename)
+
+    def preprocess():
+        with trace.stage("preprocessing", platform="twitter", meme=meme_name) as t:
+            df_raw = pd.read_csv(latest_file)
+            t.set(rows_in=len(df_raw))
+
+            if df_raw.empty:
+                print("⚠ CSV 파일이 비어 있음. 전처리 중단.")
+                return None
+
+            preprocessor = SeleniumTwitterPreprocessor()
+            df_processed = preprocessor.preprocess(df_raw)
+
+            df_processed.to_csv(processed_path, index=False)
+            t.set(rows_out=len(df_processed))
+            t.output(processed_path)
+        return processed_filename
+
+    result, cached = stage_cache.run(
+        "preprocessing", preprocess,
+        inputs=[latest_file], outputs=[processed_path],
+        params={'meme': meme_name},
+        code=[inspect.getfile(SeleniumTwitterPreprocessor), __file__],
+        platform="twitter", meme=meme_name
+    )
+    if not cached and result is None:
         return None
-
-    preprocessor = SeleniumTwitterPreprocessor()
-    df_processed = preprocessor.preprocess(df_raw)
-
-    processed_filename = f"processed_twitter_{meme_name.replace(' ', '_').lower()}.csv"
-    df_processed.to_csv(os.path.join(PROCESSED_DATA_DIR, processed_filename), index=False)
     print(f"✓ 전처리 완료: {processed_filename}")
 
     return processed_filename
@@ -63,11 +113,24 @@ def run_visualization(processed_filename, meme_name):
     print(f"3단계: 시각화 생성")
     print(f"{'='*50}")
 
+    filepath = os.path.join(PROCESSED_DATA_DIR, processed_filename)
+    stage_cache.run(
+        "visualization", lambda: _visualize(filepath, meme_name),
+        inputs=[filepath],
+        outputs=[os.path.join(FIGURES_DIR, filename) for _, filename in FIGURES],
+        params={'meme': meme_name, 'figures': FIGURES},
+        code=[inspect.getfile(SeleniumTwitterVisualizer), __file__],
+        platform="twitter", meme=meme_name
+    )
+
+    print("✓ 시각화 완료!")
+    return True
+
+def _visualize(filepath, meme_name):
     #시각화 클래스 초기화
     visualizer = SeleniumTwitterVisualizer(output_dir=FIGURES_DIR)
 
     #전처리된 파일 로드
-    filepath = os.path.join(PROCESSED_DATA_DIR, processed_filename)
     df = pd.read_csv(filepath)
 
     # datetime 컬럼 정리 
@@ -80,38 +143,63 @@ def run_visualization(processed_filename, meme_name):
     df['day_abbr'] = df['created_at'].dt.day_name().str[:3].str.upper()
     df['like_rate'] = df['likes'] / (df['views'] + 1e-6)  # 분모 0 방지용
 
-    # 시각화 함수 실행
-    visualizer.plot_daily_post_trend(df)
-    visualizer.plot_engagement_distribution(df)
-    visualizer.plot_heatmap_by_day_hour(df)
-    visualizer.plot_wordcloud(df)
-    visualizer.plot_top_hashtags(df)
-    visualizer.plot_likes_vs_views(df)
-    visualizer.plot_likes_vs_retweets(df)
-    visualizer.plot_likes_views_trend(df)
-    visualizer.plot_retweet_trend(df)
-    visualizer.plot_like_rate_distribution(df)
-    visualizer.plot_survival_curve(df)
-
-    print("✓ 시각화 완료!")
+    # 그림 파일명은 밈과 무관하게 고정이므로 이전 밈의 그림을 먼저 지움
+    # (데이터가 없어 건너뛴 그림이 이전 밈의 파일로 남지 않도록 → 그런 실행은 결과물이 모자라 캐시에 저장되지 않음)
+    for _, filename in FIGURES:
+        path = os.path.join(FIGURES_DIR, filename)
+        if os.path.exists(path):
+            os.remove(path)
+
+    # 시각화 함수 실행 (그림별 추적)
+    with trace.stage("visualization", platform="twitter", meme=meme_name, rows_in=len(df)):
+        for method_name, filename in FIGURES:
+            with trace.stage(f"figure:{filename[:-4]}", rows_in=len(df)) as t:
+                getattr(visualizer, method_name)(df)
+                path = os.path.join(FIGURES_DIR, filename)
+                if os.path.exists(path):
+                    t.output(path)
+    return True
 
 def run_analysis(processed_filename, meme_name):
     print(f"\n{'='*50}")
     print(f"4단계: 수명 주기 분석")
     print(f"{'='*50}")
 
-    df = pd.read_csv(os.path.join(PROCESSED_DATA_DIR, processed_filename))
-    df['date'] = pd.to_datetime(df['date'])
-
-    analyzer = SeleniumTwitterLifecycleAnalyzer(save_dir=os.path.join("results", "reports"))
-    metrics, growth, decline = analyzer.analyze(df, meme_name)
-    analyzer.generate_text_report(meme_name, metrics, growth, decline)
+    filepath = os.path.join(PROCESSED_DATA_DIR, processed_filename)
+    expected_report_path = os.path.join(REPORTS_DIR, f'{meme_name}_report.txt')
+
+    def analyze():
+        with trace.stage("analysis:lifecycle", platform="twitter", meme=meme_name) as t:
+            df = pd.read_csv(filepath)
+            df['date'] = pd.to_datetime(df['date'])
+            t.set(rows_in=len(df))
+
+            analyzer = SeleniumTwitterLifecycleAnalyzer(save_dir=REPORTS_DIR)
+            metrics, growth, decline = analyzer.analyze(df, meme_name)
+            report_path = analyzer.generate_text_report(meme_name, metrics, growth, decline)
+            t.set(rows_out=metrics.get('total_posts'))
+            if report_path:
+                t.output(report_path)
+        return report_path
+
+    report_path, cached = stage_cache.run(
+        "analysis:lifecycle", analyze,
+        inputs=[filepath], outputs=[expected_report_path],
+        params={'meme': meme_name},
+        code=[inspect.getfile(SeleniumTwitterLifecycleAnalyzer), __file__],
+        platform="twitter", meme=meme_name
+    )
+    if cached:
+        report_path = expected_report_path
     print("✓ 분석 및 보고서 생성 완료")
+    return report_path
 
 def main():
     parser = argparse.ArgumentParser(description="Twitter 밈 수명 주기 분석 파이프라인")
     parser.add_argument('--meme', type=str, default='chill guy', help='분석할 밈 이름')
     parser.add_argument('--skip-collection', action='store_true', help='수집 단계 생략')
+    parser.add_argument('--skip-visualization', action='store_true', help='시각화 단계 생략')
+    parser.add_argument('--skip-analysis', action='store_true', help='분석 단계 생략')
     args = parser.parse_args()
 
     meme_name = args.meme
@@ -129,9 +217,11 @@ def main():
         processed = run_preprocessing(meme_name)
         if processed:
             time.sleep(1)
-            run_visualization(processed, meme_name)
-            time.sleep(1)
-            run_analysis(processed, meme_name)
+            if not args.skip_visualization:
+                run_visualization(processed, meme_name)
+                time.sleep(1)
+            if not args.skip_analysis:
+                run_analysis(processed, meme_name)
 
         print(f"\n{'='*60}")
         print("파이프라인 종료")
@@ -1,4 +1,5 @@
 import os
+import sys
 import csv
 import time
 import re
@@ -11,6 +12,17 @@ from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# 작업 디렉토리와 무관하게 config 경로를 찾도록 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+sys.path.append(os.path.dirname(PROJECT_ROOT))
+from config.config import COOKIE_PATH
+from orchestration.ratelimit import RateLimiter
+
+# 새 트윗이 로딩되어 페이지 높이가 바뀔 때까지 기다리는 최대 시간(초)
+SCROLL_LOAD_TIMEOUT = 10
 
 class SeleniumTwitterCollector:
     def __init__(self, save_dir, show_browser=True):
@@ -40,18 +52,20 @@ class SeleniumTwitterCollector:
         # 크롬 드라이버 실행
         self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # 요청 간격은 고정 대기 대신 모든 수집 프로세스가 공유하는 토큰 버킷으로 제어
+        self.limiter = RateLimiter('twitter')
         print("🌐 브라우저 초기화 및 실행 완료")
 
     def load_cookies(self):
         # 쿠키 파일을 로드하여 자동 로그인 수행
         import pickle
-        cookie_path = os.path.join("config", "twitter_cookies.pkl")
+        cookie_path = COOKIE_PATH
         if not os.path.exists(cookie_path):
             raise FileNotFoundError("❌ 쿠키 파일이 없습니다. 먼저 save_twitter_cookies.py로 로그인 후 쿠키 저장하세요.")
 
         print("🍪 트위터 접속 중...")
+        self.limiter.acquire()
         self.driver.get("https://twitter.com")
-        time.sleep(2)
 
         print("🔑 쿠키 로딩 중...")
         with open(cookie_path, "rb") as f:
@@ -60,8 +74,8 @@ class SeleniumTwitterCollector:
                 self.driver.add_cookie(cookie)
 
         print("🔄 페이지 새로고침 중...")
+        self.limiter.acquire()
         self.driver.refresh()
-        time.sleep(3)
         print("✅ 로그인 완료!")
 
     def extract_engagement_counts(self, card):
@@ -88,8 +102,8 @@ class SeleniumTwitterCollector:
     def search_posts(self, keyword, max_posts=1000):
         print(f"🔍 '{keyword}' 검색 시작...")
         self.load_cookies()
+        self.limiter.acquire()
         self.driver.get(f"https://twitter.com/search?q={keyword}&src=typed_query&f=top")
-        time.sleep(3)
 
         try:
             WebDriverWait(self.driver, 15).until(
@@ -158,15 +172,23 @@ class SeleniumTwitterCollector:
                     continue
 
             print(f"✅ 이번 스크롤에서 {new_count}개 수집됨")
+            # 스크롤 = 추가 로딩 요청이므로 예산 안에서만 진행
+            self.limiter.acquire()
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            try:
+                WebDriverWait(self.driver, SCROLL_LOAD_TIMEOUT).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight") != last_height
+                )
+            except TimeoutException:
+                print("📍 더 이상 로딩되는 트윗이 없습니다.")
                 break
+            new_height = self.driver.execute_script("return document.body.scrollHeight")
             last_height = new_height
             scroll_count += 1
 
         print(f"🎉 총 {len(posts)}개 트윗 수집 완료")
+        stats = self.limiter.stats()
+        print(f"⏱️  요청 {stats['acquired']}회, 속도 제한 대기 {stats['total_wait']}초")
         return posts
 
     def save_posts(self, posts, meme_name):
@@ -181,6 +203,7 @@ class SeleniumTwitterCollector:
             writer.writeheader()
             writer.writerows(posts)
         print(f"✅ 저장 완료: {filepath}")
+        return filepath
 
     def close(self):
         print("🔚 브라우저를 종료합니다...")
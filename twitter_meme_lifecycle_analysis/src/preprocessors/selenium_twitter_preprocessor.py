@@ -6,18 +6,37 @@ from datetime import datetime
 import sys
 from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
-from sentence_transformers import SentenceTransformer
 
 # ✅ 경로 설정 (상위 디렉토리에서 config 불러오기 위해 sys.path 추가)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR
+from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, PROJECT_ROOT
+sys.path.append(os.path.dirname(PROJECT_ROOT))
+from orchestration.governor import apply_thread_limits
+
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# ✅ 문장 임베딩 모델은 프로세스당 한 번만 로딩 (상주 분석 서비스에서 재사용)
+_embedder = None
+
+def get_embedder():
+    global _embedder
+    if _embedder is None:
+        from sentence_transformers import SentenceTransformer
+        # ✅ 동시 실행 시 오케스트레이터가 나눠준 스레드 수만 사용 (torch, BLAS)
+        apply_thread_limits()
+        print(f"🧠 임베딩 모델 로딩: {EMBEDDING_MODEL_NAME}")
+        _embedder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    return _embedder
 
 class SeleniumTwitterPreprocessor:
     def __init__(self):
-        # ✅ 디렉토리 경로 설정 및 문장 임베딩 모델 로딩
+        # ✅ 디렉토리 경로 설정 (임베딩 모델은 클러스터링 시점에 로딩)
         self.raw_data_dir = RAW_DATA_DIR
         self.processed_data_dir = PROCESSED_DATA_DIR
-        self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
+
+    @property
+    def embedder(self):
+        return get_embedder()
 
     def load_twitter_data(self, filename):
         # ✅ 원시 트위터 데이터 CSV 로드
@@ -4,7 +4,6 @@
 """
 
 import argparse
-import time
 from datetime import datetime
 import sys
 import os
@@ -20,16 +19,20 @@ from config.config import TARGET_MEMES, RAW_DATA_DIR
 def collect_twitter_data(meme_name):
     """Twitter에서 밈 데이터 수집"""
     print(f"\n=== Twitter에서 '{meme_name}' 데이터 수집 시작 ===")
+    collector = None
     try:
         collector = SeleniumTwitterCollector(save_dir=RAW_DATA_DIR)
         posts = collector.search_posts(meme_name, max_posts=1000)
         collector.save_posts(posts, meme_name.replace(" ", "_"))
-        collector.close()
         print(f"✓ {len(posts)}개의 트윗 수집 완료")
         return True
     except Exception as e:
         print(f"✗ Twitter 수집 실패: {e}")
         return False
+    finally:
+        # 실패해도 브라우저는 종료 (무인 배치에서 남지 않도록)
+        if collector is not None:
+            collector.close()
 
 def main():
     parser = argparse.ArgumentParser(description='Twitter 밈 데이터 수집 전용 실행기')
@@ -50,13 +53,19 @@ def main():
     print(f"수집 대상: {', '.join(memes_to_collect)}")
     print(f"시작 시간: {datetime.now()}\n")
 
+    failed = []
     for meme in memes_to_collect:
         print(f"{'='*40}\n수집: {meme}\n{'='*40}")
-        collect_twitter_data(meme)
-        time.sleep(3)
+        # 밈 사이 대기는 수집기의 공유 속도 제한이 담당
+        if not collect_twitter_data(meme):
+            failed.append(meme)
 
-    print(f"\n=== 수집 완료 ===")
+    print(f"\n=== 수집 완료 ({len(memes_to_collect) - len(failed)}/{len(memes_to_collect)} 성공) ===")
+    if failed:
+        print(f"실패: {', '.join(failed)}")
     print(f"종료 시간: {datetime.now()}")
+    return not failed
 
 if __name__ == "__main__":
-    main()
+    # 배치 작업이 실패를 알 수 있도록 수집에 실패한 밈이 있으면 종료 코드 1
+    sys.exit(0 if main() else 1)